@@ -0,0 +1,132 @@
+""" Benchmarks do próprio gerador: cold start da CLI, ProjectBuilder, TestBuilder e renderização de templates.
+
+    python -m benchmarks.bench_generator                      # compara com benchmarks/baseline.json
+    python -m benchmarks.bench_generator --update-baseline    # grava um novo baseline
+    python -m benchmarks.bench_generator --threshold 0.5 --sizes 1 --sizes 10
+"""
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+import typer
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+BASELINE_FILE = Path(__file__).resolve().parent / "baseline.json"
+RESULTS_FILE = Path(__file__).resolve().parent / "results.json"
+DEFAULT_SIZES = [1, 10, 100, 500]
+
+
+def make_spec(modules: int):
+    """ Spec com `modules` módulos no total: o módulo users gerado por padrão conta como o primeiro. """
+    from fast_api_accelerate.utils.spec import parse_spec
+
+    entities = [{"name": f"entity{i}", "fields": {"title": {"type": "str", "length": 120, "index": True}, "amount": "decimal", "created_at": "datetime"},
+                 "relations": [{"name": "owner", "target": f"entity{i - 1}" if i else "user"}]} for i in range(modules - 1)]
+    return parse_spec({"entities": entities})
+
+
+def measure(func: Callable[[Any], None], repeat: int, setup: Callable[[], Any] = lambda: None) -> float:
+    """ Melhor tempo, em segundos, de `repeat` execuções. `setup` prepara cada execução fora da medição. """
+    samples = []
+    for _ in range(repeat):
+        prepared = setup()
+        start = time.perf_counter()
+        func(prepared)
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def bench_cli_cold_start(_=None):
+    subprocess.run([sys.executable, "-m", "fast_api_accelerate.main", "--help"], cwd=ROOT_DIR, capture_output=True, check=True)
+
+
+def project_builder(workdir: Path, modules: int) -> Callable[[], Any]:
+    from fast_api_accelerate.builders.project_builder import ProjectBuilder
+    from fast_api_accelerate.utils.file_system import InstallMode
+
+    spec = make_spec(modules)
+
+    def setup():
+        builder = ProjectBuilder(Path(tempfile.mkdtemp(dir=workdir)), "bench", install_mode=InstallMode.NONE, spec=spec)
+        builder.fs.verbose = False
+        return builder
+    return setup
+
+
+def test_builder(workdir: Path) -> Callable[[], Any]:
+    from fast_api_accelerate.builders.test_builder import TestBuilder
+
+    def setup():
+        project = Path(tempfile.mkdtemp(dir=workdir))
+        (project / "pyproject.toml").write_text("[project]\n", encoding="utf-8")
+        builder = TestBuilder(project)
+        builder.fs.verbose = False
+        return builder
+    return setup
+
+
+def bench_render(builder):
+    """ Só o planejamento (renderização dos templates para o manifesto), sem tocar no disco. """
+    builder.build()
+
+
+def bench_builder_run(builder):
+    """ Ciclo completo do builder com a instalação de dependências desligada. """
+    builder.run()
+
+
+def run_benchmarks(sizes: List[int], repeat: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp, mock.patch("fast_api_accelerate.utils.file_system.FileSystem.start_install"):
+        workdir = Path(tmp)
+        results = {"cli_cold_start": measure(bench_cli_cold_start, repeat), "test_builder_run": measure(bench_builder_run, repeat, test_builder(workdir))}
+        for modules in sizes:
+            results[f"render[{modules}]"] = measure(bench_render, repeat, project_builder(workdir, modules))
+            results[f"project_build[{modules}]"] = measure(bench_builder_run, repeat, project_builder(workdir, modules))
+    return results
+
+
+def find_regressions(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> Dict[str, float]:
+    """ Métricas mais lentas que baseline * (1 + threshold), com a variação relativa. """
+    regressions = {}
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        if reference and seconds > reference * (1 + threshold):
+            regressions[name] = seconds / reference - 1
+    return regressions
+
+
+def main(
+    sizes: Optional[List[int]] = typer.Option(None, "--sizes", help="Module counts to benchmark (default: 1 10 100 500)"),
+    repeat: int = typer.Option(5, "--repeat", help="Runs per metric; the best one is reported"),
+    threshold: float = typer.Option(0.25, "--threshold", help="Allowed slowdown over the baseline (0.25 = 25%)"),
+    update_baseline: bool = typer.Option(False, "--update-baseline", help="Store these results as the new baseline"),
+):
+    """Benchmark the generator and fail on regressions against the stored baseline."""
+    results = run_benchmarks(sizes or DEFAULT_SIZES, repeat)
+    RESULTS_FILE.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    baseline = json.loads(BASELINE_FILE.read_text(encoding="utf-8")) if BASELINE_FILE.exists() else {}
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        delta = f"{(seconds / reference - 1) * 100:+.1f}%" if reference else "new"
+        typer.echo(f"{name:<24} {seconds * 1000:>10.2f} ms  {delta}")
+
+    if update_baseline:
+        BASELINE_FILE.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        typer.secho(f"✓ Baseline updated: {BASELINE_FILE}", fg=typer.colors.GREEN)
+        return
+
+    regressions = find_regressions(results, baseline, threshold)
+    if regressions:
+        for name, delta in regressions.items():
+            typer.secho(f"x {name} regressed {delta * 100:.1f}% (threshold {threshold * 100:.0f}%)", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    typer.secho("✓ No regressions", fg=typer.colors.GREEN)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -1,15 +1,33 @@
 from abc import ABC, abstractmethod
+from functools import wraps
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from fast_api_accelerate.utils.file_system import FileSystem
+from fast_api_accelerate.utils.lockfile import LockFile
+from fast_api_accelerate.utils.manifest import BuildManifest, WriteReport
+from fast_api_accelerate.utils.profiler import BuildProfiler
+from fast_api_accelerate.utils.template_engine import TemplateEngine, template_engine
 
 
 class BaseBuilder(ABC):
-    """ Base class for all CLI builders. Defines standard contract and common utilities. """
+    """ Base class for all CLI builders. Defines standard contract and common utilities.
+        `build()` only plans directories and files into `self.manifest`; `apply()` writes the plan in one pass.
+        With a `self.lock`, re-running a builder only rewrites generated files whose content changed, and a builder
+        whose `inputs()` match the ones recorded by its last run skips rendering altogether.
+        With a `self.profiler`, every step of `run()` and every `_create_*`/`_configure_*` method is timed.
+    """
+    PROFILED_PREFIXES = ("_create_", "_configure_")
 
     def __init__(self, base_path: Path):
         self.base_path = base_path
-        self.fs = None
+        self.fs = FileSystem(base_path)
+        self.manifest = BuildManifest()
+        self.lock: Optional[LockFile] = None
+        self.report = WriteReport()
+        self.profiler: Optional[BuildProfiler] = None
+        self.templates: TemplateEngine = template_engine
+        self.context: Dict[str, str] = {}
+        self._instrumented = False
 
     def validate_path(self):
         """ Ensures that the base directory exists. """
@@ -17,25 +35,63 @@ class BaseBuilder(ABC):
             raise FileNotFoundError(f"Base path '{self.base_path}' does not exist.")
 
     def ensure_structure(self, folders: List[Path]):
-        """ Creates multiple folders. """
+        """ Plans multiple folders. """
         for folder in folders:
-            self.fs.create_dir(folder)
+            self.manifest.add_dir(folder)
 
     def create_file(self, path: Path, content: str):
-        """ Wrapper for creating a file. """
-        self.fs.create_file(path, content)
+        """ Plans the creation of a file. """
+        self.manifest.add_file(path, content)
+        if self.profiler:
+            self.profiler.add_files(1, len(content.encode("utf-8")))
     
+    def render_files(self, files: Dict[Path, str | Path]):
+        """ Cria um lote de arquivos. Strings já vêm renderizadas pelos wrappers e são gravadas como estão;
+            só fontes `Path` passam pelo cache compartilhado de templates, com `self.context`.
+        """
+        sources = {path: source for path, source in files.items() if isinstance(source, Path)}
+        rendered = self.templates.render_many(self.context, sources) if sources else {}
+        for path, content in files.items():
+            self.create_file(path, rendered.get(path, content))
+
     def update_file(self, path: Path, content: str):
-        """ Wrapper for update a file. """
-        self.fs.update_file(path, content)
+        """ Replaces a planned file; files that are not part of the plan are updated on disk. """
+        if not self.manifest.update_file(path, content):
+            self.fs.update_file(path, content)
 
     def append_file(self, path: Path, content: str):
-        """ Wrapper for appending content. """
-        self.fs.append_to_file(path, content)
+        """ Plans appending content, applied after the files are written. """
+        self.manifest.append(path, content)
+
+    def apply(self) -> WriteReport:
+        """ Writes the planned manifest in a single pass and clears it. """
+        self.report = self.fs.write_manifest(self.manifest, lock=self.lock)
+        self.manifest.clear()
+        return self.report
+
+    def wait_subprocess(self, name: str, wait):
+        """ Blocks on an external process, accounting the time as subprocess time when profiling. """
+        if not self.profiler:
+            return wait()
+        with self.profiler.subprocess(name):
+            return wait()
 
     def install_dependencies(self):
         """ Install dependencies in the project. """
-        self.fs.install_dependencies()
+        self.wait_subprocess("uv sync", self.fs.install_dependencies)
+
+    def inputs(self) -> Optional[str]:
+        """ Hash of everything the generated files depend on, or None to always build. Can be overridden. """
+        return None
+
+    def _is_current(self) -> bool:
+        inputs = self.inputs() if self.lock else None
+        return inputs is not None and self.lock.is_current(type(self).__name__, inputs)
+
+    def _record_inputs(self):
+        inputs = self.inputs() if self.lock else None
+        if inputs is not None:
+            self.lock.record_inputs(type(self).__name__, inputs)
 
     @abstractmethod
     def build(self):
@@ -50,9 +106,48 @@ class BaseBuilder(ABC):
         """ Hook executed after build. Can be overridden. """
         pass
 
+    def _step(self, name: str, func):
+        if not self.profiler:
+            return func()
+        with self.profiler.step(name):
+            return func()
+
+    def _profiled(self, name: str, method):
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            if not self.profiler:
+                return method(*args, **kwargs)
+            with self.profiler.step(name):
+                return method(*args, **kwargs)
+        return wrapper
+
+    def _instrument(self):
+        """ Wraps the builder's private `_create_*`/`_configure_*` methods in profiler steps, once per instance:
+            the wrappers read `self.profiler` on each call, so later runs reuse them instead of nesting new ones.
+        """
+        if self._instrumented:
+            return
+        self._instrumented = True
+        for name in dir(type(self)):
+            if name.startswith(self.PROFILED_PREFIXES) and callable(getattr(type(self), name)):
+                setattr(self, name, self._profiled(name, getattr(self, name)))
+
+    def _apply_and_count(self):
+        report = self.apply()
+        if self.profiler:
+            self.profiler.add_files(report.written, report.bytes_written)
+        return report
+
     def run(self):
         """ Standard method that executes a complete cycle. Should not be overridden. """
-        self.validate_path()
-        self.before_build()
-        self.build()
-        self.after_build()
\ No newline at end of file
+        if self.profiler:
+            self._instrument()
+        self._step("validate_path", self.validate_path)
+        if self._step("check_inputs", self._is_current):
+            self.report = WriteReport()
+            return
+        self._step("before_build", self.before_build)
+        self._step("build", self.build)
+        self._step("apply", self._apply_and_count)
+        self._step("record_inputs", self._record_inputs)
+        self._step("after_build", self.after_build)
@@ -1,23 +1,40 @@
 from pathlib import Path
+from subprocess import Popen
+from typing import Optional
 from .base import BaseBuilder
-from ..templates.projects import config_database_template, setup_db_template, readme_template, main_project_template, pyproject_template, base_repository_template, base_service_template, all_models_template, config_conection_template, config_container_ioc_template, startup_template 
-from ..templates.modules import client_type_template, auth_service_template, auth_controller_template, user_model_template
+from ..templates.projects import config_database_template, setup_db_template, readme_template, main_project_template, pyproject_template, base_repository_template, base_service_template, pagination_template, streaming_template, loading_template, query_counter_template, cache_template, routing_template, serialization_template, uploads_template, http_cache_template, metrics_template, all_models_template, config_conection_template, config_container_ioc_template, startup_template 
+from ..templates.modules import client_type_template, auth_service_template, passwords_template, tokens_template, revocation_template, rate_limit_template, auth_controller_template, files_controller_template, user_model_template, entity_model_template, entity_repository_template, entity_service_template, entity_dtos_template, entity_controller_template
 from ..templates.schemas import  init_dtos_template
-from ..utils.file_system import FileSystem
+from ..templates.benchmarks import password_hashing_benchmark_template, serialization_benchmark_template
+from ..utils.file_system import FileSystem, InstallMode, INSTALL_LOG_FILE
+from ..utils.lockfile import LockFile, content_hash, source_fingerprint
+from ..utils.manifest import WriteReport
+from ..utils.pool import PoolProfile
+from ..utils.spec import EntitySpec, ProjectSpec
 
 class ProjectBuilder(BaseBuilder):
     """Builder principal responsável por criar a aplicação base completa: FastAPI, core, base, modules, database e auth."""
     FILE_INIT:str = "__init__.py"
     FILE_DATABASE:str = "database.py"
 
-    def __init__(self, base_path: Path, project_name: str, with_database: bool = True, with_auth: bool = True):
+    def __init__(self, base_path: Path, project_name: str, with_database: bool = True, with_auth: bool = True, install_mode: InstallMode = InstallMode.FOREGROUND, cache_dir: Optional[Path] = None, seed_lock: Optional[Path] = None, spec: Optional[ProjectSpec] = None, pool_profile: PoolProfile = PoolProfile.LATENCY):
         super().__init__(base_path)
         self.project_name = project_name
         self.project_path = (self.base_path / project_name).resolve()
         self.fs = FileSystem(self.project_path)
+        self.lock = LockFile(self.project_path)
+        self.context = {"project_name": project_name}
 
         self.with_database = with_database
         self.with_auth = with_auth
+        self.spec = spec or ProjectSpec()
+        self.pool_profile = pool_profile
+
+        # Instalação de dependências: roda em paralelo com a escrita dos arquivos
+        self.install_mode = install_mode
+        self.cache_dir = cache_dir
+        self.seed_lock = seed_lock
+        self.install_process: Optional[Popen] = None
 
         # Paths principais
         self.src_path = self.project_path / "src"
@@ -26,6 +43,12 @@ class ProjectBuilder(BaseBuilder):
         self.models_path = self.src_path / "models"
         self.modules_path = self.src_path / "modules"
 
+    def inputs(self) -> str:
+        """ Templates e código do gerador, opções da CLI, spec e uv.lock semente: o que decide o conteúdo gerado. """
+        seed = content_hash(self.seed_lock.read_bytes()) if self.seed_lock else None
+        options = (self.lock.template_version, self.project_name, self.with_database, self.with_auth, self.pool_profile.value, seed, repr(self.spec))
+        return content_hash(source_fingerprint() + repr(options))
+
     def _create_project_root(self):
         self.ensure_structure([self.project_path])
 
@@ -36,11 +59,16 @@ class ProjectBuilder(BaseBuilder):
             self.create_file(folder / self.FILE_INIT, "")
 
     def _create_main_file(self):
-        self.create_file(self.src_path.parent / "main.py",main_project_template(name=self.project_name))
+        self.create_file(self.src_path.parent / "main.py",main_project_template(name=self.project_name, entities=self.spec.entities))
 
     def _create_pyproject(self):
         self.create_file(self.project_path / "pyproject.toml",pyproject_template(name=self.project_name))
 
+    def _create_seed_lock(self):
+        """ Copia um uv.lock pré-resolvido para o projeto: o `uv sync` instala sem resolver do zero. """
+        if self.seed_lock:
+            self.create_file(self.project_path / "uv.lock", self.seed_lock.read_text(encoding="utf-8"))
+
     def _create_readme(self):
         self.create_file(self.project_path / "README.md", readme_template(name=self.project_name))
 
@@ -49,33 +77,41 @@ class ProjectBuilder(BaseBuilder):
             self.create_file(self.project_path / "setup_db.py", setup_db_template())
 
     def _create_core_files(self):
-        files = ["configs.py", "container_ioc.py", self.FILE_DATABASE, "startup.py", self.FILE_INIT]
-        for f in files:
-            self.create_file(self.core_path / f, "")
+        self.create_file(self.core_path / self.FILE_INIT, "")
 
     def _configure_database(self):
-        db_file = self.core_path / self.FILE_DATABASE
-        self.update_file(db_file, config_database_template())
+        self.create_file(self.core_path / self.FILE_DATABASE, config_database_template())
 
     def _create_config_conection(self):
-        config_file = self.core_path / "configs.py"
-        self.update_file(config_file, config_conection_template())
+        self.create_file(self.core_path / "configs.py", config_conection_template(self.pool_profile))
     
     def _create_container_ioc_conection(self):
-        container_ioc_file = self.core_path / "container_ioc.py"
-        self.update_file(container_ioc_file, config_container_ioc_template())
+        self.create_file(self.core_path / "container_ioc.py", config_container_ioc_template(entities=self.spec.entities))
 
     def _create_startup_app(self):
-        startup_file = self.core_path / "startup.py"
-        self.update_file(startup_file, startup_template())
+        self.create_file(self.core_path / "startup.py", startup_template())
 
     def _create_base_files(self):
-        self.create_file(self.base_path_pkg / "base_repository.py", base_repository_template())
-        self.create_file(self.base_path_pkg / "base_service.py", base_service_template())
+        self.render_files({
+            self.base_path_pkg / "base_repository.py": base_repository_template(),
+            self.base_path_pkg / "base_service.py": base_service_template(),
+            self.base_path_pkg / "pagination.py": pagination_template(),
+            self.base_path_pkg / "streaming.py": streaming_template(),
+            self.base_path_pkg / "loading.py": loading_template(),
+            self.base_path_pkg / "query_counter.py": query_counter_template(),
+            self.base_path_pkg / "routing.py": routing_template(),
+            self.base_path_pkg / "cache.py": cache_template(),
+            self.base_path_pkg / "serialization.py": serialization_template(),
+            self.base_path_pkg / "uploads.py": uploads_template(),
+            self.base_path_pkg / "http_cache.py": http_cache_template(),
+            self.base_path_pkg / "metrics.py": metrics_template(),
+        })
 
     def _create_models(self):
-        self.create_file(self.models_path / "__all_models.py", all_models_template())
-        self.create_file(self.models_path / "user.py", user_model_template())
+        self.render_files({
+            self.models_path / "__all_models.py": all_models_template(self.spec.entities),
+            self.models_path / "user.py": user_model_template(self.spec),
+        })
 
     def _create_users_module(self):
         module_path = self.modules_path / "users"
@@ -94,47 +130,71 @@ class ProjectBuilder(BaseBuilder):
             path = module_path / sub
             self.ensure_structure([path])
             
-        # utils/__init__.py
-        utils_init = module_path / "utils" / self.FILE_INIT
-        self.create_file(utils_init,"from .client_type import ClientType\n\n__all__ = ['ClientType']")
-        # utils/client_type.py
-        self.create_file(module_path / "utils" / "client_type.py", client_type_template())
-
-        # services/__init__.py
-        services_init = module_path / "services" / self.FILE_INIT
-        self.create_file(services_init,"from .auth_service import AuthService\n\n__all__ = ['AuthService']")
-        # services/auth_service.py
-        self.create_file(module_path / "services" / "auth_service.py", auth_service_template())
-
-        # dtos/__init__.py
-        dtos_init = module_path / "dtos" / self.FILE_INIT
-        self.create_file(dtos_init, init_dtos_template() )
+        files = {
+            module_path / "utils" / self.FILE_INIT: "from .client_type import ClientType\nfrom .passwords import PasswordHasher\nfrom .revocation import RevocationList, build_revocation_backend\nfrom .rate_limit import RateLimiter, build_rate_limit_backend, client_ip, parse_rate\nfrom .tokens import TokenVerifier\n\n__all__ = ['ClientType', 'PasswordHasher', 'RevocationList', 'build_revocation_backend', 'RateLimiter', 'build_rate_limit_backend', 'client_ip', 'parse_rate', 'TokenVerifier']",
+            module_path / "utils" / "client_type.py": client_type_template(),
+            module_path / "utils" / "passwords.py": passwords_template(),
+            module_path / "utils" / "revocation.py": revocation_template(),
+            module_path / "utils" / "rate_limit.py": rate_limit_template(),
+            module_path / "utils" / "tokens.py": tokens_template(),
+            module_path / "services" / self.FILE_INIT: "from .auth_service import AuthService\n\n__all__ = ['AuthService']",
+            module_path / "services" / "auth_service.py": auth_service_template(),
+            module_path / "dtos" / self.FILE_INIT: init_dtos_template(),
+            module_path / "controllers" / self.FILE_INIT: "from .auth_controller import AuthController\n\n__all__ = ['AuthController']",
+            module_path / "controllers" / "auth_controller.py": auth_controller_template(),
+        }
         # dtos templates
         for dto in ["login", "refresh", "token", "refreshrequest"]:
-            self.create_file(module_path / "dtos" / f"{dto}.py", f"# Defina a classe {dto.capitalize()} aqui")
-
-        # controllers/__init__.py
-        controllers_init = module_path / "controllers" / self.FILE_INIT
-        self.create_file(controllers_init,"from .auth_controller import AuthController\n\n__all__ = ['AuthController']")
-        # controllers/auth_controller.py
-        self.create_file(module_path / "controllers" / "auth_controller.py", auth_controller_template())
-
-    def _create_modules(self, additional_modules: list[str] = []):
-        """ Cria módulos opcionais (não obrigatórios) com estrutura padrão: controllers, services, repositories e dtos. """
-        for module in additional_modules:
-            module_path = self.modules_path / module
-            self.ensure_structure([module_path])
-            for sub in ["controllers", "services", "repositories", "dtos"]:
-                sub_path = module_path / sub
-                self.ensure_structure([sub_path])
-                self.create_file(sub_path / self.FILE_INIT, "")
-            self.create_file(module_path / self.FILE_INIT, "")
+            files[module_path / "dtos" / f"{dto}.py"] = f"# Defina a classe {dto.capitalize()} aqui"
+
+        self.render_files(files)
+
+    def _create_files_module(self):
+        """ Upload de arquivos (src/base/uploads.py); servidos pelo mount /uploads do main.py. """
+        module_path = self.modules_path / "files"
+        self.render_files({
+            module_path / self.FILE_INIT: "",
+            module_path / "controllers" / self.FILE_INIT: "from .files_controller import FilesController\n\n__all__ = ['FilesController']",
+            module_path / "controllers" / "files_controller.py": files_controller_template(),
+        })
+
+    def _create_benchmarks(self):
+        """ Scripts de benchmark do projeto gerado, rodados com `uv run python -m benchmarks.<nome>`. """
+        benchmarks_path = self.project_path / "benchmarks"
+        files = {
+            benchmarks_path / self.FILE_INIT: "",
+            benchmarks_path / "serialization.py": serialization_benchmark_template(),
+        }
+        if self.with_auth:
+            files[benchmarks_path / "password_hashing.py"] = password_hashing_benchmark_template()
+        self.render_files(files)
+
+    def _create_modules(self, additional_modules: Optional[list[EntitySpec]] = None):
+        """ Cria módulos opcionais (não obrigatórios) declarados no spec: model, repository, service, controller e dtos.
+            Cada módulo é só um lote de arquivos no manifesto, então o custo cresce linearmente e a escrita sai em paralelo.
+        """
+        for entity in additional_modules or []:
+            module_path = self.modules_path / entity.module
+            name = entity.class_name
+            self.render_files({
+                self.models_path / f"{entity.name}.py": entity_model_template(entity, self.spec),
+                module_path / self.FILE_INIT: "",
+                module_path / "repositories" / self.FILE_INIT: f"from .{entity.name}_repository import {name}Repository\n\n__all__ = ['{name}Repository']",
+                module_path / "repositories" / f"{entity.name}_repository.py": entity_repository_template(entity),
+                module_path / "services" / self.FILE_INIT: f"from .{entity.name}_service import {name}Service\n\n__all__ = ['{name}Service']",
+                module_path / "services" / f"{entity.name}_service.py": entity_service_template(entity),
+                module_path / "dtos" / self.FILE_INIT: f"from .{entity.name} import {name}Create, {name}Update, {name}Response\n\n__all__ = ['{name}Create', '{name}Update', '{name}Response']",
+                module_path / "dtos" / f"{entity.name}.py": entity_dtos_template(entity),
+                module_path / "controllers" / self.FILE_INIT: f"from .{entity.module}_controller import {entity.controller_name}\n\n__all__ = ['{entity.controller_name}']",
+                module_path / "controllers" / f"{entity.module}_controller.py": entity_controller_template(entity),
+            })
 
     def build(self):
         self._create_project_root()
         self._create_app_structure()
         self._create_main_file()
         self._create_pyproject()
+        self._create_seed_lock()
         self._create_readme()
         self._create_setup_db()
         self._create_core_files()
@@ -144,15 +204,32 @@ class ProjectBuilder(BaseBuilder):
         self._create_startup_app()
         self._create_base_files()
         self._create_models()
-        self._create_modules()
-
-        if self.with_database:
-            self._configure_database()
 
         if self.with_auth:
             self._create_auth_module()
 
         self._create_users_module()
-        self._create_modules(additional_modules=[]) # Módulos opcionais que o usuário quiser
-
-        self.install_dependencies()
\ No newline at end of file
+        self._create_files_module()
+        self._create_modules(additional_modules=self.spec.entities) # Módulos opcionais declarados no --spec
+        self._create_benchmarks()
+
+    def apply(self) -> WriteReport:
+        """ Escreve primeiro os arquivos que o uv precisa, dispara a instalação e escreve o restante enquanto ela roda. """
+        pyproject = self.project_path / "pyproject.toml"
+        early = self.manifest.split([pyproject, self.project_path / "uv.lock", self.project_path / "README.md"])
+        report = self.fs.write_manifest(early, lock=self.lock)
+
+        # Numa regeneração sem mudanças no pyproject.toml o ambiente já está sincronizado
+        if report.changed(pyproject) and self.install_mode != InstallMode.NONE:
+            self.install_process = self.fs.start_install(self.cache_dir, background=self.install_mode == InstallMode.BACKGROUND)
+
+        self.report = report.merge(super().apply())
+        return self.report
+
+    def after_build(self):
+        if self.install_process is None:
+            return
+        if self.install_mode == InstallMode.BACKGROUND:
+            self.fs._log(f"📦 Dependencies are installing in background (pid {self.install_process.pid}), see {INSTALL_LOG_FILE}")
+            return
+        self.wait_subprocess("uv sync", lambda: self.fs.wait_install(self.install_process))
@@ -1,10 +1,23 @@
+import re
+import tomllib
 from pathlib import Path
 from .base import BaseBuilder
-from ..templates.tests import test_auth_controller_template, test_auth_service_template
+from ..templates.tests import test_auth_controller_template, test_auth_service_template, conftest_template, test_cache_template, test_replicas_template, test_token_verifier_template, test_revocation_template, test_serialization_template, test_startup_template, test_uploads_template, test_http_cache_template, test_rate_limit_template, test_metrics_template
+from ..utils.lockfile import LockFile, content_hash, source_fingerprint
 
 class TestBuilder(BaseBuilder):
     """Builder responsável por criar estrutura de testes e configurar pytest."""
 
+    def __init__(self, base_path: Path):
+        super().__init__(base_path)
+        self.lock = LockFile(base_path)
+
+    def inputs(self) -> str:
+        """ Templates e código do gerador mais o pyproject.toml atual, que este builder completa. """
+        pyproject_path = self.base_path / "pyproject.toml"
+        pyproject = pyproject_path.read_text(encoding="utf-8") if pyproject_path.exists() else ""
+        return content_hash(source_fingerprint() + self.lock.template_version + pyproject)
+
     def build(self):
         self._create_tests_folder()
         self._update_pyproject()
@@ -14,40 +27,100 @@ class TestBuilder(BaseBuilder):
         modules_path = tests_path / "modules"
         auth_tests_path = modules_path / "auth"
         users_tests_path = modules_path / "users"
+        base_tests_path = tests_path / "base"
 
-        folders = [tests_path, modules_path, auth_tests_path, users_tests_path]
+        folders = [tests_path, modules_path, auth_tests_path, users_tests_path, base_tests_path]
         self.ensure_structure(folders)
 
         # Criar __init__.py
-        for folder in folders:
-            self.create_file(folder / "__init__.py", "")
+        files = {folder / "__init__.py": "" for folder in folders}
 
         # Templates de teste
-        self.create_file(auth_tests_path / "test_auth_controller.py", test_auth_controller_template())
-        self.create_file(auth_tests_path / "test_auth_service.py", test_auth_service_template())
+        files[tests_path / "conftest.py"] = conftest_template()
+        files[auth_tests_path / "test_auth_controller.py"] = test_auth_controller_template()
+        files[auth_tests_path / "test_auth_service.py"] = test_auth_service_template()
+        files[auth_tests_path / "test_token_verifier.py"] = test_token_verifier_template()
+        files[auth_tests_path / "test_revocation.py"] = test_revocation_template()
+        files[auth_tests_path / "test_rate_limit.py"] = test_rate_limit_template()
+        files[base_tests_path / "test_cache.py"] = test_cache_template()
+        files[base_tests_path / "test_replicas.py"] = test_replicas_template()
+        files[base_tests_path / "test_serialization.py"] = test_serialization_template()
+        files[base_tests_path / "test_startup.py"] = test_startup_template()
+        files[base_tests_path / "test_uploads.py"] = test_uploads_template()
+        files[base_tests_path / "test_http_cache.py"] = test_http_cache_template()
+        files[base_tests_path / "test_metrics.py"] = test_metrics_template()
+        self.render_files(files)
 
     def _update_pyproject(self):
+        """ Junta as dependências de teste ao grupo `dev` que o pyproject já declara (TOML não aceita a mesma tabela
+            duas vezes, e o `uv sync` recusa o arquivo) e acrescenta a config do pytest só se ela ainda não existir.
+        """
         pyproject_path = self.base_path / "pyproject.toml"
         if not pyproject_path.exists():
             return
 
-        # Append pytest config if não existir
-        pytest_config = """
-
-        [dependency-groups]
-        dev = [
-            "httpx>=0.28.1",
-            "pytest>=9.0.2",
-            "pytest-asyncio>=1.3.0",
-            "pytest-cov>=7.0.0",
-            "pytest-mock>=3.15.1",
-        ]
-
-        [tool.pytest.ini_options]
-        filterwarnings = [
-            "ignore::DeprecationWarning"
-        ]
-        pythonpath = ["."]
-        testpaths = ["tests"]
-        """
-        self.append_file(pyproject_path, pytest_config)
\ No newline at end of file
+        content = pyproject_path.read_text(encoding="utf-8")
+        data = tomllib.loads(content)
+        groups = data.get("dependency-groups")
+        dev = (groups or {}).get("dev")
+        declared = {_requirement_name(requirement) for requirement in dev or []}
+        missing = [requirement for requirement in TEST_DEPENDENCIES if _requirement_name(requirement) not in declared]
+
+        if dev is not None:
+            if missing:
+                section = content.index("[dependency-groups]")
+                match = re.compile(r"(?m)^dev\s*=\s*\[").search(content, section)
+                content = content[:match.start()] + _dev_group([*dev, *missing]) + content[_array_end(content, match.end() - 1):]
+        elif groups is not None:
+            header = content.index("[dependency-groups]") + len("[dependency-groups]")
+            content = content[:header] + "\n" + _dev_group(missing) + content[header:]
+        else:
+            content = content.rstrip("\n") + "\n\n[dependency-groups]\n" + _dev_group(missing) + "\n"
+
+        if "pytest" not in data.get("tool", {}):
+            content = content.rstrip("\n") + "\n\n" + PYTEST_CONFIG
+        self.update_file(pyproject_path, content)
+
+
+TEST_DEPENDENCIES = ["aiosqlite>=0.21.0", "httpx>=0.28.1", "pytest>=9.0.2", "pytest-asyncio>=1.3.0", "pytest-cov>=7.0.0", "pytest-mock>=3.15.1"]
+
+PYTEST_CONFIG = """[tool.pytest.ini_options]
+filterwarnings = [
+    "ignore::DeprecationWarning"
+]
+pythonpath = ["."]
+testpaths = ["tests"]
+"""
+
+
+def _requirement_name(requirement: str) -> str:
+    return re.split(r"[\s<>=!~;\[]", requirement, maxsplit=1)[0].lower().replace("_", "-")
+
+
+def _dev_group(requirements: list[str]) -> str:
+    return "dev = [\n" + "".join(f'    "{requirement}",\n' for requirement in requirements) + "]"
+
+
+def _array_end(content: str, start: int) -> int:
+    """ Posição logo depois do `]` que fecha o array aberto em `start`, ignorando colchetes dentro de strings e comentários. """
+    depth, quote, index = 0, None, start
+    while index < len(content):
+        char = content[index]
+        if quote:
+            if char == "\\":
+                index += 1
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "#":
+            index = content.index("\n", index) if "\n" in content[index:] else len(content)
+            continue
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    raise ValueError("unterminated array in pyproject.toml")
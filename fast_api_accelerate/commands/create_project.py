@@ -1,12 +1,13 @@
 import typer
 from pathlib import Path
-from ..builders.project_builder import ProjectBuilder
+from typing import Optional
+from ..utils.file_system import InstallMode
+from ..utils.pool import PoolProfile
 
 
 create_app = typer.Typer(help="Create a new FastAPI project")
-
 @create_app.command("project")
-def create_project(name: str = typer.Argument(..., help="Project name"),path: str = typer.Option(".", "--path", "-p"),database: bool = typer.Option(True, "--database/--no-database"),auth: bool = typer.Option(True, "--auth/--no-auth")):
+def create_project(name: str = typer.Argument(..., help="Project name"),path: str = typer.Option(".", "--path", "-p"),database: bool = typer.Option(True, "--database/--no-database"),auth: bool = typer.Option(True, "--auth/--no-auth"),update: bool = typer.Option(False, "--update", help="Regenerate an existing project, keeping files you modified"),install: InstallMode = typer.Option(InstallMode.FOREGROUND, "--install", help="How to run uv sync: foreground, background or none"),no_install: bool = typer.Option(False, "--no-install", help="Skip dependency installation"),cache_dir: Optional[Path] = typer.Option(None, "--cache-dir", help="Shared uv cache directory reused across projects"),lock_from: Optional[Path] = typer.Option(None, "--lock-from", exists=True, dir_okay=False, help="Pre-resolved uv.lock to seed the project with"),spec: Optional[Path] = typer.Option(None, "--spec", exists=True, dir_okay=False, help="YAML/JSON file declaring entities to scaffold"),pool_profile: PoolProfile = typer.Option(PoolProfile.LATENCY, "--pool-profile", help="Database pool defaults: throughput or latency"),profile: bool = typer.Option(False, "--profile", help="Print time, files, bytes and subprocess time per build step"),profile_output: Optional[Path] = typer.Option(None, "--profile-output", help="Write the profile as a Chrome trace JSON file")):
     """Create a new production-ready FastAPI project."""
 
     base_path = Path(path).resolve()
@@ -17,13 +18,34 @@ def create_project(name: str = typer.Argument(..., help="Project name"),path: st
 
     project_path = base_path / name
 
-    if project_path.exists():
-        typer.secho(" x Project already exists.", fg=typer.colors.RED)
+    if project_path.exists() and not update:
+        typer.secho(" x Project already exists. Use --update to regenerate it.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    from ..builders.project_builder import ProjectBuilder  # import tardio: mantém o --help leve
+    from ..utils.manifest import WriteStatus
+    from ..utils.profiler import BuildProfiler, report_profile
+    from ..utils.spec import load_spec
+
+    try:
+        project_spec = load_spec(spec) if spec else None
+    except ValueError as error:
+        typer.secho(f" x Invalid spec: {error}", fg=typer.colors.RED)
         raise typer.Exit(code=1)
 
-    typer.secho("🚀 Creating FastAPI project...", fg=typer.colors.CYAN)
+    typer.secho("🔄 Updating FastAPI project..." if update else "🚀 Creating FastAPI project...", fg=typer.colors.CYAN)
 
-    builder = ProjectBuilder(base_path=base_path,project_name=name)
+    install_mode = InstallMode.NONE if no_install else install
+    builder = ProjectBuilder(base_path=base_path,project_name=name,install_mode=install_mode,cache_dir=cache_dir,seed_lock=lock_from,spec=project_spec,pool_profile=pool_profile)
+    builder.profiler = BuildProfiler() if profile or profile_output else None
     builder.run()
+    report_profile(builder.profiler, profile_output)
+
+    if update:
+        typer.secho(f"✓ Project updated: {builder.report.summary() or 'nothing to do'}", fg=typer.colors.GREEN)
+        for status in (WriteStatus.UPDATED, WriteStatus.CREATED, WriteStatus.MODIFIED):
+            for file in builder.report.paths(status):
+                typer.echo(f"  {status.value:<9} {file.relative_to(project_path)}")
+        return
 
     typer.secho("✓ Project created successfully!", fg=typer.colors.GREEN)
\ No newline at end of file
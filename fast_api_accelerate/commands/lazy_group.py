@@ -0,0 +1,48 @@
+from importlib import import_module
+from typing import Dict, List, Optional, Tuple
+import typer
+from typer.core import TyperGroup
+
+
+class LazyGroup(TyperGroup):
+    """ Grupo Typer que só importa um sub-app (e seus builders/templates) quando o comando é executado.
+        `lazy_commands` mapeia nome -> ("modulo:atributo", help curto).
+    """
+
+    lazy_commands: Dict[str, Tuple[str, str]] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._listing_help = False
+
+    def list_commands(self, ctx) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
+
+        import_path, help_text = self.lazy_commands[cmd_name]
+        if self._listing_help:
+            # Apenas listando no --help: devolve um placeholder sem importar o sub-app
+            return TyperGroup(name=cmd_name, help=help_text)
+
+        command = self._load(cmd_name, import_path)
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx, formatter):
+        self._listing_help = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing_help = False
+
+    @staticmethod
+    def _load(cmd_name: str, import_path: str):
+        module_name, attr = import_path.split(":")
+        sub_app = getattr(import_module(module_name), attr)
+        command = typer.main.get_group(sub_app) if isinstance(sub_app, typer.Typer) else sub_app
+        command.name = cmd_name
+        return command
@@ -1,12 +1,12 @@
 import typer
 from pathlib import Path
-from ..builders.test_builder import TestBuilder 
+from typing import Optional
 
 
 tests_app = typer.Typer(help="Configure tests for a FastAPI project")
 
 @tests_app.command("setup")
-def setup_tests(path: str = typer.Option(".", "--path", "-p", help="Base path of the project")):
+def setup_tests(path: str = typer.Option(".", "--path", "-p", help="Base path of the project"),profile: bool = typer.Option(False, "--profile", help="Print time, files, bytes and subprocess time per build step"),profile_output: Optional[Path] = typer.Option(None, "--profile-output", help="Write the profile as a Chrome trace JSON file")):
     """Configure test structure and add pytest settings to pyproject.toml."""
 
     base_path = Path(path).resolve()
@@ -17,7 +17,12 @@ def setup_tests(path: str = typer.Option(".", "--path", "-p", help="Base path of
 
     typer.secho("🧪 Setting up test structure...", fg=typer.colors.CYAN)
 
+    from ..builders.test_builder import TestBuilder  # import tardio: mantém o --help leve
+    from ..utils.profiler import BuildProfiler, report_profile
+
     builder = TestBuilder(base_path=base_path)
+    builder.profiler = BuildProfiler() if profile or profile_output else None
     builder.run()
+    report_profile(builder.profiler, profile_output)
 
     typer.secho("\033[0;32m✓\033[0m Test structure and configuration added!", fg=typer.colors.GREEN)
\ No newline at end of file
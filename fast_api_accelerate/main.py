@@ -1,14 +1,23 @@
 import typer
-from fast_api_accelerate.commands.create_project import create_app
-from fast_api_accelerate.commands.test_config_project import tests_app
+from fast_api_accelerate.commands.lazy_group import LazyGroup
 
-app = typer.Typer(help="🚀 Fast API Accelerate - Enterprise FastAPI Scaffolding CLI", add_completion=False)
 
-app.add_typer(create_app, name="create")
-app.add_typer(tests_app, name="tests")
+class AccelerateCommands(LazyGroup):
+    """ Registro dos subcomandos. Cada sub-app só é importado quando o comando roda. """
+    lazy_commands = {
+        "create": ("fast_api_accelerate.commands.create_project:create_app", "Create a new FastAPI project"),
+        "tests": ("fast_api_accelerate.commands.test_config_project:tests_app", "Configure tests for a FastAPI project"),
+    }
+
+
+app = typer.Typer(cls=AccelerateCommands, help="🚀 Fast API Accelerate - Enterprise FastAPI Scaffolding CLI", add_completion=False)
+
+@app.callback()
+def main():
+    pass
 
 def run():
     app()
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()
@@ -0,0 +1,4 @@
+from .password_hashing import password_hashing_benchmark_template
+from .serialization import serialization_benchmark_template
+
+__all__ = ["password_hashing_benchmark_template", "serialization_benchmark_template"]
@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def password_hashing_benchmark_template() -> str:
+    return render_template("benchmarks/password_hashing")
@@ -0,0 +1,68 @@
+""" Atraso do event loop durante logins concorrentes: verificação bcrypt inline (bloqueia o loop)
+    x PasswordHasher (pool de threads). Rode na raiz do projeto:
+
+        uv run python -m benchmarks.password_hashing --logins 50 --rounds 12 --workers 4
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+from src.modules.auth.utils.passwords import PasswordHasher
+
+INTERVAL = 0.005
+
+
+async def monitor(lags: List[float]):
+    """ Acorda a cada INTERVAL e registra o atraso: é quanto uma request qualquer esperaria pelo loop. """
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(INTERVAL)
+        lags.append(loop.time() - start - INTERVAL)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values) or [0.0]
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def measure(name: str, verify: Callable[[], Awaitable[bool]], logins: int):
+    lags: List[float] = []
+    task = asyncio.create_task(monitor(lags))
+    await asyncio.sleep(INTERVAL * 4)
+    lags.clear()
+    started = time.perf_counter()
+    results = await asyncio.gather(*(verify() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(INTERVAL * 2)  # o monitor registra a espera que ficou pendente enquanto o loop estava bloqueado
+    task.cancel()
+    assert all(results)
+    print(f"{name:<8} {logins:>7} {elapsed:>9.2f} {logins / elapsed:>10.1f} {percentile(lags, 0.5) * 1000:>9.1f} {percentile(lags, 0.99) * 1000:>9.1f} {max(lags, default=0.0) * 1000:>9.1f}")
+
+
+async def main(logins: int, rounds: int, workers: int, scheme: str):
+    hasher = PasswordHasher(scheme=scheme, bcrypt_rounds=rounds, workers=workers)
+    hashed = await hasher.hash("correct horse battery staple")
+
+    async def inline() -> bool:
+        # o que o AuthService fazia antes: verify síncrono dentro de uma corrotina
+        return hasher.context.verify("correct horse battery staple", hashed)
+
+    async def pooled() -> bool:
+        return await hasher.verify("correct horse battery staple", hashed)
+
+    print(f"{scheme}, {logins} logins concorrentes, {workers} workers; atraso do loop em ms")
+    print(f"{'mode':<8} {'logins':>7} {'total s':>9} {'logins/s':>10} {'lag p50':>9} {'lag p99':>9} {'lag max':>9}")
+    await measure("inline", inline, logins)
+    await measure("pool", pooled, logins)
+    hasher.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default="bcrypt")
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.logins, arguments.rounds, arguments.workers, arguments.scheme))
@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def serialization_benchmark_template() -> str:
+    return render_template("benchmarks/serialization")
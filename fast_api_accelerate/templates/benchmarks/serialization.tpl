@@ -0,0 +1,78 @@
+""" Throughput de serialização de páginas (padrão: 1000 itens) vindas do ORM, pelos caminhos que uma rota pode seguir.
+    Rode na raiz do projeto:
+
+        uv run python -m benchmarks.serialization --items 1000 --repeat 50
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, ConfigDict
+from src.base.pagination import Page
+from src.base.serialization import FastJSONResponse, dump_json, type_adapter
+
+
+class ItemResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    body: str
+    views: int
+    score: float
+    published: bool
+    author_id: Optional[int] = None
+    created_at: datetime
+
+
+class Row:
+    """ Faz o papel da entidade do SQLAlchemy: só atributos, a conversão fica com o from_attributes. """
+
+    def __init__(self, index: int):
+        self.id = index
+        self.title = f"Post {index}"
+        self.body = "lorem ipsum dolor sit amet " * 8
+        self.views = index * 7
+        self.score = index / 3
+        self.published = index % 2 == 0
+        self.author_id = index % 50 or None
+        self.created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def measure(name: str, serialize: Callable[[], bytes], repeat: int, baseline: Optional[float] = None) -> float:
+    size = len(serialize())
+    started = time.perf_counter()
+    for _ in range(repeat):
+        serialize()
+    per_page = (time.perf_counter() - started) / repeat
+    speedup = f"{baseline / per_page:>7.1f}x" if baseline else f"{'1.0x':>8}"
+    print(f"{name:<36} {per_page * 1000:>9.2f} {1 / per_page:>9.1f} {size / 1024:>8.0f} {speedup}")
+    return per_page
+
+
+def main(items: int, repeat: int):
+    rows: List[Row] = [Row(index) for index in range(items)]
+    page = Page(items=rows, next_cursor="opaque", limit=items)
+    response_type = Page[ItemResponse]
+    validated = type_adapter(response_type).validate_python(page, from_attributes=True)
+    renderer = FastJSONResponse(None)
+
+    print(f"página com {items} itens, média de {repeat} execuções")
+    print(f"{'path':<36} {'ms/page':>9} {'pages/s':>9} {'KiB':>8} {'speedup':>8}")
+    # rota sem response_model (ou com response_class própria): jsonable_encoder percorre tudo em Python
+    baseline = measure("jsonable_encoder + json.dumps", lambda: json.dumps(jsonable_encoder(validated)).encode("utf-8"), repeat)
+    measure("jsonable_encoder + FastJSONResponse", lambda: renderer.render(jsonable_encoder(validated)), repeat, baseline)
+    measure("model_dump + FastJSONResponse", lambda: renderer.render(validated.model_dump()), repeat, baseline)
+    # o que uma rota com response_model faz: valida do ORM e serializa em Rust (dump_json), com o TypeAdapter cacheado
+    measure("TypeAdapter validate + dump_json", lambda: dump_json(page, response_type), repeat, baseline)
+    measure("TypeAdapter dump_json (já validado)", lambda: type_adapter(response_type).dump_json(validated), repeat, baseline)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    arguments = parser.parse_args()
+    main(arguments.items, arguments.repeat)
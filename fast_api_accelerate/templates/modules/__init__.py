@@ -3,5 +3,16 @@ from .user_model import user_model_template
 from .user_schemas import user_schemas_template
 from .auth_service import auth_service_template
 from .auth_controller import auth_controller_template
+from .files_controller import files_controller_template
+from .passwords import passwords_template
+from .tokens import tokens_template
+from .revocation import revocation_template
+from .rate_limit import rate_limit_template
+from .entity_model import entity_model_template
+from .entity_repository import entity_repository_template
+from .entity_service import entity_service_template
+from .entity_dtos import entity_dtos_template
+from .entity_controller import entity_controller_template
 
-__all__ = ["client_type_template","user_model_template","user_schemas_template","auth_service_template","auth_controller_template"]
\ No newline at end of file
+__all__ = ["client_type_template","user_model_template","user_schemas_template","auth_service_template","auth_controller_template","files_controller_template","passwords_template","tokens_template","revocation_template","rate_limit_template",
+"entity_model_template","entity_repository_template","entity_service_template","entity_dtos_template","entity_controller_template"]
\ No newline at end of file
@@ -0,0 +1,46 @@
+from typing import Optional
+from fastapi import APIRouter, Body, Depends, Request
+from src.base.http_cache import cache_control
+from src.base.serialization import FastJSONResponse
+from src.modules.auth.services import AuthService
+from ..dtos import LoginRequest, RefreshRequest, TokenResponse,RefreshTokenResponse
+from src.core.container_ioc import get_auth_rate_limiter, get_auth_service, get_current_user, get_token_from_header, get_token_verifier, role_required
+from ..utils import RateLimiter, TokenVerifier, client_ip
+
+
+class AuthController:
+
+    def __init__(self):
+        self.router = APIRouter(prefix="/auth",tags=["Auth"])
+        self._register_routes()
+
+    def _register_routes(self):
+
+        @self.router.post("/login", response_model=TokenResponse, dependencies=[Depends(cache_control(no_store=True))])
+        async def login(credentials: LoginRequest,request: Request,limiter: RateLimiter = Depends(get_auth_rate_limiter),service: AuthService = Depends(get_auth_service)):
+            # antes do hash da senha e da consulta ao banco: acima do limite a tentativa custa só um dict lookup
+            await limiter.enforce({"ip": client_ip(request), "account": credentials.email, "client": credentials.client_type})
+            return await service.login(credentials.email,credentials.password,credentials.client_type)
+
+        @self.router.post("/refresh", response_model=RefreshTokenResponse, dependencies=[Depends(cache_control(no_store=True))])
+        async def refresh(request: RefreshRequest,http_request: Request,limiter: RateLimiter = Depends(get_auth_rate_limiter),service: AuthService = Depends(get_auth_service)):
+            await limiter.enforce({"ip": client_ip(http_request), "client": request.client_type})
+            return await service.refresh(request.refresh_token,request.client_type)
+
+        @self.router.get("/me", response_class=FastJSONResponse, dependencies=[Depends(cache_control())])
+        async def me(current_user=Depends(get_current_user)):
+            return current_user
+
+        @self.router.get("/token-cache", response_class=FastJSONResponse, dependencies=[Depends(role_required(["admin"])), Depends(cache_control(no_store=True))])
+        async def token_cache(verifier: TokenVerifier = Depends(get_token_verifier)):
+            return verifier.stats()
+
+        @self.router.get("/rate-limits", response_class=FastJSONResponse, dependencies=[Depends(role_required(["admin"])), Depends(cache_control(no_store=True))])
+        async def rate_limits(limiter: RateLimiter = Depends(get_auth_rate_limiter)):
+            return limiter.stats()
+
+        @self.router.post("/logout", response_class=FastJSONResponse)
+        async def logout(refresh_token: Optional[str] = Body(None, embed=True),token: str = Depends(get_token_from_header),current_user=Depends(get_current_user),service: AuthService = Depends(get_auth_service)):
+            await service.logout(token, refresh_token)
+            return {"detail": "Logout realizado com sucesso"}
+
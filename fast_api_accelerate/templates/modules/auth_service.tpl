@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta, UTC
+from typing import Dict, Any, Optional
+from uuid import uuid4
+from fastapi import HTTPException, status
+from jose import jwt
+from src.base.base_service import BaseService
+from src.base.cache import EntityCache
+from src.modules.users.repositories import UserRepository
+from  src.modules.auth.utils.client_type import ClientType
+from src.modules.auth.utils.passwords import PasswordHasher
+from src.modules.auth.utils.tokens import TokenVerifier
+
+class AuthService:
+
+    SECRET_KEY = "test-secret-key"
+    ALGORITHM = "HS256"
+    TOKEN_EXPIRATION_POLICY = {
+        ClientType.WEB: {"access": timedelta(minutes=30),"refresh": timedelta(days=7)},
+        ClientType.MOBILE: {"access": timedelta(minutes=60),"refresh": timedelta(days=15)},
+    }
+    # claims do access token; o refresh token carrega os mesmos para renovar o acesso sem ler o usuário
+    ACCESS_CLAIMS = ("id", "username", "email", "image", "roles", "userStatus")
+    # por quanto tempo (desde o `iat` do refresh token) esses claims valem sem reler o usuário: depois disso cada
+    # refresh passa pelo cache de entidades, e um usuário bloqueado ou com roles retiradas para de ganhar acesso
+    CLAIMS_MAX_AGE = timedelta(minutes=5)
+
+    def __init__(self, repository: UserRepository, cache: Optional[EntityCache] = None, hasher: Optional[PasswordHasher] = None, tokens: Optional[TokenVerifier] = None):
+        self.repository = repository
+        # leitura do usuário por id passa pelo cache de entidades (refresh de tokens emitidos sem os claims de acesso)
+        self.users = BaseService(repository, cache=cache)
+        # bcrypt/argon2 rodam no pool do hasher; o container passa um único hasher configurado pelo Settings
+        self.hasher = hasher or PasswordHasher()
+        # o mesmo verificador (cache de claims e denylist de jti) usado por get_current_user
+        self.tokens = tokens or TokenVerifier(self.SECRET_KEY, self.ALGORITHM)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.hasher.verify(plain_password, hashed_password)
+
+    async def hash_password(self, plain_password: str) -> str:
+        return await self.hasher.hash(plain_password)
+
+    async def _rehash(self, user, plain_password: str) -> None:
+        """ Hash criado com outro esquema ou custo: grava um novo com os parâmetros atuais, aproveitando a senha já validada. """
+        user.password = await self.hasher.hash(plain_password)
+        await self.repository.update(user)
+        await self.users.invalidate(user.id)
+
+    def _create_token(self,data: Dict[str, Any],token_type: str,client_type: ClientType) -> str:
+
+        if not data or "id" not in data:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,detail="Invalid payload")
+
+        if client_type not in self.TOKEN_EXPIRATION_POLICY:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,detail="Invalid client type")
+
+        expire_delta = self.TOKEN_EXPIRATION_POLICY[client_type][token_type]
+        now = datetime.now(UTC)
+        to_encode = data.copy()
+        to_encode.update({"iat": now,"exp": now + expire_delta,"type": token_type,"client": client_type.value,"jti": uuid4().hex})
+
+        return jwt.encode(to_encode,self.SECRET_KEY,algorithm=self.ALGORITHM )
+
+    def decode_token(self, token: str) -> Dict[str, Any]:
+        return self.tokens.decode(token)
+
+    async def verify_token(self, token: str) -> Dict[str, Any]:
+        """ Claims de um access token, pelo cache do TokenVerifier. Refresh tokens não servem para autenticar. """
+        return await self.tokens.verify(token, token_type="access")
+
+    def _access_claims(self, user) -> Dict[str, Any]:
+        return {"id": str(user.id),"username": user.username,"email": user.email,"image": user.image,"roles": user.roles if isinstance(user.roles, list) else [user.roles],"userStatus": user.status}
+
+    async def login(self,email: str,password: str,client_type: ClientType) -> Dict[str, str]:
+
+        user = await self.repository.get_by_email(email)
+        if not user:
+            await self.hasher.dummy_verify()  # mesmo tempo de resposta de um e-mail existente
+        if not user or not await self.verify_password(password, user.password):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,detail="Credenciais inválidas")
+        if self.hasher.needs_update(user.password):
+            await self._rehash(user, password)
+
+        access_claims = self._access_claims(user)
+
+        refresh_claims = dict(access_claims)
+        access_token = self._create_token(access_claims,token_type="access",client_type=client_type)
+        refresh_token = self._create_token(refresh_claims,token_type="refresh",client_type=client_type)
+
+        return {"access_token": access_token,"refresh_token": refresh_token}
+
+    async def refresh(self,refresh_token: str,client_type: ClientType) -> Dict[str, str]:
+        payload = self.decode_token(refresh_token)
+
+        if payload.get("type") != "refresh":
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,detail="Invalid token type")
+
+        if await self.tokens.revocations.is_revoked(payload.get("jti")):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,detail="Token revoked")
+
+        # refresh recente com os claims de acesso: assinatura válida e jti não revogado bastam, sem ir ao banco
+        if all(key in payload for key in self.ACCESS_CLAIMS) and self._fresh_claims(payload):
+            access_claims = {key: payload[key] for key in self.ACCESS_CLAIMS}
+            return {"access_token": self._create_token(access_claims,token_type="access",client_type=client_type)}
+
+        user_id = payload.get("id")
+        if not user_id or not str(user_id).isdigit():
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,detail="Invalid token payload")
+
+        user = await self.users.find_by_id(int(user_id))
+        if not user:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,detail="User not found")
+        if str(getattr(user.status, "value", user.status)).lower() != "active":
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,detail="User is not active")
+
+        access_claims = self._access_claims(user)
+        new_access_token = self._create_token(access_claims,token_type="access",client_type=client_type)
+
+        return {"access_token": new_access_token}
+
+    def _fresh_claims(self, payload: Dict[str, Any]) -> bool:
+        issued_at = payload.get("iat")
+        if not isinstance(issued_at, (int, float)):
+            return False
+        return datetime.now(UTC).timestamp() - issued_at <= self.CLAIMS_MAX_AGE.total_seconds()
+
+    async def logout(self,access_token: str,refresh_token: Optional[str] = None) -> None:
+        """ Revoga o access token (e o refresh, se enviado) até o exp de cada um, em todos os workers. """
+        await self.tokens.revoke(access_token)
+        if refresh_token:
+            await self.tokens.revoke(refresh_token)
@@ -1,8 +1,5 @@
-def client_type_template()->str:
-    return """from enum import Enum
+from ..registry import render_template
 
-class ClientType(str, Enum):
-    WEB = "web"
-    MOBILE = "mobile"
 
-"""
\ No newline at end of file
+def client_type_template()->str:
+    return render_template("modules/client_type")
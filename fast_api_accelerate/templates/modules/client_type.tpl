@@ -0,0 +1,6 @@
+from enum import Enum
+
+class ClientType(str, Enum):
+    WEB = "web"
+    MOBILE = "mobile"
+
@@ -0,0 +1,53 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status
+from src.base.http_cache import cache_control
+from src.base.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from src.base.streaming import StreamFormat, stream_response
+from src.core.configs import settings
+from src.core.container_ioc import get_${entity}_service
+from ..services import ${name}Service
+from ..dtos import ${name}Create, ${name}Update, ${name}Response
+
+
+class ${controller}Controller:
+
+    def __init__(self):
+        self.router = APIRouter(prefix="/${module}",tags=["${controller}"])
+        self._register_routes()
+
+    def _register_routes(self):
+        # leituras valem HTTP_CACHE_MAX_AGE s no cliente e no cache do worker; escritas em /${module} descartam o cache local;
+        # requisições com credenciais só usam o cache do worker com HTTP_CACHE_AUTHENTICATED (chave = usuário do token verificado)
+        cached = [Depends(cache_control(max_age=settings.HTTP_CACHE_MAX_AGE))]
+
+        @self.router.get("/", response_model=Page[${name}Response], dependencies=cached)
+        async def list_${module}(
+            cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+            limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+            order_by: str = Query("id", description="primary key or an indexed column"),
+            descending: bool = False,
+            offset: Optional[int] = Query(None, ge=0, description="fallback when no cursor is given"),
+            service: ${name}Service = Depends(get_${entity}_service),
+        ):
+            return await service.paginate(limit=limit, cursor=cursor, order_by=order_by, descending=descending, offset=offset)
+
+        @self.router.get("/export")
+        async def export_${module}(format: StreamFormat = "ndjson", order_by: str = "id", service: ${name}Service = Depends(get_${entity}_service)):
+            return stream_response(service.stream(order_by=order_by), ${name}Response, format, filename="${module}")
+
+        @self.router.get("/{id}", response_model=${name}Response, dependencies=cached)
+        async def get_${entity}(id: int, service: ${name}Service = Depends(get_${entity}_service)):
+            return await service.get_by_id(id)
+
+        @self.router.post("/", response_model=${name}Response, status_code=status.HTTP_201_CREATED)
+        async def create_${entity}(data: ${name}Create, service: ${name}Service = Depends(get_${entity}_service)):
+            return await service.create(data)
+
+        @self.router.put("/{id}", response_model=${name}Response)
+        async def update_${entity}(id: int, data: ${name}Update, service: ${name}Service = Depends(get_${entity}_service)):
+            return await service.update(id, data)
+
+        @self.router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
+        async def delete_${entity}(id: int, service: ${name}Service = Depends(get_${entity}_service)):
+            await service.delete(id)
+
@@ -0,0 +1,13 @@
+from ...utils.spec import EntitySpec
+from ..registry import render_template
+
+
+def entity_dtos_template(entity: EntitySpec) -> str:
+    name = entity.class_name
+    imports = "".join(f"{line}\n" for line in entity.py_imports)
+
+    fields = [(field.name, field.py_type, field.nullable) for field in entity.fields]
+    fields += [(f"{relation.name}_id", "int", False) for relation in entity.relations if relation.type == "many_to_one"]
+    create = "\n".join(f"    {field}: {py_type} | None = None" if nullable else f"    {field}: {py_type}" for field, py_type, nullable in fields) or "    pass"
+    update = "\n".join(f"    {field}: {py_type} | None = None" for field, py_type, _ in fields) or "    pass"
+    return render_template("modules/entity_dtos", imports=imports, name=name, create=create, update=update)
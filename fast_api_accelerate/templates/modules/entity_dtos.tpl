@@ -0,0 +1,15 @@
+${imports}from pydantic import BaseModel, ConfigDict
+
+
+class ${name}Create(BaseModel):
+$create
+
+
+class ${name}Update(BaseModel):
+$update
+
+
+class ${name}Response(${name}Create):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
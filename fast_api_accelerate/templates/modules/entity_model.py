@@ -0,0 +1,56 @@
+from ...utils.spec import EntitySpec, ProjectSpec
+from ..registry import render_template
+
+
+def _column(field) -> str:
+    options = [field.sa_type]
+    if field.nullable:
+        options.append("nullable=True")
+    if field.index:
+        options.append("index=True")
+    if field.unique:
+        options.append("unique=True")
+    py_type = f"{field.py_type} | None" if field.nullable else field.py_type
+    return f"    {field.name}: Mapped[{py_type}] = mapped_column({', '.join(options)})"
+
+
+def _model_name(entity_name: str) -> str:
+    return "".join(part.capitalize() for part in entity_name.split("_")) + "Model"
+
+
+def _relation(entity: EntitySpec, relation, spec: ProjectSpec) -> list[str]:
+    target = _model_name(relation.target)
+    options = f', back_populates="{relation.back_populates}"' if relation.back_populates else ""
+    # foreign_keys explícito: duas FKs para a mesma tabela deixariam o join ambíguo
+    if relation.type == "one_to_many":
+        options += f', foreign_keys="{target}.{relation.back_populates}_id"'
+    else:
+        options += f', foreign_keys="{_model_name(entity.name)}.{relation.name}_id"'
+    options += f', lazy="{relation.lazy}"'
+    if relation.type == "one_to_many":
+        return [f'    {relation.name}: Mapped[list["{target}"]] = relationship("{target}"{options})']
+    return [
+        f'    {relation.name}_id: Mapped[int] = mapped_column(ForeignKey("{spec.table_of(relation.target)}.id"), index=True)',
+        f'    {relation.name}: Mapped["{target}"] = relationship("{target}"{options})',
+    ]
+
+
+def entity_model_template(entity: EntitySpec, spec: ProjectSpec) -> str:
+    sa_types = sorted({field.sa_type.split("(")[0] for field in entity.fields})
+    if any(relation.type == "many_to_one" for relation in entity.relations):
+        sa_types.append("ForeignKey")
+    if entity.indexes:
+        sa_types.append("Index")
+
+    imports = entity.py_imports
+    if sa_types:
+        imports.append(f"from sqlalchemy import {', '.join(sorted(sa_types))}")
+
+    table_args = ""
+    if entity.indexes:
+        indexes = ", ".join(f'Index("ix_{entity.table}_{"_".join(columns)}", {", ".join(f'"{c}"' for c in columns)})' for columns in entity.indexes)
+        table_args = f"\n    __table_args__ = ({indexes},)"
+
+    columns = "\n".join(_column(field) for field in entity.fields)
+    relations = "".join(f"\n{line}" for relation in entity.relations for line in _relation(entity, relation, spec))
+    return render_template("modules/entity_model", imports="\n".join(imports), name=entity.class_name, table=entity.table, table_args=table_args, columns=columns, relations=relations)
@@ -0,0 +1,11 @@
+$imports
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from src.core.configs import settings
+
+
+class ${name}Model(settings.BaseDB):
+    __tablename__ = "$table"$table_args
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+$columns
+$relations
@@ -0,0 +1,9 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.base.base_repository import BaseRepository
+from src.models.${entity} import ${name}Model
+
+
+class ${name}Repository(BaseRepository[${name}Model]):
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(${name}Model, db)
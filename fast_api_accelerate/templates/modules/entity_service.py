@@ -0,0 +1,6 @@
+from ...utils.spec import EntitySpec
+from ..registry import render_template
+
+
+def entity_service_template(entity: EntitySpec) -> str:
+    return render_template("modules/entity_service", entity=entity.name, name=entity.class_name, module=entity.module, controller=entity.controller_name.removesuffix("Controller"))
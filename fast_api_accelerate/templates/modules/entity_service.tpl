@@ -0,0 +1,18 @@
+from typing import Optional
+from src.base.base_service import BaseService
+from src.base.cache import EntityCache
+from src.models.${entity} import ${name}Model
+from ..repositories import ${name}Repository
+from ..dtos import ${name}Create, ${name}Update
+
+
+class ${name}Service(BaseService[${name}Model]):
+
+    def __init__(self, repository: ${name}Repository, cache: Optional[EntityCache] = None):
+        super().__init__(repository, cache)
+
+    async def create(self, data: ${name}Create) -> ${name}Model:
+        return await super().create(data)
+
+    async def update(self, id: int, data: ${name}Update) -> ${name}Model:
+        return await super().update(id, data)
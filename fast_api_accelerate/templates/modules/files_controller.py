@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def files_controller_template() -> str:
+    return render_template("modules/files_controller")
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, File, Request, UploadFile, status
+from src.base.uploads import StoredFile, UploadStorage
+from src.core.container_ioc import get_current_user, get_upload_storage
+
+
+class FilesController:
+    """ Envio de arquivos. Os arquivos são servidos pelo mount /uploads (UploadFiles) na URL devolvida aqui. """
+
+    def __init__(self):
+        self.router = APIRouter(prefix="/files",tags=["Files"], dependencies=[Depends(get_current_user)])
+        self._register_routes()
+
+    def _register_routes(self):
+
+        @self.router.post("/", response_model=StoredFile, status_code=status.HTTP_201_CREATED)
+        async def upload_file(file: UploadFile = File(...), storage: UploadStorage = Depends(get_upload_storage)):
+            return await storage.save(file)
+
+        @self.router.put("/{filename}", response_model=StoredFile, status_code=status.HTTP_201_CREATED)
+        async def stream_file(filename: str, request: Request, storage: UploadStorage = Depends(get_upload_storage)):
+            """ Corpo cru (sem multipart): vai do socket para o disco em blocos, sem passar por um temporário.
+                O `filename` da URL não define extensão nem tipo: eles vêm do Content-Type validado. """
+            storage.check_size(request.headers.get("content-length"))
+            return await storage.save_stream(request.stream(), request.headers.get("content-type"))
@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def passwords_template() -> str:
+    return render_template("modules/passwords")
@@ -0,0 +1,59 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from passlib.context import CryptContext
+
+SCHEMES = ("bcrypt", "argon2")
+
+
+class PasswordHasher:
+    """ Hash e verificação de senhas fora do event loop. bcrypt e argon2 liberam o GIL, então um pool de threads
+        limitado a `workers` executa até `workers` hashes em paralelo e os demais logins esperam na fila sem travar o loop.
+        O esquema e o custo atuais ficam no CryptContext: hashes de outro esquema ou com outro custo são marcados
+        como desatualizados (`needs_update`) e o AuthService os refaz no próximo login.
+    """
+
+    def __init__(self, scheme: str = "bcrypt", bcrypt_rounds: int = 12, argon2_time_cost: int = 3, argon2_memory_cost: int = 65536, workers: int = 4):
+        if scheme not in SCHEMES:
+            raise ValueError(f"unknown password scheme '{scheme}' (expected one of {', '.join(SCHEMES)})")
+        # o esquema atual primeiro; o outro continua aceito para verificar (e migrar) hashes antigos
+        schemes = [scheme, *(other for other in SCHEMES if other != scheme)]
+        self.context = CryptContext(schemes=schemes, deprecated="auto", bcrypt__rounds=bcrypt_rounds, argon2__time_cost=argon2_time_cost, argon2__memory_cost=argon2_memory_cost)
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password")
+        return self._executor
+
+    async def _run(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        if not password or not hashed:
+            return False
+        try:
+            return await self._run(self.context.verify, password, hashed)
+        except ValueError:
+            return False
+
+    async def dummy_verify(self) -> None:
+        """ Mesmo custo de uma verificação real: login de e-mail inexistente não responde mais rápido. """
+        await self._run(self.context.dummy_verify)
+
+    def needs_update(self, hashed: str) -> bool:
+        """ Só lê o prefixo do hash (esquema e custo), não calcula nada: pode rodar no event loop. """
+        try:
+            return self.context.needs_update(hashed)
+        except (TypeError, ValueError):
+            return False
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
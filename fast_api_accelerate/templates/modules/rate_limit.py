@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def rate_limit_template() -> str:
+    return render_template("modules/rate_limit")
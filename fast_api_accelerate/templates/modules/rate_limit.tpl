@@ -0,0 +1,276 @@
+import hashlib
+import heapq
+import logging
+import math
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Protocol, Tuple
+from fastapi import HTTPException, Request, status
+from src.base.cache import redis_client
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+RATE = re.compile(r"(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day)?s?")
+
+logger = logging.getLogger("uvicorn.error")
+
+# (chave no backend, incremento, ttl em segundos)
+Delta = Tuple[str, int, float]
+
+
+class Rate(NamedTuple):
+    limit: int
+    period: float
+
+
+def parse_rate(value: Optional[str]) -> Optional[Rate]:
+    """ "5/minute", "100/hour", "10/30seconds" ou "10/30" (segundos). Vazio ou limite 0 desliga a regra. """
+    if not value or not value.strip():
+        return None
+    match = RATE.fullmatch(value.strip().lower())
+    if match is None or not (match.group(2) or match.group(3)):
+        raise ValueError(f"Invalid rate: {value!r}")
+    limit = int(match.group(1))
+    period = int(match.group(2) or 1) * PERIODS[match.group(3) or "second"]
+    return Rate(limit, period) if limit > 0 and period > 0 else None
+
+
+class Decision(NamedTuple):
+    allowed: bool
+    remaining: int = 0
+    retry_after: float = 0.0
+    rule: Optional[str] = None
+
+
+class Counter:
+    """ Estado de uma chave: contagens da janela atual e da anterior mais os totais para relatório. """
+    __slots__ = ("window", "current", "previous", "allowed", "rejected")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.current = 0
+        self.previous = 0
+        self.allowed = 0
+        self.rejected = 0
+
+    def roll(self, window: int) -> None:
+        if window != self.window:
+            self.previous = self.current if window == self.window + 1 else 0
+            self.current = 0
+            self.window = window
+
+    def estimate(self, fraction: float) -> float:
+        # janela deslizante aproximada: a janela anterior pesa o quanto dela ainda cabe nos últimos `period` segundos
+        return self.previous * (1 - fraction) + self.current
+
+
+class RateLimitBackend(Protocol):
+    async def add(self, deltas: List[Delta]) -> List[int]: ...
+
+
+class MemoryRateLimitBackend:
+    """ Contadores em memória: compartilhados só por quem usa a mesma instância (um worker, testes). """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self.counts: Dict[str, Tuple[int, float]] = {}
+
+    async def add(self, deltas: List[Delta]) -> List[int]:
+        now = self._clock()
+        for key in [key for key, (_, expires_at) in self.counts.items() if expires_at <= now]:
+            del self.counts[key]
+        totals = []
+        for key, delta, ttl in deltas:
+            total = self.counts.get(key, (0, 0.0))[0] + delta
+            self.counts[key] = (total, now + ttl)
+            totals.append(total)
+        return totals
+
+
+class RedisRateLimitBackend:
+    """ INCRBY + EXPIRE de todas as chaves num pipeline só (uma ida ao Redis por sincronização, não por request). """
+
+    def __init__(self, client: Any, prefix: str = "ratelimit"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "ratelimit") -> "RedisRateLimitBackend":
+        return cls(redis_client(url), prefix)
+
+    async def add(self, deltas: List[Delta]) -> List[int]:
+        pipeline = self.client.pipeline(transaction=False)
+        for key, delta, ttl in deltas:
+            pipeline.incrby(f"{self.prefix}:{key}", delta)
+            pipeline.expire(f"{self.prefix}:{key}", math.ceil(ttl))
+        results = await pipeline.execute()
+        return [int(total) for total in results[0::2]]
+
+
+def build_rate_limit_backend(url: Optional[str] = None) -> Optional[RateLimitBackend]:
+    """ Sem URL cada worker conta sozinho; redis:// ou rediss:// soma as contagens de todos os workers. """
+    if url:
+        return RedisRateLimitBackend.from_url(url)
+    return None
+
+
+def client_ip(request: Request) -> str:
+    """ IP do socket; atrás de proxy rode o uvicorn com --proxy-headers e --forwarded-allow-ips para ele vir do X-Forwarded-For. """
+    return request.client.host if request.client else "unknown"
+
+
+class RateLimiter:
+    """ Limite por janela deslizante aproximada, com uma regra (Rate) por tipo de chave, ex.: {"ip": ..., "account": ...}.
+        Cada chave ocupa um Counter de cinco inteiros num OrderedDict LRU limitado a `max_keys` por regra, e a decisão
+        é local: nenhuma ida à rede no caminho da request. Uma tentativa só passa se todas as regras têm espaço, e a
+        recusada não consome o limite das outras. Com backend, os incrementos são somados entre workers a cada
+        `sync_interval` segundos; até lá cada worker pode deixar passar o que contou sozinho nesse intervalo.
+    """
+
+    def __init__(self, rules: Dict[str, Optional[Rate]], backend: Optional[RateLimitBackend] = None, max_keys: int = 100_000, sync_interval: float = 1.0, clock: Callable[[], float] = time.time):
+        self.rules = {rule: rate for rule, rate in rules.items() if rate is not None}
+        self.backend = backend
+        self.max_keys = max_keys
+        self.sync_interval = sync_interval
+        self._clock = clock
+        self._counters: Dict[str, "OrderedDict[str, Counter]"] = {rule: OrderedDict() for rule in self.rules}
+        self._unsynced: Dict[Tuple[str, str, int], int] = {}
+        self._synced_at = float("-inf")
+        self.allowed = {rule: 0 for rule in self.rules}
+        self.rejected = {rule: 0 for rule in self.rules}
+
+    async def hit(self, keys: Dict[str, Any]) -> Decision:
+        """ Conta uma tentativa para cada chave de `keys` ({regra: chave}); regras desconhecidas e chaves vazias são ignoradas. """
+        now = self._clock()
+        if self.backend is not None and now - self._synced_at >= self.sync_interval:
+            await self.sync()
+        checked: List[Tuple[str, str, Counter, int]] = []
+        blocked: List[Tuple[float, str, Counter]] = []
+        remaining = None
+        for rule, key in keys.items():
+            rate = self.rules.get(rule)
+            key = _normalize(key)
+            if rate is None or not key:
+                continue
+            window, fraction = divmod(now / rate.period, 1)
+            counter = self._counter(rule, key, int(window))
+            if self.backend is not None:
+                # toda chave vista entra na próxima sincronização (INCRBY 0 traz o total dos outros workers)
+                self._unsynced.setdefault((rule, key, int(window)), 0)
+            estimate = counter.estimate(fraction)
+            if estimate + 1 > rate.limit:
+                blocked.append((_retry_after(counter, rate, fraction), rule, counter))
+            else:
+                checked.append((rule, key, counter, int(window)))
+                left = int(rate.limit - estimate - 1)
+                remaining = left if remaining is None else min(remaining, left)
+        if blocked:
+            for _, rule, counter in blocked:
+                counter.rejected += 1
+                self.rejected[rule] += 1
+            retry_after, rule, _ = max(blocked, key=lambda item: item[0])
+            return Decision(False, 0, retry_after, rule)
+        for rule, key, counter, window in checked:
+            counter.current += 1
+            counter.allowed += 1
+            self.allowed[rule] += 1
+            if self.backend is not None:
+                self._unsynced[(rule, key, window)] += 1
+        return Decision(True, remaining or 0)
+
+    async def enforce(self, keys: Dict[str, Any]) -> Decision:
+        """ Como `hit`, mas acima do limite levanta 429 com Retry-After (segundos até a próxima tentativa passar). """
+        decision = await self.hit(keys)
+        if not decision.allowed:
+            raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="Too many attempts, try again later", headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))})
+        return decision
+
+    async def sync(self) -> None:
+        """ Envia os incrementos locais e adota os totais de todos os workers para as chaves vistas aqui desde a última.
+            Backend fora do ar não derruba o login: os incrementos voltam para a fila e o limite segue local.
+        """
+        self._synced_at = self._clock()
+        if not self._unsynced:
+            return
+        pending, self._unsynced = self._unsynced, {}
+        items = list(pending.items())
+        deltas = [(f"{rule}:{_digest(key)}:{window}", delta, 2 * self.rules[rule].period) for (rule, key, window), delta in items]
+        try:
+            totals = await self.backend.add(deltas)
+        except Exception as exc:
+            logger.warning("Rate limit sync failed: %r", exc)
+            for item, delta in items:
+                self._unsynced[item] = self._unsynced.get(item, 0) + delta
+            return
+        for ((rule, key, window), _), total in zip(items, totals):
+            counter = self._counters[rule].get(key)
+            if counter is None:
+                continue
+            # incrementos feitos durante o await já estão em _unsynced e continuam valendo localmente
+            if counter.window == window:
+                counter.current = max(counter.current, total + self._unsynced.get((rule, key, window), 0))
+            elif counter.window == window + 1:
+                counter.previous = max(counter.previous, total)
+
+    def counters(self, rule: str, key: Any) -> Optional[Dict[str, int]]:
+        counter = self._counters.get(rule, {}).get(_normalize(key))
+        if counter is None:
+            return None
+        return {"current": counter.current, "previous": counter.previous, "allowed": counter.allowed, "rejected": counter.rejected}
+
+    def stats(self, top: int = 10) -> Dict[str, Dict[str, Any]]:
+        """ Totais por regra e as `top` chaves mais recusadas, para o endpoint de administração. """
+        report = {}
+        for rule, rate in self.rules.items():
+            counters = self._counters[rule]
+            offenders = heapq.nlargest(top, counters.items(), key=lambda item: (item[1].rejected, item[1].current))
+            report[rule] = {
+                "limit": rate.limit,
+                "period": rate.period,
+                "allowed": self.allowed[rule],
+                "rejected": self.rejected[rule],
+                "keys": len(counters),
+                "top": [{"key": key, **self.counters(rule, key)} for key, counter in offenders if counter.rejected or counter.current],
+            }
+        return report
+
+    def _counter(self, rule: str, key: str, window: int) -> Counter:
+        counters = self._counters[rule]
+        counter = counters.get(key)
+        if counter is None:
+            counter = counters[key] = Counter(window)
+            if len(counters) > self.max_keys:
+                self._evict(counters, window)
+        else:
+            counters.move_to_end(key)
+            counter.roll(window)
+        return counter
+
+    def _evict(self, counters: "OrderedDict[str, Counter]", window: int) -> None:
+        # chaves paradas há duas janelas já estimam zero; se não bastar, sai o LRU até 90% do limite,
+        # para a varredura não se repetir a cada chave nova durante um ataque de muitos IPs
+        for key in [key for key, counter in counters.items() if counter.window < window - 1]:
+            del counters[key]
+        while len(counters) > self.max_keys * 0.9:
+            counters.popitem(last=False)
+
+
+def _normalize(key: Any) -> str:
+    if key is None:
+        return ""
+    return str(getattr(key, "value", key)).strip().lower()
+
+
+def _digest(key: str) -> str:
+    # e-mails e IPs não vão em claro para o Redis
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def _retry_after(counter: Counter, rate: Rate, fraction: float) -> float:
+    """ Segundos até a estimativa da janela deslizante abrir espaço para mais uma tentativa. """
+    if counter.current + 1 <= rate.limit and counter.previous > 0:
+        needed = 1 - (rate.limit - 1 - counter.current) / counter.previous
+        return max(0.0, (needed - fraction) * rate.period)
+    # a janela atual já está cheia: na próxima ela vira a anterior e precisa perder peso
+    needed = 1 - (rate.limit - 1) / counter.current if counter.current else 0.0
+    return (1 - fraction) * rate.period + max(0.0, needed) * rate.period
@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def revocation_template() -> str:
+    return render_template("modules/revocation")
@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def tokens_template() -> str:
+    return render_template("modules/tokens")
@@ -0,0 +1,66 @@
+import hashlib
+import time
+from typing import Any, Callable, Dict, Optional
+from fastapi import HTTPException, status
+from jose import JWTError, jwt
+from src.base.cache import MemoryCache
+from src.modules.auth.utils.revocation import RevocationList
+
+
+class TokenVerifier:
+    """ Decodifica e valida JWTs sem tocar no banco. Claims já verificados ficam num LRU limitado, indexados pelo
+        sha256 do token e válidos até o `exp` do próprio token: o mesmo token em requests seguidas não refaz
+        a checagem de assinatura. Tokens inválidos nunca entram no cache. A revogação (jti) é conferida a cada chamada,
+        inclusive nos acertos do cache.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str = "HS256", max_size: int = 10_000, clock: Callable[[], float] = time.time, revocations: Optional[RevocationList] = None):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self._clock = clock
+        self.revocations = revocations or RevocationList(clock=clock)
+        self.cache = MemoryCache(max_size=max_size, clock=clock)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+        except JWTError:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
+
+    async def verify(self, token: str, token_type: Optional[str] = None) -> Dict[str, Any]:
+        """ Claims do token (cópia); com `token_type` recusa tokens de outro tipo, ex.: refresh usado como access. """
+        key = self.digest(token)
+        claims = await self.cache.get(key)
+        if claims is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            claims = self.decode(token)
+            expires = claims.get("exp")
+            if isinstance(expires, (int, float)) and expires > self._clock():
+                await self.cache.set(key, claims, expires - self._clock())
+        if token_type is not None and claims.get("type") != token_type:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
+        if await self.revocations.is_revoked(claims.get("jti")):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
+        return dict(claims)
+
+    async def revoke(self, token: str) -> Dict[str, Any]:
+        """ Revoga o token até o seu exp e o tira do cache. Devolve os claims (401 se o token já era inválido). """
+        claims = self.decode(token)
+        await self.revocations.revoke(claims.get("jti"), claims.get("exp"))
+        await self.forget(token)
+        return claims
+
+    async def forget(self, token: str) -> None:
+        await self.cache.delete(self.digest(token))
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.cache), "hit_ratio": self.hits / lookups if lookups else 0.0}
@@ -1,37 +1,22 @@
-def user_model_template()-> str:
-    return """from sqlalchemy import String, Integer, ForeignKey, ARRAY
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from src.core.configs import settings
-from sqlalchemy import Enum
-from enum import Enum as PyEnum
-
-class UserStatus(PyEnum):
-    ACTIVE = "active"
-    INACTIVE = "inactive"
-    BLOCKED = "blocked"
-
-class UserModel(settings.BaseDB):
-    __tablename__ = "tb_users"
-
-    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    username: Mapped[str] = mapped_column(String(100))
-    email: Mapped[str] = mapped_column(String(100))
-    password: Mapped[str] = mapped_column(String(100))
-    imagem: Mapped[str | None] = mapped_column(String(100), nullable=True)
-    status: Mapped[UserStatus] = mapped_column(Enum(UserStatus),default=UserStatus.ACTIVE,nullable=False)
-
-    # ARRAY no postgres funciona normal
-    roles: Mapped[list[str] | None] = mapped_column(ARRAY(String), nullable=True)
-
-    # NOVO: relacionamento 1:N com Comment
-    comments: Mapped[list["CommentModel"]] = relationship("CommentModel", back_populates="user", cascade="all, delete-orphan")
-
-    # NOVO: relacionamento 1:N com Post
-    posts: Mapped[list["PostModel"]] = relationship("PostModel", back_populates="user", cascade="all, delete-orphan")
-
-    def get_roles(self):
-        return self.roles or []
-
-    def set_roles(self, roles: list[str]):
-        self.roles = roles
-"""
\ No newline at end of file
+from typing import Optional
+from ...utils.spec import ProjectSpec
+from ..registry import render_template
+
+
+def _collections(spec: Optional[ProjectSpec]) -> str:
+    """ Coleções 1:N do UserModel: uma para cada many_to_one do spec que aponta para `user` com back_populates.
+        Sem spec não há nenhuma, então o app gerado sobe sem models que não existem.
+    """
+    lines = []
+    for entity in spec.entities if spec else []:
+        for relation in entity.relations:
+            if relation.type == "many_to_one" and relation.target == "user" and relation.back_populates:
+                model = f"{entity.class_name}Model"
+                lines.append(f'    {relation.back_populates}: Mapped[list["{model}"]] = relationship("{model}", back_populates="{relation.name}", foreign_keys="{model}.{relation.name}_id", cascade="all, delete-orphan", lazy="raise")')
+    if not lines:
+        return ""
+    return "\n    # lazy=\"raise\": acesso sem selectinload/joinedload falha na hora em vez de disparar um SELECT por linha (N+1)\n" + "\n".join(lines) + "\n"
+
+
+def user_model_template(spec: Optional[ProjectSpec] = None) -> str:
+    return render_template("modules/user_model", relations=_collections(spec))
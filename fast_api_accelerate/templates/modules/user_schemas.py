@@ -1,19 +1,5 @@
-def user_schemas_template()-> str:
-    return """from pydantic import BaseModel, EmailStr
-
-    class RegisterDTO(BaseModel):
-        email: EmailStr
-        password: str
-
+from ..registry import render_template
 
-    class LoginDTO(BaseModel):
-        email: EmailStr
-        password: str
 
-
-    class TokenResponseDTO(BaseModel):
-        access_token: str
-        refresh_token: str | None = None
-        token_type: str = "bearer"
-
-"""
\ No newline at end of file
+def user_schemas_template()-> str:
+    return render_template("modules/user_schemas")
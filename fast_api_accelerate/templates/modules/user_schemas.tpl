@@ -0,0 +1,17 @@
+from pydantic import BaseModel, EmailStr
+
+    class RegisterDTO(BaseModel):
+        email: EmailStr
+        password: str
+
+
+    class LoginDTO(BaseModel):
+        email: EmailStr
+        password: str
+
+
+    class TokenResponseDTO(BaseModel):
+        access_token: str
+        refresh_token: str | None = None
+        token_type: str = "bearer"
+
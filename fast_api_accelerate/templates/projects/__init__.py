@@ -11,8 +11,18 @@ from .startup import startup_template
 from .base_service import base_service_template
 from .base_repository import base_repository_template
 from .all_models import all_models_template
+from .pagination import pagination_template
+from .streaming import streaming_template
+from .loading import loading_template
+from .query_counter import query_counter_template
+from .cache import cache_template
+from .routing import routing_template
+from .serialization import serialization_template
+from .uploads import uploads_template
+from .http_cache import http_cache_template
+from .metrics import metrics_template
 
 __all__ = ["config_database_template","main_project_template","setup_db_template",
 "readme_template","main_project_template","pyproject_template","base_service_template",
-"base_repository_template","all_models_template","config_conection_template","config_container_ioc_template","startup_template"
+"base_repository_template","pagination_template","streaming_template","loading_template","query_counter_template","cache_template","routing_template","serialization_template","uploads_template","http_cache_template","metrics_template","all_models_template","config_conection_template","config_container_ioc_template","startup_template"
 ]
\ No newline at end of file
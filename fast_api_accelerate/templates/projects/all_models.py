@@ -1,6 +1,6 @@
-def all_models_template() -> str:
-    return """from src.models.user import UserModel 
+from ..registry import render_template
 
-# alll model includes models many to many associations  examples: from src.models.post_category import post_category_association
 
-"""
\ No newline at end of file
+def all_models_template(entities: list = []) -> str:
+    models = "".join(f"from src.models.{entity.name} import {entity.class_name}Model\n" for entity in entities)
+    return render_template("projects/all_models", models=models)
@@ -0,0 +1,4 @@
+from src.models.user import UserModel 
+$models
+# alll model includes models many to many associations  examples: from src.models.post_category import post_category_association
+
@@ -0,0 +1,247 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, inspect, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import make_transient_to_detached
+from typing import Any, AsyncIterator, Dict, Iterator, Sequence, Type, TypeVar, Generic, List, Optional, Tuple
+from datetime import date, datetime
+from enum import Enum
+from src.base.loading import LoadSpec, load_options
+from src.base.pagination import DEFAULT_PAGE_SIZE, CursorError, clamp_limit, decode_cursor, encode_cursor
+from src.base.routing import failover, reading
+
+T = TypeVar("T")
+
+class BaseRepository(Generic[T]):
+    # linhas por lote nas operações em massa (sobrescreva na subclasse ou por chamada)
+    batch_size: int = 1000
+    # relacionamentos carregados em toda leitura quando a chamada não passa `load` (ex.: {"user": "joined"})
+    default_load: LoadSpec = {}
+
+    def __init__(self, model: Type[T], db: AsyncSession):
+        self.model = model
+        self.db = db
+
+    def _select(self, load: Optional[LoadSpec] = None):
+        """ SELECT do model com o spec de carregamento: `load` da chamada ou `default_load` da classe. """
+        return select(self.model).options(*load_options(self.model, self.default_load if load is None else load))
+
+    async def _read(self, query, stream: bool = False):
+        """ Executa uma leitura que pode ir para uma réplica (ver src/base/routing.py). Se a réplica cair,
+            ela sai de rotação e a leitura é repetida na próxima réplica saudável ou no primário.
+        """
+        execute = self.db.stream_scalars if stream else self.db.execute
+        while True:
+            try:
+                with reading(self.db):
+                    return await execute(query)
+            except Exception as error:
+                if not failover(self.db, error):
+                    raise
+
+    async def get_all(self, load: Optional[LoadSpec] = None) -> List[T]:
+        result = await self._read(self._select(load))
+        return result.scalars().unique().all()
+
+    async def paginate(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, order_by: str = "id", descending: bool = False, offset: Optional[int] = None, load: Optional[LoadSpec] = None) -> Tuple[List[T], Optional[str]]:
+        """ Paginação keyset em (order_by, id): cada página continua de onde o cursor parou, sem OFFSET.
+            `offset` só é usado sem cursor, como alternativa para quem precisa pular direto para uma posição.
+        """
+        limit = clamp_limit(limit)
+        column = self._sort_column(order_by)
+        columns = [column] if column is self.model.id else [column, self.model.id]
+
+        query = self._select(load)
+        if cursor:
+            values = decode_cursor(cursor, order_by, descending)
+            if len(values) != len(columns):
+                raise CursorError("cursor does not match the requested ordering")
+            position, last = tuple_(*columns), tuple_(*(self._coerce(c, v) for c, v in zip(columns, values)))
+            query = query.where(position < last if descending else position > last)
+        elif offset:
+            query = query.offset(offset)
+        query = query.order_by(*(c.desc() if descending else c.asc() for c in columns)).limit(limit + 1)
+
+        items = list((await self._read(query)).scalars().unique().all())
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        return items, encode_cursor(order_by, descending, [getattr(items[-1], c.key) for c in columns])
+
+    def stream(self, order_by: str = "id", yield_per: Optional[int] = None, load: Optional[LoadSpec] = None) -> AsyncIterator[T]:
+        """ Percorre a tabela inteira por cursor no servidor (`AsyncSession.stream` + `yield_per`):
+            só um lote de `yield_per` entidades fica em memória. A coluna é validada aqui, antes da primeira linha.
+        """
+        query = self._select(load).order_by(self._sort_column(order_by)).execution_options(yield_per=yield_per or self.batch_size)
+        return self._stream(query)
+
+    async def _stream(self, query) -> AsyncIterator[T]:
+        result = await self._read(query, stream=True)
+        try:
+            async for entity in result:
+                yield entity
+        finally:
+            await result.close()
+
+    def _sort_column(self, name: str):
+        """ Só chave primária ou colunas indexadas NOT NULL: sem índice o keyset vira full scan, e NULL quebra a comparação. """
+        table = self.model.__table__
+        column = table.columns.get(name)
+        leading = {next(iter(index.columns)).name for index in table.indexes if len(index.columns)}
+        if column is None or column.nullable or not (column.primary_key or column.index or column.unique or name in leading):
+            raise ValueError(f"{self.model.__name__} cannot be sorted by '{name}': use the primary key or an indexed, non-null column")
+        return getattr(self.model, name)
+
+    @staticmethod
+    def _coerce(column, value: Any) -> Any:
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+        try:
+            if python_type in (datetime, date) and isinstance(value, str):
+                return python_type.fromisoformat(value)
+            return value if value is None or isinstance(value, (python_type, list, dict)) else python_type(value)
+        except (TypeError, ValueError):
+            raise CursorError("invalid cursor") from None
+
+    def to_row(self, entity: T) -> Dict[str, Any]:
+        """ Colunas da entidade em tipos serializáveis (usado pelo cache do BaseService). """
+        row = {}
+        for attribute in inspect(self.model).column_attrs:
+            value = getattr(entity, attribute.key)
+            row[attribute.key] = value.value if isinstance(value, Enum) else value
+        return row
+
+    async def from_row(self, row: Dict[str, Any]) -> T:
+        """ Reconstrói a entidade a partir de `to_row` e a anexa à sessão sem SELECT (merge com load=False),
+            então ela pode ser alterada e salva como uma entidade lida do banco.
+        """
+        attributes = {attribute.key: attribute.columns[0] for attribute in inspect(self.model).column_attrs}
+        entity = self.model(**{key: self._coerce(attributes[key], value) for key, value in row.items() if key in attributes})
+        make_transient_to_detached(entity)
+        return await self.db.merge(entity, load=False)
+
+    async def get_by_id(self, id: int, load: Optional[LoadSpec] = None) -> Optional[T]:
+        result = await self._read(self._select(load).filter(self.model.id == id))
+        return result.scalars().unique().first()
+
+    async def get_by_field(self, field_name: str, value, load: Optional[LoadSpec] = None):
+        field = getattr(self.model, field_name, None)
+
+        if not field:
+            raise AttributeError(f"{self.model.__name__} has no field '{field_name}'")
+
+        result = await self._read(self._select(load).filter(field == value))
+        return result.scalars().unique().first()
+
+    async def create(self, entity: T) -> T:
+        self.db.add(entity)
+        await self.db.commit()
+        await self.db.refresh(entity)
+        return entity
+    
+    async def get_for_write(self, id: int) -> Optional[T]:
+        """ Entidade lida no primário (fora de `reading`) e recarregada mesmo que já esteja na sessão: base de update/delete
+            e do que entra no cache de entidades. Uma réplica atrasada não transforma um update logo após o create em 404,
+            não grava em cima de um estado velho e não põe no cache a linha de antes da escrita.
+        """
+        return await self.db.get(self.model, id, populate_existing=True)
+
+    async def delete(self, id: int) -> bool:
+        entity = await self.get_for_write(id)
+        if not entity:
+            return False
+        await self.db.delete(entity)
+        await self.db.commit()
+        return True
+    
+    async def update(self, entity: T) -> T:
+        await self.db.commit()
+        await self.db.refresh(entity)
+        return entity
+
+    async def bulk_create(self, items: Sequence[T | Dict[str, Any]], returning: Optional[Sequence[str]] = None, batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """ INSERT em lotes (executemany / insertmanyvalues) e um único commit, em vez de add+commit+refresh por entidade.
+            `returning` escolhe as colunas devolvidas de cada linha inserida, ex.: ["id"].
+        """
+        statement = insert(self.model)
+        if returning:
+            statement = statement.returning(*self._columns(returning))
+        return await self._execute_batches(statement, self._rows(items), returning, batch_size)
+
+    async def bulk_update(self, items: Sequence[T | Dict[str, Any]], batch_size: Optional[int] = None) -> int:
+        """ UPDATE em lotes pela chave primária: cada linha precisa do `id` e só as colunas presentes são alteradas.
+            Devolve quantas linhas foram de fato atualizadas. O asyncpg não informa rowcount em executemany, então cada
+            lote trava (SELECT ... FOR UPDATE) os ids que existem e só as linhas deles vão para o UPDATE.
+        """
+        rows = self._rows(items)
+        if any(row.get("id") is None for row in rows):
+            raise ValueError("bulk_update requires the primary key 'id' in every row")
+        updated = 0
+        try:
+            for batch in self._batches(rows, batch_size or self.batch_size):
+                existing = set((await self.db.scalars(select(self.model.id).where(self.model.id.in_([row["id"] for row in batch])).with_for_update())).all())
+                matched = [row for row in batch if row["id"] in existing]
+                if matched:
+                    await self.db.execute(update(self.model), matched)
+                updated += len(matched)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        return updated
+
+    async def upsert(self, items: Sequence[T | Dict[str, Any]], conflict: Sequence[str] = ("id",), update_columns: Optional[Sequence[str]] = None, returning: Optional[Sequence[str]] = None, batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """ INSERT ... ON CONFLICT (PostgreSQL) em lotes. Sem `update_columns` atualiza todas as colunas enviadas fora de `conflict`;
+            com `update_columns=[]` vira ON CONFLICT DO NOTHING.
+        """
+        rows = self._rows(items)
+        if not rows:
+            return []
+        statement = pg_insert(self.model)
+        if update_columns is None:
+            update_columns = [key for key in rows[0] if key not in conflict]
+        if update_columns:
+            statement = statement.on_conflict_do_update(index_elements=list(conflict), set_={key: statement.excluded[key] for key in update_columns})
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=list(conflict))
+        if returning:
+            statement = statement.returning(*self._columns(returning))
+        return await self._execute_batches(statement, rows, returning, batch_size)
+
+    async def _execute_batches(self, statement, rows: List[Dict[str, Any]], returning: Optional[Sequence[str]], batch_size: Optional[int]) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        try:
+            for batch in self._batches(rows, batch_size or self.batch_size):
+                result = await self.db.execute(statement, batch)
+                if returning:
+                    results.extend(dict(row) for row in result.mappings())
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        return results
+
+    @staticmethod
+    def _batches(rows: List[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+        for start in range(0, len(rows), size):
+            yield rows[start:start + size]
+
+    def _rows(self, items: Sequence[T | Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """ Aceita dicts ou instâncias do model. De instâncias saem só as colunas atribuídas: as não definidas ficam fora
+            da linha, para valerem os defaults do model e do banco (e o `id` ainda não gerado), em vez de um NULL explícito.
+        """
+        keys = {attribute.key for attribute in inspect(self.model).column_attrs}
+        rows = []
+        for item in items:
+            if isinstance(item, dict):
+                rows.append(item)
+            else:
+                rows.append({key: value for key, value in vars(item).items() if key in keys and not (key == "id" and value is None)})
+        return rows
+
+    def _columns(self, names: Sequence[str]) -> list:
+        try:
+            return [self.model.__table__.columns[name] for name in names]
+        except KeyError as error:
+            raise ValueError(f"{self.model.__name__} has no column {error}") from None
@@ -0,0 +1,110 @@
+from typing import Any, AsyncIterator, Dict, Generic, TypeVar, List, Optional, Sequence
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from src.base.cache import MISSING, EntityCache
+from src.base.loading import LoadSpec
+from src.base.pagination import DEFAULT_PAGE_SIZE, Page, clamp_limit
+
+T = TypeVar("T")
+
+class BaseService(Generic[T]):
+    """ Regras comuns dos serviços. Com um `EntityCache`, `get_by_id` é read-through e create/update/delete
+        (também os métodos em massa) invalidam as entradas afetadas; sem cache tudo vai direto ao repository.
+    """
+
+    def __init__(self, repository, cache: Optional[EntityCache] = None):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_all(self, load: Optional[LoadSpec] = None) -> List[T]:
+        return await self.repository.get_all(load=load)
+
+    async def paginate(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, order_by: str = "id", descending: bool = False, offset: Optional[int] = None, load: Optional[LoadSpec] = None) -> Page[T]:
+        try:
+            items, next_cursor = await self.repository.paginate(limit=limit, cursor=cursor, order_by=order_by, descending=descending, offset=offset, load=load)
+        except ValueError as error:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+        return Page(items=items, next_cursor=next_cursor, limit=clamp_limit(limit))
+
+    def stream(self, order_by: str = "id", load: Optional[LoadSpec] = None) -> AsyncIterator[T]:
+        try:
+            return self.repository.stream(order_by=order_by, load=load)
+        except ValueError as error:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+
+    async def find_by_id(self, id: int, load: Optional[LoadSpec] = None) -> Optional[T]:
+        """ Como `get_by_id`, mas devolve None em vez de 404. Com `load` o cache é ignorado (ele só guarda colunas). """
+        if self.cache is None or load:
+            return await self.repository.get_by_id(id, load=load)
+        cached = await self.cache.get(id)
+        if cached is MISSING:
+            return None
+        if cached is not None:
+            return await self.repository.from_row(cached)
+        # a falta é preenchida pelo primário: uma réplica atrasada devolveria ao cache a linha de antes de um
+        # create/update (por CACHE_TTL) ou um "não existe" (por CACHE_NEGATIVE_TTL)
+        entity = await self.repository.get_for_write(id)
+        if entity is None:
+            await self.cache.set_missing(id)
+        else:
+            await self.cache.set(id, self.repository.to_row(entity))
+        return entity
+
+    async def get_by_id(self, id: int, load: Optional[LoadSpec] = None) -> T:
+        entity = await self.find_by_id(id, load=load)
+        if not entity:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"entity with this id {id} not found")
+        return entity
+
+    async def create(self, data: BaseModel | Dict[str, Any]) -> T:
+        entity = await self.repository.create(self.repository.model(**self._dump([data])[0]))
+        await self.invalidate(entity.id)
+        return entity
+
+    async def update(self, id: int, data: BaseModel | Dict[str, Any]) -> T:
+        # sem cache e sem réplica: a alteração parte do estado atual do primário
+        entity = await self.repository.get_for_write(id)
+        if entity is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"entity with this id {id} not found")
+        for field, value in self._dump([data], exclude_unset=True)[0].items():
+            setattr(entity, field, value)
+        entity = await self.repository.update(entity)
+        await self.invalidate(id)
+        return entity
+
+    async def delete(self, id: int) -> None:
+        deleted = await self.repository.delete(id)
+        await self.invalidate(id)
+        if not deleted:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"entity with this id {id} not found")
+
+    async def invalidate(self, *ids: Any) -> None:
+        """ Remove as entidades do cache; chame após alterar a tabela por fora do serviço. """
+        if self.cache is not None and ids:
+            await self.cache.invalidate(*ids)
+
+    async def bulk_create(self, items: Sequence[BaseModel | Dict[str, Any]], returning: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        rows = await self.repository.bulk_create(self._dump(items), returning=self._returning_ids(returning))
+        await self.invalidate(*(row["id"] for row in rows))
+        return rows
+
+    async def bulk_update(self, items: Sequence[BaseModel | Dict[str, Any]]) -> int:
+        rows = self._dump(items, exclude_unset=True)
+        updated = await self.repository.bulk_update(rows)
+        await self.invalidate(*(row["id"] for row in rows))
+        return updated
+
+    async def upsert(self, items: Sequence[BaseModel | Dict[str, Any]], conflict: Sequence[str] = ("id",), returning: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        rows = await self.repository.upsert(self._dump(items), conflict=conflict, returning=self._returning_ids(returning))
+        await self.invalidate(*(row["id"] for row in rows))
+        return rows
+
+    def _returning_ids(self, returning: Optional[Sequence[str]]) -> Optional[Sequence[str]]:
+        """ Com cache, o RETURNING inclui o id para saber o que invalidar (inclusive entradas do cache negativo). """
+        if self.cache is None:
+            return returning
+        return ["id", *(column for column in returning or [] if column != "id")]
+
+    @staticmethod
+    def _dump(items: Sequence[BaseModel | Dict[str, Any]], exclude_unset: bool = False) -> List[Dict[str, Any]]:
+        return [item.model_dump(exclude_unset=exclude_unset) if isinstance(item, BaseModel) else item for item in items]
@@ -0,0 +1,138 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple
+
+# marcador gravado no lugar da entidade quando o id não existe (cache negativo)
+NEGATIVE = "\x00missing"
+
+
+class _Missing:
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[str]: ...
+    async def set(self, key: str, value: str, ttl: float) -> None: ...
+    async def delete(self, *keys: str) -> None: ...
+
+
+class MemoryCache:
+    """ Backend em processo: TTL por chave e LRU limitado a `max_size` entradas. Cada worker tem o seu. """
+
+    def __init__(self, max_size: int = 10_000, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self._clock = clock
+        self._data: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= self._clock():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        self._data[key] = (self._clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def redis_client(url: str) -> Any:
+    try:
+        from redis.asyncio import Redis
+    except ImportError:
+        raise RuntimeError("redis:// URLs require the redis package: uv add redis") from None
+    return Redis.from_url(url, decode_responses=True)
+
+
+class RedisCache:
+    """ Backend compartilhado entre workers. Aceita qualquer cliente assíncrono com o protocolo do Redis
+        (`redis.asyncio.Redis`, um fake local nos testes): get, set(..., px=) e delete.
+    """
+
+    def __init__(self, client: Any, prefix: str = "cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "cache:") -> "RedisCache":
+        return cls(redis_client(url), prefix)
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self.client.get(self.prefix + key)
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await self.client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+
+def build_cache_backend(url: Optional[str] = None, max_size: int = 10_000) -> CacheBackend:
+    """ Sem URL usa o cache em memória; redis:// ou rediss:// usa o RedisCache. """
+    if url:
+        return RedisCache.from_url(url)
+    return MemoryCache(max_size=max_size)
+
+
+class EntityCache:
+    """ Cache read-through de entidades por id. Guarda as colunas em JSON (nunca o objeto ORM, que é da sessão)
+        e ids inexistentes por `negative_ttl` segundos, para que ids inválidos repetidos não voltem ao banco.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str, ttl: float = 60, negative_ttl: float = 5):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def _key(self, id: Any) -> str:
+        return f"{self.namespace}:{id}"
+
+    async def get(self, id: Any) -> Optional[Dict[str, Any]] | _Missing:
+        """ Colunas da entidade, MISSING se o id sabidamente não existe, ou None se não está no cache. """
+        raw = await self.backend.get(self._key(id))
+        if raw is None:
+            self.misses += 1
+            return None
+        if raw == NEGATIVE:
+            self.negative_hits += 1
+            return MISSING
+        self.hits += 1
+        return json.loads(raw)
+
+    async def set(self, id: Any, row: Dict[str, Any]) -> None:
+        await self.backend.set(self._key(id), json.dumps(row, default=str), self.ttl)
+
+    async def set_missing(self, id: Any) -> None:
+        if self.negative_ttl > 0:
+            await self.backend.set(self._key(id), NEGATIVE, self.negative_ttl)
+
+    async def invalidate(self, *ids: Any) -> None:
+        await self.backend.delete(*(self._key(id) for id in ids))
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {"hits": self.hits, "negative_hits": self.negative_hits, "misses": self.misses, "hit_ratio": (self.hits + self.negative_hits) / lookups if lookups else 0.0}
@@ -0,0 +1,103 @@
+import asyncio
+from contextlib import AsyncExitStack
+from typing import Any, AsyncGenerator, Dict, Optional, Sequence
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from src.base.routing import ReplicaSet, RoutingSession
+from .configs import settings
+
+
+class Database:
+    """ Dono dos engines da aplicação: o primário e as réplicas de leitura (DB_REPLICA_URLS).
+        O startup chama connect() e o shutdown dispose(); scripts e testes criam os mesmos engines sob demanda.
+        `url`, `replica_urls` e `options` sobrescrevem as configurações (ex.: dois bancos locais nos testes).
+    """
+
+    def __init__(self, url: Optional[str] = None, replica_urls: Optional[Sequence[str]] = None, options: Optional[Dict[str, Any]] = None):
+        self.url = url
+        self.replica_urls = replica_urls
+        self.options = options
+        self.engine: Optional[AsyncEngine] = None
+        self.replicas = ReplicaSet([])
+        self._session_factory: Optional[async_sessionmaker] = None
+        self._read_session_factory: Optional[async_sessionmaker] = None
+
+    def connect(self) -> AsyncEngine:
+        if self.engine is None:
+            options = settings.engine_options() if self.options is None else self.options
+            replica_urls = settings.DB_REPLICA_URLS if self.replica_urls is None else self.replica_urls
+            self.engine = create_async_engine(self.url or settings.DB_URL, **options)
+            self.replicas = ReplicaSet([create_async_engine(url, **options) for url in replica_urls], retry_after=settings.DB_REPLICA_RETRY_AFTER)
+            self._session_factory = async_sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False, class_=AsyncSession)
+            self._read_session_factory = self._session_factory
+            if self.replicas:
+                self._read_session_factory = async_sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False, class_=AsyncSession, sync_session_class=RoutingSession, replicas=self.replicas, sticky=settings.DB_READ_YOUR_WRITES)
+        return self.engine
+
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        """ Sessões só no primário (scripts, migrações, jobs que leem e escrevem em sequência). """
+        self.connect()
+        return self._session_factory
+
+    @property
+    def read_session_factory(self) -> async_sessionmaker:
+        """ Sessões das requests: as leituras do BaseRepository vão para as réplicas, as escritas para o primário.
+            Sem réplicas é a mesma fábrica de `session_factory`.
+        """
+        self.connect()
+        return self._read_session_factory
+
+    async def check_replicas(self) -> int:
+        """ Health check: tira de rotação as réplicas que não respondem e devolve quantas estão saudáveis. """
+        self.connect()
+        return await self.replicas.check()
+
+    async def warm_up(self, connections: int) -> int:
+        """ Abre `connections` conexões do primário ao mesmo tempo, roda SELECT 1 em cada e as devolve abertas ao pool:
+            as primeiras requests não pagam conexão, TLS e autenticação. Limitado ao pool_size (sem fila no overflow);
+            pools sem tamanho (NullPool, StaticPool) não guardam conexões e não são aquecidos. Devolve quantas responderam.
+        """
+        engine = self.connect()
+        size = getattr(engine.pool, "size", None)
+        connections = min(connections, size()) if size else 0
+        async with AsyncExitStack() as stack:
+            async def ping() -> None:
+                # todas ficam em uso até o fim do bloco, senão o pool reaproveitaria a mesma conexão
+                connection = await stack.enter_async_context(engine.connect())
+                await connection.execute(text("SELECT 1"))
+
+            results = await asyncio.gather(*(ping() for _ in range(connections)), return_exceptions=True)
+        return sum(1 for result in results if not isinstance(result, BaseException))
+
+    async def dispose(self) -> None:
+        if self.engine is not None:
+            await self.replicas.dispose()
+            await self.engine.dispose()
+            self.engine = None
+            self.replicas = ReplicaSet([])
+            self._session_factory = None
+            self._read_session_factory = None
+
+
+database = Database()
+
+
+# Dependência para injetar sessão no FastAPI
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    async with database.read_session_factory() as session:
+        yield session
+
+
+# Criando tabelas no banco de dados
+async def create_tables() -> None:
+    import src.models.__all_models  # Importa todos os modelos antes de criar as tabelas
+
+    print("Criando tabelas no banco de dados...")
+
+    async with database.connect().begin() as conn:
+        await conn.run_sync(settings.BaseDB.metadata.drop_all)
+        await conn.run_sync(settings.BaseDB.metadata.create_all)
+
+    await database.dispose()
+    print("Tabelas criadas com sucesso!")
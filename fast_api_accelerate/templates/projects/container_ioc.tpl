@@ -0,0 +1,105 @@
+from typing import AsyncGenerator, Dict, Optional
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from starlette.datastructures import Headers
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.configs import settings
+from src.core.database import database
+from src.base.cache import EntityCache, build_cache_backend
+from src.base.http_cache import ResponseCache
+from src.base.uploads import UploadStorage
+from src.modules.users.repositories import UserRepository
+from src.modules.users.services import UserService
+from src.modules.auth.services import AuthService
+from src.modules.auth.utils import PasswordHasher, RateLimiter, RevocationList, TokenVerifier, build_rate_limit_backend, build_revocation_backend, parse_rate
+$imports
+
+bearer_scheme = HTTPBearer()
+
+# Um backend por processo (memória) ou compartilhado (CACHE_URL=redis://...); CACHE_TTL=0 desliga o cache
+cache_backend = build_cache_backend(settings.CACHE_URL, max_size=settings.CACHE_MAX_SIZE)
+
+# Caches de entidade por namespace, para as métricas de hit ratio (/metrics)
+entity_caches: Dict[str, EntityCache] = {}
+
+def entity_cache(namespace: str) -> Optional[EntityCache]:
+    if settings.CACHE_TTL <= 0:
+        return None
+    cache = entity_caches[namespace] = EntityCache(cache_backend, namespace, ttl=settings.CACHE_TTL, negative_ttl=settings.CACHE_NEGATIVE_TTL)
+    return cache
+
+user_cache = entity_cache("users")
+
+# Um pool de hashing por processo, compartilhado por todas as requests
+password_hasher = PasswordHasher(scheme=settings.PASSWORD_SCHEME, bcrypt_rounds=settings.PASSWORD_BCRYPT_ROUNDS, argon2_time_cost=settings.PASSWORD_ARGON2_TIME_COST, argon2_memory_cost=settings.PASSWORD_ARGON2_MEMORY_COST, workers=settings.PASSWORD_HASH_WORKERS)
+
+# Denylist de jti (logout): local e O(1), sincronizada entre workers pelo Redis quando há REVOCATION_URL ou CACHE_URL
+revocations = RevocationList(build_revocation_backend(settings.REVOCATION_URL or settings.CACHE_URL), capacity=settings.REVOCATION_CAPACITY, sync_interval=settings.REVOCATION_SYNC_INTERVAL)
+
+# Claims de tokens já verificados, por processo; get_current_user só depende disto (sem sessão do banco)
+token_verifier = TokenVerifier(AuthService.SECRET_KEY, AuthService.ALGORITHM, max_size=settings.TOKEN_CACHE_MAX_SIZE, revocations=revocations)
+
+def get_token_verifier() -> TokenVerifier:
+    return token_verifier
+
+# Tentativas de login/refresh por IP e conta, contadas em memória e checadas antes do hash da senha; a regra "client"
+# (um balde por tipo de cliente, compartilhado por todos os usuários) é o disjuntor global de AUTH_RATE_LIMIT_CLIENT
+auth_rate_limiter = RateLimiter({"ip": parse_rate(settings.AUTH_RATE_LIMIT_IP), "account": parse_rate(settings.AUTH_RATE_LIMIT_ACCOUNT), "client": parse_rate(settings.AUTH_RATE_LIMIT_CLIENT)}, backend=build_rate_limit_backend(settings.RATE_LIMIT_URL or settings.CACHE_URL), max_keys=settings.RATE_LIMIT_MAX_KEYS, sync_interval=settings.RATE_LIMIT_SYNC_INTERVAL)
+
+def get_auth_rate_limiter() -> RateLimiter:
+    return auth_rate_limiter
+
+# Respostas GET com max-age > 0 guardadas pelo HttpCacheMiddleware, por worker; HTTP_CACHE_MAX_SIZE=0 desliga
+response_cache = ResponseCache(settings.HTTP_CACHE_MAX_SIZE, max_bytes=settings.HTTP_CACHE_MAX_BYTES, max_entry_size=settings.HTTP_CACHE_MAX_ENTRY_SIZE) if settings.HTTP_CACHE_MAX_SIZE > 0 else None
+
+async def http_cache_principal(headers: Headers) -> Optional[str]:
+    """ Id do usuário de um access token válido (mesmo verificador de get_current_user: exp e revogação), para o
+        HttpCacheMiddleware guardar rotas autenticadas por usuário. Com HTTP_CACHE_AUTHENTICATED=false não é usado.
+    """
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        claims = await token_verifier.verify(token, token_type="access")
+    except HTTPException:
+        return None
+    return str(claims.get("id") or "") or None
+
+upload_storage = UploadStorage(settings.UPLOAD_DIR, max_size=settings.UPLOAD_MAX_SIZE, chunk_size=settings.UPLOAD_CHUNK_SIZE, allowed_types=settings.UPLOAD_ALLOWED_TYPES)
+
+def get_upload_storage() -> UploadStorage:
+    return upload_storage
+
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    async with database.read_session_factory() as session:
+        yield session
+
+#TODO: --------> todo recurso vai exigir repository e serviço
+
+def get_user_repository(db: AsyncSession = Depends(get_db_session)) -> UserRepository:
+    return UserRepository(db)
+
+def get_users_service(repository: UserRepository = Depends(get_user_repository)) -> UserService:
+    return UserService(repository)
+
+#TODO: --------> até isso aqui ref ->  get_auth_service
+$providers
+def get_auth_service(repository: UserRepository = Depends(get_user_repository)) -> AuthService:
+    return AuthService(repository, cache=user_cache, hasher=password_hasher, tokens=token_verifier)
+
+def get_token_from_header(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)) -> str:
+    return credentials.credentials
+
+async def get_current_user(token: str = Depends(get_token_from_header),verifier: TokenVerifier = Depends(get_token_verifier)):
+    return await verifier.verify(token, token_type="access")
+
+
+def role_required(allowed_roles: list[str]):
+    def dependency(current_user: dict = Depends(get_current_user)):
+        user_roles = current_user.get("roles", [])
+        if not any(role in user_roles for role in allowed_roles):
+            raise HTTPException(status_code=403, detail="Not authorization")
+        return current_user
+    return dependency
+
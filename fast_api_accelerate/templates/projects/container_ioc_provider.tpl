@@ -0,0 +1,8 @@
+
+${entity}_cache = entity_cache("${module}")
+
+def get_${entity}_repository(db: AsyncSession = Depends(get_db_session)) -> ${name}Repository:
+    return ${name}Repository(db)
+
+def get_${entity}_service(repository: ${name}Repository = Depends(get_${entity}_repository)) -> ${name}Service:
+    return ${name}Service(repository, cache=${entity}_cache)
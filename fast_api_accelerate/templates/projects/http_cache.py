@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def http_cache_template() -> str:
+    return render_template("projects/http_cache")
@@ -0,0 +1,278 @@
+import gzip
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from fastapi import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # sem o pacote brotli (uv add brotli) as respostas saem só em gzip
+    brotli = None
+
+COMPRESSIBLE = ("application/json", "application/problem+json", "application/x-ndjson", "application/javascript", "application/xml", "image/svg+xml", "text/")
+MAX_AGE = re.compile(r"max-age=(\d+)")
+RawHeaders = List[Tuple[bytes, bytes]]
+# identidade verificada de quem chama (ex.: id do usuário do access token), ou None se as credenciais não valem
+Principal = Callable[[Headers], Awaitable[Optional[str]]]
+
+
+def cache_control(max_age: int = 0, private: bool = True, no_store: bool = False, immutable: bool = False) -> Callable[[Response], None]:
+    """ Política de cache da rota, como dependência: `dependencies=[Depends(cache_control(max_age=30))]`.
+        max_age=0 vira `no-cache`: o cliente revalida sempre e o If-None-Match com o ETag recebe 304 sem corpo.
+        Com max_age > 0 o HttpCacheMiddleware também guarda a resposta e as próximas requests não chegam na rota.
+    """
+    if no_store:
+        value = "no-store"
+    else:
+        value = ", ".join(["private" if private else "public", f"max-age={max_age}" if max_age > 0 else "no-cache"] + (["immutable"] if immutable else []))
+
+    def dependency(response: Response) -> None:
+        response.headers["cache-control"] = value
+
+    return dependency
+
+
+def weak_etag(body: bytes) -> str:
+    # fraco: o mesmo conteúdo em gzip, brotli ou sem compressão é a mesma representação
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def parse_max_age(cache_control_value: Optional[str]) -> int:
+    if not cache_control_value or "no-store" in cache_control_value or "no-cache" in cache_control_value:
+        return 0
+    match = MAX_AGE.search(cache_control_value)
+    return int(match.group(1)) if match else 0
+
+
+class CachedResponse:
+    __slots__ = ("key", "headers", "body", "etag", "stored_at", "expires_at", "encoded")
+
+    def __init__(self, key: str, headers: RawHeaders, body: bytes, etag: str, stored_at: float, ttl: float):
+        self.key = key
+        self.headers = headers
+        self.body = body
+        self.etag = etag
+        self.stored_at = stored_at
+        self.expires_at = stored_at + ttl
+        self.encoded: Dict[str, bytes] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(data) for data in self.encoded.values())
+
+
+class ResponseCache:
+    """ Respostas GET 200 com max-age > 0, por worker, num LRU limitado em entradas (`max_size`) e em bytes (`max_bytes`,
+        corpo mais as versões comprimidas); corpos acima de `max_entry_size` não são guardados. Qualquer escrita
+        bem-sucedida (POST/PUT/PATCH/DELETE) descarta as respostas do mesmo recurso (primeiro segmento da URL) só neste
+        worker: nos outros elas continuam valendo até o max-age, então use max-age curto nas rotas guardadas aqui.
+    """
+
+    def __init__(self, max_size: int = 1000, max_bytes: int = 64 * 1024 * 1024, max_entry_size: int = 1024 * 1024, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.max_entry_size = max_entry_size
+        self._clock = clock
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: str, headers: RawHeaders, body: bytes, etag: str, ttl: float) -> Optional[CachedResponse]:
+        """ Guarda a resposta; corpo acima de `max_entry_size` não entra (e o que havia na chave sai). """
+        self._remove(key)
+        if len(body) > self.max_entry_size:
+            return None
+        entry = self._entries[key] = CachedResponse(key, headers, body, etag, self._clock(), ttl)
+        self.bytes += entry.size
+        self._evict()
+        return entry
+
+    def encode(self, entry: CachedResponse, encoding: str, compress: Callable[[], bytes]) -> bytes:
+        """ Versão comprimida do corpo, calculada uma vez por entrada e contada no limite de bytes. """
+        data = entry.encoded.get(encoding)
+        if data is None:
+            data = entry.encoded[encoding] = compress()
+            if self._entries.get(entry.key) is entry:
+                self.bytes += len(data)
+                self._evict()
+        return data
+
+    def invalidate(self, resource: str) -> None:
+        for key in [key for key in self._entries if key.split("|", 1)[0] == resource]:
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_size or self.bytes > self.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self.bytes -= entry.size
+
+    def age(self, entry: CachedResponse) -> int:
+        return int(self._clock() - entry.stored_at)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "size": len(self), "bytes": self.bytes, "hit_ratio": self.hits / lookups if lookups else 0.0}
+
+
+def resource(path: str) -> str:
+    return "/" + path.strip("/").split("/", 1)[0]
+
+
+class HttpCacheMiddleware:
+    """ ASGI puro (sem BaseHTTPMiddleware) para respostas de corpo único; streaming e arquivos grandes passam direto.
+        GET 200 ganha ETag fraco (se a rota não definiu um) e If-None-Match igual responde 304 sem corpo.
+        Corpos acima de `min_size` com tipo textual saem em brotli (se instalado e aceito) ou gzip.
+        O `cache` responde antes das dependências da rota, então requests com Authorization ou Cookie só usam o cache
+        com um `principal`: ele verifica as credenciais (token expirado ou revogado dá None e a request vai para a rota)
+        e a chave passa a ser a identidade verificada. Sem `principal` elas nunca são guardadas nem servidas do cache.
+    """
+
+    def __init__(self, app: ASGIApp, min_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4, cache: Optional[ResponseCache] = None, principal: Optional[Principal] = None):
+        self.app = app
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache = cache
+        self.principal = principal
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        method = scope["method"]
+        key = await self._key(scope, request_headers) if method == "GET" and self.cache is not None else None
+        if key is not None:
+            entry = self.cache.get(key)
+            if entry is not None:
+                headers = MutableHeaders(raw=list(entry.headers))
+                headers["age"] = str(self.cache.age(entry))
+                await self._respond(send, 200, headers, entry.body, entry.etag, request_headers, entry)
+                return
+
+        start: Optional[Message] = None
+        streaming = False
+
+        async def buffered_send(message: Message) -> None:
+            nonlocal start, streaming
+            if streaming:
+                await send(message)
+            elif message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                await self._finish(send, start, message.get("body", b""), method, key, request_headers)
+            else:
+                # mais de um pedaço (StreamingResponse, FileResponse grande): repassa sem bufferizar
+                streaming = True
+                await send(start)
+                await send(message)
+
+        await self.app(scope, receive, buffered_send)
+
+        if method not in ("GET", "OPTIONS") and self.cache is not None and start is not None and start["status"] < 400:
+            self.cache.invalidate(resource(scope["path"]))
+
+    async def _key(self, scope: Scope, request_headers: Headers) -> Optional[str]:
+        """ Chave do cache para a request, ou None quando ela não pode usar o cache (credenciais sem `principal` ou inválidas). """
+        identity = ""
+        if "authorization" in request_headers or "cookie" in request_headers:
+            identity = await self.principal(request_headers) if self.principal is not None else None
+            if not identity:
+                return None
+        query = scope.get("query_string", b"").decode("latin-1")
+        return f"{resource(scope['path'])}|{scope['path']}?{query}|{hashlib.blake2b(identity.encode(), digest_size=8).hexdigest()}"
+
+    async def _finish(self, send: Send, start: Message, body: bytes, method: str, key: Optional[str], request_headers: Headers) -> None:
+        status = start["status"]
+        headers = MutableHeaders(raw=list(start["headers"]))
+        if method != "GET" or status != 200:
+            await self._respond(send, status, headers, body, None, request_headers)
+            return
+        etag = headers.get("etag") or weak_etag(body)
+        del headers["etag"]
+        entry = None
+        ttl = parse_max_age(headers.get("cache-control"))
+        if key is not None and ttl > 0 and "content-encoding" not in headers:
+            del headers["content-length"]
+            entry = self.cache.set(key, list(headers.raw), body, etag, ttl)
+        await self._respond(send, status, headers, body, etag, request_headers, entry)
+
+    async def _respond(self, send: Send, status: int, headers: MutableHeaders, body: bytes, etag: Optional[str], request_headers: Headers, entry: Optional[CachedResponse] = None) -> None:
+        if etag is not None:
+            headers["etag"] = etag
+            if etag_matches(request_headers.get("if-none-match"), etag):
+                for name in ("content-length", "content-type", "content-encoding"):
+                    del headers[name]
+                await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+                await send({"type": "http.response.body", "body": b""})
+                return
+        if self._compressible(headers, body):
+            headers.add_vary_header("Accept-Encoding")
+            encoding = self._negotiate(request_headers.get("accept-encoding", ""))
+            if encoding is not None:
+                if entry is not None:
+                    body = self.cache.encode(entry, encoding, lambda: self._compress(entry.body, encoding))
+                else:
+                    body = self._compress(body, encoding)
+                headers["content-encoding"] = encoding
+        headers["content-length"] = str(len(body))
+        await send({"type": "http.response.start", "status": status, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
+
+    def _compressible(self, headers: MutableHeaders, body: bytes) -> bool:
+        if len(body) < self.min_size or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE)
+
+    def _negotiate(self, accept_encoding: str) -> Optional[str]:
+        accepted = set()
+        for item in accept_encoding.lower().split(","):
+            name, _, parameters = item.strip().partition(";")
+            if parameters.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                accepted.add(name.strip())
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted or "*" in accepted:
+            return "gzip"
+        return None
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
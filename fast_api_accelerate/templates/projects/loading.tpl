@@ -0,0 +1,31 @@
+from typing import Any, List, Mapping, Optional, Sequence, Union
+from sqlalchemy.orm import defaultload, joinedload, lazyload, raiseload, selectinload
+
+# {"comments": "selectin", "user": "joined", "comments.user": "selectin"} ou ["comments", "user"] (selectin)
+LoadSpec = Union[Mapping[str, str], Sequence[str]]
+
+STRATEGIES = {"selectin": selectinload, "joined": joinedload, "raise": raiseload, "lazy": lazyload}
+
+
+def load_options(model: Any, spec: Optional[LoadSpec]) -> List[Any]:
+    """ Converte o spec declarativo em opções do SQLAlchemy. Em caminhos com ponto a estratégia vale para o último
+        relacionamento; os anteriores mantêm a própria (`defaultload`), então "user" e "user.posts" combinam.
+    """
+    if not spec:
+        return []
+    items = spec.items() if isinstance(spec, Mapping) else ((path, "selectin") for path in spec)
+    options = []
+    for path, strategy in items:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown load strategy '{strategy}' (expected one of {', '.join(STRATEGIES)})")
+        option, owner = None, model
+        names = path.split(".")
+        for position, name in enumerate(names, 1):
+            attribute = getattr(owner, name, None)
+            if attribute is None or not hasattr(attribute, "property") or not hasattr(attribute.property, "mapper"):
+                raise ValueError(f"{owner.__name__} has no relationship '{name}'")
+            loader = STRATEGIES[strategy] if position == len(names) else defaultload
+            option = loader(attribute) if option is None else getattr(option, loader.__name__)(attribute)
+            owner = attribute.property.mapper.class_
+        options.append(option)
+    return options
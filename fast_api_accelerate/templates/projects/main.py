@@ -1,28 +1,7 @@
-def main_project_template(name:str ) -> str:
-    return f"""from fastapi import FastAPI
-from src.modules.users.controllers import UsersController
-from src.modules.auth.controllers import AuthController
-from fastapi.staticfiles import StaticFiles
-from src.core.startup import register_startup_events
+from ..registry import render_template
 
-app = FastAPI(
-    title="{name}", description="API para blog usandoFastAPI",
-    version="1.0.0",
-    contact={{"clodoaldo": "Neto","email": "clodoaldobritodev@gmail.com"}},
-    license_info={{"license": "MIT","url": "https://opensource.org/licenses/MIT"}},
-    swagger_ui_parameters={{"persistAuthorization": True}},
-)
 
-register_startup_events(app)
-
-@app.get("/")
-async def index():
-    return {{"users":"/users","auth":"/auth","for documentação":"/docs"}}
-
-usuarios = UsersController()
-auth = AuthController()
-
-app.include_router(usuarios.router)
-app.include_router(auth.router)
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
-"""
\ No newline at end of file
+def main_project_template(name:str, entities: list = []) -> str:
+    imports = "".join(f"from src.modules.{e.module}.controllers import {e.controller_name}\n" for e in entities)
+    routers = "".join(f"app.include_router({e.controller_name}().router)\n" for e in entities)
+    return render_template("projects/main", name=name, imports=imports, routers=routers)
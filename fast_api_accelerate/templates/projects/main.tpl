@@ -0,0 +1,37 @@
+from fastapi import FastAPI
+from src.modules.users.controllers import UsersController
+from src.modules.auth.controllers import AuthController
+from src.modules.files.controllers import FilesController
+from src.base.uploads import UploadFiles
+from src.core.configs import settings
+from src.core.startup import lifespan, register_middlewares
+from src.base.serialization import FastJSONResponse
+from src.base.metrics import metrics_endpoint
+$imports
+app = FastAPI(
+    title="$name", description="API para blog usandoFastAPI",
+    version="1.0.0",
+    contact={"clodoaldo": "Neto","email": "clodoaldobritodev@gmail.com"},
+    license_info={"license": "MIT","url": "https://opensource.org/licenses/MIT"},
+    swagger_ui_parameters={"persistAuthorization": True},
+    lifespan=lifespan,
+)
+
+register_middlewares(app)
+
+if settings.METRICS_ENABLED:
+    app.add_api_route("/metrics", metrics_endpoint(settings.METRICS_TOKEN), methods=["GET"], include_in_schema=False)
+
+@app.get("/", response_class=FastJSONResponse)
+async def index():
+    return {"users":"/users","auth":"/auth","files":"/files","for documentação":"/docs"}
+
+usuarios = UsersController()
+auth = AuthController()
+files = FilesController()
+
+app.include_router(usuarios.router)
+app.include_router(auth.router)
+app.include_router(files.router)
+${routers}# check_dir=False: a pasta é criada no startup (lifespan), depois do import
+app.mount("/uploads", UploadFiles(directory=settings.UPLOAD_DIR, check_dir=False), name="uploads")
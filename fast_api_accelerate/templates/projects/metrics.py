@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def metrics_template() -> str:
+    return render_template("projects/metrics")
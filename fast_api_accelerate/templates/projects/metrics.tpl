@@ -0,0 +1,338 @@
+import asyncio
+import bisect
+import hmac
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("uvicorn.error")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+Labels = Tuple[str, ...]
+
+
+class Metric:
+    """ Uma família de séries no formato texto do Prometheus. Sem locks: tudo é atualizado na thread do event loop. """
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    def _labels(self, values: Labels, extra: Sequence[Tuple[str, str]] = ()) -> str:
+        pairs = list(zip(self.labelnames, values)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def samples(self) -> Iterable[str]:
+        return ()
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}", *self.samples()]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self.values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self.values.items():
+            yield f"{self.name}{self._labels(labels)} {_number(value)}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        self.values[labels] = value
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    """ Contagem por faixa (não cumulativa na memória, cumulativa na saída) mais a soma: observe() é um bisect e dois +=. """
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.series: Dict[Labels, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self.series.get(labels)
+        if series is None:
+            # uma posição por faixa, mais +Inf e a soma no fim
+            series = self.series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self.series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> Iterable[str]:
+        for labels, series in self.series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                yield f"{self.name}_bucket{self._labels(labels, [('le', _number(bound))])} {cumulative}"
+            yield f"{self.name}_sum{self._labels(labels)} {_number(series[-1])}"
+            yield f"{self.name}_count{self._labels(labels)} {cumulative}"
+
+
+class MetricsRegistry:
+    """ Métricas do processo (cada worker do uvicorn tem as suas). As fixas são atualizadas no caminho da request;
+        os `collectors` (pools, caches, startup) só rodam no scrape, então não custam nada entre um scrape e outro.
+    """
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+        self.collectors: Dict[str, Callable[[], Iterable[Metric]]] = {}
+
+    def register(self, metric: Metric) -> Any:
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def collector(self, name: str, collect: Callable[[], Iterable[Metric]]) -> None:
+        """ Registrar de novo com o mesmo nome substitui (o lifespan roda uma vez por TestClient nos testes). """
+        self.collectors[name] = collect
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        for name, collect in list(self.collectors.items()):
+            try:
+                metrics = list(collect())
+            except Exception as error:
+                logger.warning("metrics: collector %s falhou: %r", name, error)
+                continue
+            for metric in metrics:
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter("http_requests_total", "Requests concluídas por rota e status.", ("method", "route", "status"))
+http_duration = registry.histogram("http_request_duration_seconds", "Latência das requests por rota, até o último byte.", ("method", "route"))
+http_in_progress = registry.gauge("http_requests_in_progress", "Requests em andamento neste worker.", ("method",))
+db_query_duration = registry.histogram("db_query_duration_seconds", "Duração dos statements SQL por operação.", ("operation",), QUERY_BUCKETS)
+db_query_errors = registry.counter("db_query_errors_total", "Statements SQL que falharam, por operação.", ("operation",))
+db_pool_checkout = registry.histogram("db_pool_checkout_seconds", "Tempo para obter uma conexão do pool (fila de espera ou conexão nova).", ("pool",), QUERY_BUCKETS)
+db_pool_waiting = registry.gauge("db_pool_waiting", "Requests esperando uma conexão do pool agora.", ("pool",))
+db_pool_timeouts = registry.counter("db_pool_timeouts_total", "Esperas pelo pool que passaram do DB_POOL_TIMEOUT.", ("pool",))
+loop_lag = registry.histogram("event_loop_lag_seconds", "Atraso do event loop: quanto um sleep curto acordou depois do previsto.", buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0))
+loop_lag_last = registry.gauge("event_loop_lag_last_seconds", "Atraso do event loop na última medição.")
+
+
+class MetricsMiddleware:
+    """ ASGI puro, o mais externo: mede o tempo inteiro da request, inclusive respostas do HttpCacheMiddleware.
+        A rota é o template (`/posts/{id}`), nunca a URL, para o número de séries não crescer com os ids; respostas do
+        cache não passam pelo roteador e usam o template já visto para o mesmo path. Custa dois perf_counter e três
+        atualizações de dict por request.
+    """
+
+    def __init__(self, app: ASGIApp, max_paths: int = 10_000):
+        self.app = app
+        self.max_paths = max_paths
+        self._routes: Dict[str, str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"] if scope["method"] in METHODS else "OTHER"
+        status = 500
+
+        async def send_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_in_progress.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_in_progress.dec(method)
+            route = self._route(scope)
+            http_duration.observe(elapsed, method, route)
+            http_requests.inc(method, route, str(status))
+
+    def _route(self, scope: Scope) -> str:
+        path = scope["path"]
+        route = getattr(scope.get("route"), "path", None)
+        if route is None:
+            return self._routes.get(path, "unmatched")
+        if len(self._routes) < self.max_paths:
+            self._routes[path] = route
+        return route
+
+
+def _operation(statement: Optional[str]) -> str:
+    operation = (statement or "").lstrip()[:6].upper()
+    return operation if operation in OPERATIONS else "OTHER"
+
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["metrics_started"].pop()
+    db_query_duration.observe(time.perf_counter() - started, _operation(statement))
+
+
+def _on_error(context):
+    started = context.connection.info.get("metrics_started") if context.connection is not None else None
+    if started:
+        started.pop()
+    db_query_errors.inc(_operation(context.statement))
+
+
+def install_sqlalchemy() -> None:
+    """ Listeners na classe Engine, como o query_counter: valem para o primário, as réplicas e engines recriados. """
+    for name, listener in (("before_cursor_execute", _before_execute), ("after_cursor_execute", _after_execute), ("handle_error", _on_error)):
+        if not event.contains(Engine, name, listener):
+            event.listen(Engine, name, listener)
+
+
+def instrument_pool(pool: Any, name: str) -> None:
+    """ Mede o checkout de conexões envolvendo `_do_get`, onde o QueuePool espera na fila ou abre uma conexão nova
+        (API interna do SQLAlchemy, a mesma desde a 1.x; o pool não tem evento para o início da espera).
+        Pools sem fila (NullPool, StaticPool) ficam como estão.
+    """
+    if getattr(pool, "metrics_name", None) is not None or not hasattr(pool, "size"):
+        return
+    original = pool._do_get
+
+    def _do_get():
+        db_pool_waiting.inc(name)
+        started = time.perf_counter()
+        try:
+            return original()
+        except PoolTimeoutError:
+            db_pool_timeouts.inc(name)
+            raise
+        finally:
+            db_pool_waiting.dec(name)
+            db_pool_checkout.observe(time.perf_counter() - started, name)
+
+    pool._do_get = _do_get
+    pool.metrics_name = name
+
+
+def pool_metrics(pools: Iterable[Tuple[str, Any]]) -> List[Metric]:
+    size = Gauge("db_pool_size", "Conexões fixas do pool (DB_POOL_SIZE).", ("pool",))
+    checked_out = Gauge("db_pool_checked_out", "Conexões em uso.", ("pool",))
+    checked_in = Gauge("db_pool_checked_in", "Conexões abertas e livres no pool.", ("pool",))
+    overflow = Gauge("db_pool_overflow", "Conexões abertas além do pool_size (DB_MAX_OVERFLOW).", ("pool",))
+    for name, pool in pools:
+        if not hasattr(pool, "size"):
+            continue
+        size.set(pool.size(), name)
+        checked_out.set(pool.checkedout(), name)
+        checked_in.set(pool.checkedin(), name)
+        # o QueuePool começa em -pool_size e sobe a cada conexão aberta
+        overflow.set(max(pool.overflow(), 0), name)
+    return [size, checked_out, checked_in, overflow]
+
+
+def cache_metrics(stats: Dict[str, Dict[str, float]]) -> List[Metric]:
+    """ Os `stats()` dos caches do app ({nome: stats}) como contadores de hit/miss e a taxa de acerto de cada um. """
+    hits = Counter("cache_hits_total", "Consultas respondidas pelo cache (inclui hits negativos).", ("cache",))
+    misses = Counter("cache_misses_total", "Consultas que não estavam no cache.", ("cache",))
+    ratio = Gauge("cache_hit_ratio", "hits / consultas desde o início do processo.", ("cache",))
+    size = Gauge("cache_entries", "Entradas guardadas no processo.", ("cache",))
+    for name, values in stats.items():
+        hits.inc(name, amount=values.get("hits", 0) + values.get("negative_hits", 0))
+        misses.inc(name, amount=values.get("misses", 0))
+        ratio.set(values.get("hit_ratio", 0.0), name)
+        if "size" in values:
+            size.set(values["size"], name)
+    return [hits, misses, ratio, size]
+
+
+class LoopLagMonitor:
+    """ Dorme `interval` segundos em loop e mede quanto acordou atrasado: CPU presa no event loop (hash fora do pool,
+        JSON enorme, código síncrono) aparece aqui antes de aparecer na latência. Uma task, um wakeup por intervalo.
+    """
+
+    def __init__(self, interval: float = 0.5, clock: Callable[[], float] = time.perf_counter):
+        self.interval = interval
+        self._clock = clock
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            started = self._clock()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, self._clock() - started - self.interval)
+            loop_lag.observe(lag)
+            loop_lag_last.set(lag)
+
+
+def metrics_endpoint(token: Optional[str] = None) -> Callable[[Request], Any]:
+    """ Rota do scrape. Com `token` o Prometheus precisa mandar `Authorization: Bearer <token>` (bearer_token no scrape_config). """
+    expected = f"Bearer {token}".encode() if token else None
+
+    async def metrics(request: Request) -> Response:
+        if expected is not None and not hmac.compare_digest(request.headers.get("authorization", "").encode(), expected):
+            return Response(status_code=401, headers={"www-authenticate": "Bearer"})
+        return Response(registry.render(), media_type=CONTENT_TYPE, headers={"cache-control": "no-store"})
+
+    return metrics
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
@@ -0,0 +1,40 @@
+import base64
+import json
+from typing import Any, Generic, List, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class CursorError(ValueError):
+    """ Cursor malformado ou gerado para outra ordenação. """
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    limit: int
+
+
+def clamp_limit(limit: int) -> int:
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def encode_cursor(order_by: str, descending: bool, values: List[Any]) -> str:
+    """ Token opaco com a ordenação e a chave (coluna, id) do último item da página. """
+    payload = json.dumps({"o": order_by, "d": descending, "v": values}, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str, descending: bool) -> List[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        values = payload["v"]
+    except (ValueError, TypeError, KeyError):
+        raise CursorError("invalid cursor") from None
+    if payload.get("o") != order_by or payload.get("d") != descending or not isinstance(values, list):
+        raise CursorError("cursor does not match the requested ordering")
+    return values
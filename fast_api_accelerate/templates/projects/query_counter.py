@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def query_counter_template() -> str:
+    return render_template("projects/query_counter")
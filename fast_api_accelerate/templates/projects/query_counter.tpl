@@ -0,0 +1,74 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_current: ContextVar[Optional["QueryCounter"]] = ContextVar("query_counter", default=None)
+
+
+class NPlusOneError(AssertionError):
+    """ Mais statements do que o limite: quase sempre um relacionamento carregado linha a linha. """
+
+
+class QueryCounter:
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def check(self, where: str = "block"):
+        if self.limit is not None and self.count > self.limit:
+            listing = "\n".join(f"  {i}. {statement}" for i, statement in enumerate(self.statements, 1))
+            raise NPlusOneError(f"{where} executed {self.count} statements (limit {self.limit}):\n{listing}")
+
+
+def _on_execute(conn, cursor, statement, parameters, context, executemany):
+    counter = _current.get()
+    if counter is not None:
+        counter.statements.append(statement)
+
+
+def install():
+    """ Listener único na classe Engine: vale para qualquer engine, inclusive os recriados após dispose().
+        Sem contador ativo ele não custa nada além de um ContextVar.get().
+    """
+    if not event.contains(Engine, "before_cursor_execute", _on_execute):
+        event.listen(Engine, "before_cursor_execute", _on_execute)
+
+
+@contextmanager
+def count_queries(limit: Optional[int] = None) -> Iterator[QueryCounter]:
+    """ with count_queries(limit=3) as counter: ... -> NPlusOneError se o bloco passar de 3 statements. """
+    install()
+    counter = QueryCounter(limit)
+    token = _current.set(counter)
+    try:
+        yield counter
+    finally:
+        _current.reset(token)
+    counter.check()
+
+
+class QueryCountMiddleware:
+    """ Middleware ASGI para testes: conta os statements de cada request e falha com NPlusOneError acima do limite. """
+
+    def __init__(self, app, limit: int):
+        self.app = app
+        self.limit = limit
+        install()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        counter = QueryCounter(self.limit)
+        token = _current.set(counter)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
+        counter.check(f"{scope['method']} {scope['path']}")
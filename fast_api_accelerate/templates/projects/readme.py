@@ -1,2 +1,5 @@
+from ..registry import render_template
+
+
 def readme_template(name:str ) -> str:
-    return f""" """
\ No newline at end of file
+    return render_template("projects/readme")
@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def routing_template() -> str:
+    return render_template("projects/routing")
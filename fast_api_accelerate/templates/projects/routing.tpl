@@ -0,0 +1,127 @@
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Sequence
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.dml import UpdateBase
+
+
+class Replica:
+    """ Engine de leitura. Depois de uma falha de conexão fica `retry_after` segundos fora de rotação
+        e então volta a ser tentado; se falhar de novo, sai outra vez.
+    """
+
+    def __init__(self, engine: AsyncEngine, retry_after: float = 30, clock: Callable[[], float] = time.monotonic):
+        self.engine = engine
+        self.retry_after = retry_after
+        self._clock = clock
+        self.down_until = 0.0
+        self.failures = 0
+
+    @property
+    def healthy(self) -> bool:
+        return self._clock() >= self.down_until
+
+    def evict(self) -> None:
+        self.failures += 1
+        self.down_until = self._clock() + self.retry_after
+
+
+class ReplicaSet:
+    """ Réplicas em round-robin, pulando as que estão fora de rotação. Sem nenhuma saudável as leituras vão ao primário. """
+
+    def __init__(self, engines: Sequence[AsyncEngine], retry_after: float = 30, clock: Callable[[], float] = time.monotonic):
+        self.replicas: List[Replica] = [Replica(engine, retry_after, clock) for engine in engines]
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    def pick(self) -> Optional[Replica]:
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next % len(self.replicas)]
+            self._next += 1
+            if replica.healthy:
+                return replica
+        return None
+
+    async def check(self) -> int:
+        """ SELECT 1 em cada réplica; as que falham saem de rotação. Devolve quantas estão saudáveis. """
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+            except Exception as error:
+                if not is_disconnect(error):
+                    raise
+                replica.evict()
+        return sum(replica.healthy for replica in self.replicas)
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+class RoutingSession(Session):
+    """ Sessão síncrona por trás da AsyncSession. SELECTs emitidos dentro de `reading(session)` (inclusive os eager loads)
+        vão para uma réplica; flush, INSERT/UPDATE/DELETE e todo o resto vão para o primário (o `bind` da sessão).
+        Com `sticky`, depois da primeira escrita a sessão só lê do primário: a request enxerga o que ela mesma gravou.
+    """
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, sticky: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.sticky = sticky
+        self.reading = False
+        self.wrote = False
+        self.replica: Optional[Replica] = None
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.wrote = True
+        elif self.reading and self.replicas and isinstance(clause, Select) and not (self.sticky and self.wrote):
+            replica = self.replica or self.replicas.pick()
+            if replica is not None:
+                self.replica = replica
+                return replica.engine.sync_engine
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def _routing(session: AsyncSession) -> Optional[RoutingSession]:
+    sync_session = session.sync_session
+    return sync_session if isinstance(sync_session, RoutingSession) else None
+
+
+@contextmanager
+def reading(session: AsyncSession) -> Iterator[None]:
+    """ Marca o bloco como leitura que pode ir para uma réplica. Sem RoutingSession (ou sem réplicas) não muda nada. """
+    routing = _routing(session)
+    if routing is None or routing.reading:
+        yield
+        return
+    routing.reading, routing.replica = True, None
+    try:
+        yield
+    finally:
+        routing.reading = False
+
+
+def is_disconnect(error: BaseException) -> bool:
+    if isinstance(error, DBAPIError):
+        return error.connection_invalidated or isinstance(error, (OperationalError, InterfaceError))
+    return isinstance(error, (OSError, TimeoutError))
+
+
+def failover(session: AsyncSession, error: BaseException) -> bool:
+    """ Se a leitura falhou por conexão numa réplica, tira a réplica de rotação e diz se vale repetir
+        (na próxima réplica saudável ou no primário). Erros do primário ou de SQL não são repetidos.
+    """
+    routing = _routing(session)
+    if routing is None or routing.replica is None or not is_disconnect(error):
+        return False
+    routing.replica.evict()
+    routing.replica = None
+    return True
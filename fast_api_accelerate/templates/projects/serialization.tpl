@@ -0,0 +1,46 @@
+from functools import lru_cache
+from typing import Any, Iterable, List, Type
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json, to_jsonable_python
+
+try:
+    import orjson
+except ImportError:  # pydantic-core serializa em Rust do mesmo jeito, só um pouco mais devagar
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """ TypeAdapter por tipo (ex.: List[PostResponse], Page[PostResponse]): montar o validador/serializador custa
+        mais do que validar uma página inteira, então cada tipo é compilado uma única vez por processo.
+    """
+    return TypeAdapter(tp)
+
+
+def validate_many(rows: Iterable[Any], schema: Type[BaseModel]) -> List[BaseModel]:
+    """ Converte entidades do ORM em DTOs numa única chamada ao pydantic-core (from_attributes), não uma por linha. """
+    return type_adapter(List[schema]).validate_python(list(rows), from_attributes=True)
+
+
+def dump_json(value: Any, tp: Any) -> bytes:
+    """ Valida `value` como `tp` (aceita entidades do ORM) e serializa direto para bytes, sem dict intermediário. """
+    adapter = type_adapter(tp)
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+class FastJSONResponse(JSONResponse):
+    """ JSONResponse com orjson (ou pydantic-core) no lugar do json da stdlib. Para rotas sem response_model:
+        com response_model o FastAPI já serializa em Rust via pydantic (dump_json), e trocar a response_class
+        padrão do app desligaria esse caminho, por isso ela é escolhida rota a rota.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, default=to_jsonable_python, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+        return to_json(content)
+
+
+def json_response(value: Any, tp: Any, status_code: int = 200) -> Response:
+    """ Resposta já serializada por um TypeAdapter cacheado; o FastAPI não revalida um Response devolvido pela rota. """
+    return Response(dump_json(value, tp), status_code=status_code, media_type="application/json")
@@ -1,9 +1,5 @@
-def setup_db_template() -> str:
-    return """
-from src.core.database import create_tables
+from ..registry import render_template
 
-if __name__ == "__main__":
-    import asyncio
-    asyncio.run(create_tables())
 
-"""
+def setup_db_template() -> str:
+    return render_template("projects/setup_db")
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Tuple
+from fastapi import FastAPI
+from sqlalchemy.orm import configure_mappers
+from src.core.configs import settings
+from src.core.database import database
+from src.base import metrics
+from src.base.http_cache import HttpCacheMiddleware
+from src.base.query_counter import QueryCountMiddleware
+
+# mesmo logger do uvicorn: o resumo do startup sai no console sem configurar logging
+logger = logging.getLogger("uvicorn.error")
+
+UPLOAD_DIRS = [
+    settings.UPLOAD_DIR,
+    os.path.join(settings.UPLOAD_DIR, "users"),
+    os.path.join(settings.UPLOAD_DIR, ".tmp"),
+]
+
+def create_upload_dirs():
+    #Cria todas as pastas necessárias para uploads.Se já existirem, não faz nada.
+
+    for directory in UPLOAD_DIRS:
+        os.makedirs(directory, exist_ok=True)
+
+
+class StartupReport:
+    """ Duração de cada etapa do startup (as etapas de rede correm em paralelo). Fica em `app.state.startup` e vai
+        para o log numa linha só, com a versão do app: dá para comparar o cold start de um release para o outro.
+    """
+
+    def __init__(self, timeout: float = 10.0, clock: Callable[[], float] = time.perf_counter):
+        self.timeout = timeout
+        self._clock = clock
+        self.started = clock()
+        self.total = 0.0
+        self.steps: Dict[str, float] = {}
+        self.failures: List[Tuple[str, str]] = []
+
+    @contextmanager
+    def step(self, name: str):
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.steps[name] = self._clock() - started
+
+    async def run(self, name: str, warm_up: Callable[[], Awaitable[str]]) -> None:
+        """ Etapa de aquecimento: uma falha ou demora acima de `timeout` (banco fora, Redis fora) só vai para o log
+            e o app sobe assim mesmo; o recurso abre sob demanda depois.
+        """
+        with self.step(name):
+            try:
+                detail = await asyncio.wait_for(warm_up(), self.timeout)
+            except Exception as error:
+                self.failures.append((name, repr(error)))
+                return
+        if detail:
+            logger.info("startup: %s (%s)", name, detail)
+
+    def finish(self) -> float:
+        self.total = self._clock() - self.started
+        return self.total
+
+    def summary(self) -> str:
+        steps = " ".join(f"{name}={seconds * 1000:.1f}ms" for name, seconds in self.steps.items())
+        return f"total={self.total * 1000:.1f}ms {steps}"
+
+
+async def warm_up_database() -> str:
+    if settings.DB_WARMUP_CONNECTIONS <= 0:
+        return ""
+    return f"{await database.warm_up(settings.DB_WARMUP_CONNECTIONS)} conexões abertas no pool"
+
+
+async def warm_up_replicas() -> str:
+    healthy = await database.check_replicas()
+    return f"{healthy}/{len(database.replicas)} réplicas de leitura disponíveis"
+
+
+async def warm_up_auth() -> str:
+    """ Carrega o backend do passlib e sobe as threads de hashing (o primeiro login pagaria isso) e traz a denylist. """
+    from src.core.container_ioc import password_hasher, revocations
+
+    await asyncio.gather(password_hasher.dummy_verify(), revocations.sync())
+    return ""
+
+
+def database_pools():
+    if database.engine is None:
+        return []
+    return [("primary", database.engine.pool)] + [(f"replica{index}", replica.engine.pool) for index, replica in enumerate(database.replicas.replicas)]
+
+
+def app_metrics(app: FastAPI):
+    """ Lido no scrape: duração do startup, caches e limites de login, sem custo entre um scrape e outro. """
+    from src.core.container_ioc import auth_rate_limiter, entity_caches, response_cache, token_verifier
+
+    startup_seconds = metrics.Gauge("app_startup_seconds", "Duração de cada etapa do último startup.", ("step",))
+    report = getattr(app.state, "startup", None)
+    if report is not None:
+        for name, seconds in report.steps.items():
+            startup_seconds.set(seconds, name)
+        startup_seconds.set(report.total, "total")
+
+    stats = {"token": token_verifier.stats(), **{f"entity:{namespace}": cache.stats() for namespace, cache in entity_caches.items()}}
+    if response_cache is not None:
+        stats["http"] = response_cache.stats()
+
+    allowed = metrics.Counter("auth_rate_limit_allowed_total", "Tentativas de login/refresh aceitas, por regra.", ("rule",))
+    rejected = metrics.Counter("auth_rate_limit_rejected_total", "Tentativas de login/refresh recusadas com 429, por regra.", ("rule",))
+    for rule in auth_rate_limiter.rules:
+        allowed.inc(rule, amount=auth_rate_limiter.allowed[rule])
+        rejected.inc(rule, amount=auth_rate_limiter.rejected[rule])
+    return [startup_seconds, *metrics.cache_metrics(stats), allowed, rejected]
+
+
+def start_metrics(app: FastAPI) -> metrics.LoopLagMonitor:
+    """ Liga os eventos do SQLAlchemy, mede o checkout dos pools recém-criados e inicia a medição do event loop. """
+    metrics.install_sqlalchemy()
+    for name, pool in database_pools():
+        metrics.instrument_pool(pool, name)
+    metrics.registry.collector("pools", lambda: metrics.pool_metrics(database_pools()))
+    metrics.registry.collector("app", lambda: app_metrics(app))
+    monitor = metrics.LoopLagMonitor(settings.METRICS_LOOP_LAG_INTERVAL)
+    monitor.start()
+    return monitor
+
+
+async def shutdown() -> None:
+    from src.core.container_ioc import password_hasher
+
+    password_hasher.close()
+    await database.dispose()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    report = StartupReport(timeout=settings.STARTUP_WARMUP_TIMEOUT)
+    with report.step("upload_dirs"):
+        create_upload_dirs()
+    with report.step("mappers"):
+        import src.models.__all_models  # noqa: F401 - todos os models registrados antes de resolver os relacionamentos
+        configure_mappers()  # senão o SQLAlchemy montaria os relacionamentos de todos os models na primeira query
+
+    with report.step("engine"):
+        database.connect()
+    steps = [report.run("database", warm_up_database), report.run("auth", warm_up_auth)]
+    if database.replicas:
+        steps.append(report.run("replicas", warm_up_replicas))
+    await asyncio.gather(*steps)
+
+    monitor = None
+    if settings.METRICS_ENABLED:
+        with report.step("metrics"):
+            monitor = start_metrics(app)
+
+    report.finish()
+    app.state.startup = report
+    for name, error in report.failures:
+        logger.warning("startup: aquecimento de %s falhou, segue sob demanda: %s", name, error)
+    logger.info("startup %s %s: %s", app.title, app.version, report.summary())
+    try:
+        yield
+    finally:
+        if monitor is not None:
+            await monitor.stop()
+        await shutdown()
+
+
+def register_middlewares(app: FastAPI):
+    from src.core.container_ioc import http_cache_principal, response_cache
+
+    if settings.QUERY_COUNT_LIMIT is not None:
+        app.add_middleware(QueryCountMiddleware, limit=settings.QUERY_COUNT_LIMIT)
+    # o último adicionado é o mais externo: respostas do cache não passam pelo contador de queries
+    app.add_middleware(HttpCacheMiddleware, min_size=settings.HTTP_COMPRESSION_MIN_SIZE, gzip_level=settings.HTTP_GZIP_LEVEL, brotli_quality=settings.HTTP_BROTLI_QUALITY, cache=response_cache, principal=http_cache_principal if settings.HTTP_CACHE_AUTHENTICATED else None)
+    if settings.METRICS_ENABLED:
+        # por fora de todos: a latência medida inclui as respostas servidas pelo cache
+        app.add_middleware(metrics.MetricsMiddleware)
@@ -0,0 +1,66 @@
+import csv
+import io
+from typing import Any, AsyncIterator, List, Literal, Optional, Type
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from src.base.serialization import type_adapter, validate_many
+
+StreamFormat = Literal["ndjson", "csv"]
+
+# bytes acumulados antes de cada envio: poucos writes no socket sem segurar a exportação em memória
+CHUNK_SIZE = 64 * 1024
+
+# linhas validadas/serializadas por chamada ao pydantic-core (TypeAdapter cacheado) em vez de uma chamada por linha
+BATCH_SIZE = 500
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+async def _batches(rows: AsyncIterator[Any], size: int) -> AsyncIterator[List[Any]]:
+    batch = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _chunks(parts: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    buffer, size = [], 0
+    async for data in parts:
+        buffer.append(data)
+        size += len(data)
+        if size >= CHUNK_SIZE:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+async def _ndjson_lines(rows: AsyncIterator[Any], schema: Type[BaseModel]) -> AsyncIterator[bytes]:
+    item = type_adapter(schema)
+    async for batch in _batches(rows, BATCH_SIZE):
+        yield b"".join(item.dump_json(dto) + b"\n" for dto in validate_many(batch, schema))
+
+
+async def _csv_lines(rows: AsyncIterator[Any], schema: Type[BaseModel]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    fields = list(schema.model_fields)
+    writer.writerow(fields)
+    many = type_adapter(List[schema])
+    async for batch in _batches(rows, BATCH_SIZE):
+        writer.writerows([data[field] for field in fields] for data in many.dump_python(validate_many(batch, schema), mode="json"))
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+def stream_response(rows: AsyncIterator[Any], schema: Type[BaseModel], format: StreamFormat = "ndjson", filename: Optional[str] = None) -> StreamingResponse:
+    """ Exporta `rows` (ex.: `repository.stream()`) linha a linha: o primeiro chunk sai antes da consulta terminar. """
+    lines = _csv_lines(rows, schema) if format == "csv" else _ndjson_lines(rows, schema)
+    headers = {"Content-Disposition": f'attachment; filename="{filename}.{format}"'} if filename else None
+    return StreamingResponse(_chunks(lines), media_type=MEDIA_TYPES[format], headers=headers)
@@ -0,0 +1,158 @@
+import hashlib
+import os
+import re
+import time
+import uuid
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional
+import aiofiles
+import aiofiles.os
+from fastapi import HTTPException, UploadFile, status
+from pydantic import BaseModel
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+DIGEST = re.compile(r"[0-9a-f]{64}")
+
+# extensão gravada no disco para cada content type conhecido: o nome enviado pelo cliente não decide nada.
+# Tipos fora daqui (HTML, SVG, JavaScript...) ficam sem extensão e são servidos como application/octet-stream.
+EXTENSIONS = {
+    "image/png": ".png", "image/jpeg": ".jpg", "image/gif": ".gif", "image/webp": ".webp", "image/avif": ".avif",
+    "text/plain": ".txt", "text/csv": ".csv", "application/json": ".json", "application/pdf": ".pdf", "application/zip": ".zip",
+    "audio/mpeg": ".mp3", "audio/ogg": ".ogg", "video/mp4": ".mp4", "video/webm": ".webm",
+}
+MEDIA_TYPES = {extension: content_type for content_type, extension in EXTENSIONS.items()}
+# abertos no navegador; os demais vão com Content-Disposition: attachment
+INLINE = {".png", ".jpg", ".gif", ".webp", ".avif", ".txt", ".mp3", ".ogg", ".mp4", ".webm"}
+
+# o nome do arquivo é o sha256 do conteúdo: a URL nunca passa a apontar para outro conteúdo
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+class StoredFile(BaseModel):
+    key: str
+    url: str
+    size: int
+    sha256: str
+    content_type: str
+
+
+class UploadStorage:
+    """ Uploads gravados direto em disco, em blocos de `chunk_size` (aiofiles), com o sha256 calculado no caminho:
+        nada de arquivo inteiro em memória. Passou de `max_size` o envio é cortado com 413 e o temporário apagado.
+        O arquivo é endereçado pelo conteúdo e espalhado em dois níveis de pastas pelo hash
+        (`files/ab/cd/abcd...ef.png`, 65 536 pastas por namespace): nenhuma pasta chega a milhões de arquivos,
+        o mesmo conteúdo enviado duas vezes ocupa o disco uma vez e o hash vira o ETag na hora de servir.
+    """
+
+    def __init__(self, root: str = "uploads", max_size: int = 10 * 1024 * 1024, chunk_size: int = 1024 * 1024, allowed_types: Iterable[str] = (), base_url: str = "/uploads"):
+        self.root = root
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+        self.allowed_types = set(allowed_types)
+        self.base_url = base_url.rstrip("/")
+
+    @staticmethod
+    def shard(namespace: str, digest: str, extension: str = "") -> str:
+        return f"{namespace}/{digest[:2]}/{digest[2:4]}/{digest}{extension}"
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, *key.split("/"))
+
+    def check_type(self, content_type: Optional[str]) -> str:
+        content_type = (content_type or "application/octet-stream").split(";")[0].strip().lower()
+        if self.allowed_types and content_type not in self.allowed_types:
+            raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=f"Unsupported file type: {content_type}")
+        return content_type
+
+    def check_size(self, content_length: Optional[str]) -> None:
+        """ Recusa pelo Content-Length antes de ler o corpo; o limite vale de novo durante o streaming. """
+        if content_length and content_length.isdigit() and int(content_length) > self.max_size:
+            raise self.too_large()
+
+    def too_large(self) -> HTTPException:
+        return HTTPException(status_code=413, detail=f"File larger than {self.max_size} bytes")
+
+    async def save_stream(self, chunks: AsyncIterator[bytes], content_type: Optional[str] = None, namespace: str = "files") -> StoredFile:
+        """ A extensão sai do content type já validado (EXTENSIONS), nunca do nome do arquivo: um `x.html` enviado como
+            image/png vira `<sha256>.png` e é servido como imagem.
+        """
+        content_type = self.check_type(content_type)
+        temporary_dir = os.path.join(self.root, ".tmp")
+        await aiofiles.os.makedirs(temporary_dir, exist_ok=True)
+        temporary = os.path.join(temporary_dir, uuid.uuid4().hex)
+        digest, size = hashlib.sha256(), 0
+        try:
+            async with aiofiles.open(temporary, "wb") as output:
+                buffer = bytearray()
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > self.max_size:
+                        raise self.too_large()
+                    digest.update(chunk)
+                    buffer += chunk
+                    # blocos pequenos do servidor (64 KiB) viram writes de chunk_size: menos idas ao pool de threads
+                    if len(buffer) >= self.chunk_size:
+                        await output.write(bytes(buffer))
+                        buffer.clear()
+                if buffer:
+                    await output.write(bytes(buffer))
+            key = self.shard(namespace, digest.hexdigest(), EXTENSIONS.get(content_type, ""))
+            path = self.path(key)
+            await aiofiles.os.makedirs(os.path.dirname(path), exist_ok=True)
+            await aiofiles.os.replace(temporary, path)
+        except BaseException:
+            if await aiofiles.os.path.exists(temporary):
+                await aiofiles.os.remove(temporary)
+            raise
+        return StoredFile(key=key, url=f"{self.base_url}/{key}", size=size, sha256=digest.hexdigest(), content_type=content_type)
+
+    async def save(self, upload: UploadFile, namespace: str = "files") -> StoredFile:
+        """ Upload multipart (formulários). O Starlette já guardou a parte num temporário; aqui ela é copiada em blocos. """
+        self.check_size(str(upload.size) if upload.size is not None else None)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            while chunk := await upload.read(self.chunk_size):
+                yield chunk
+
+        return await self.save_stream(chunks(), upload.content_type, namespace)
+
+    async def delete(self, key: str, is_referenced: Callable[[str], Awaitable[bool]], grace: float = 3600) -> bool:
+        """ Conteúdo endereçado e deduplicado entre usuários: a mesma chave pode estar em registros de vários donos.
+            Só apaga quando `is_referenced(key)` (a consulta do chamador às tabelas que guardam a chave) diz que nenhum
+            registro a usa e o arquivo não foi regravado nos últimos `grace` s, janela em que um upload do mesmo
+            conteúdo pode ainda não ter salvo o seu registro. Devolve se o arquivo foi apagado.
+        """
+        path = self.path(key)
+        try:
+            stat = await aiofiles.os.stat(path)
+        except FileNotFoundError:
+            return False
+        if time.time() - stat.st_mtime < grace or await is_referenced(key):
+            return False
+        try:
+            await aiofiles.os.remove(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+
+class UploadFiles(StaticFiles):
+    """ StaticFiles (Range, If-None-Match, If-Modified-Since) com ETag forte igual ao sha256 do nome, o mesmo em todas
+        as réplicas do app, e cache imutável para os arquivos endereçados por conteúdo. O Content-Type vem da tabela
+        do upload (MEDIA_TYPES), não do mimetypes: nada gravado aqui é servido como HTML na origem do app. `nosniff`
+        e `Content-Security-Policy: sandbox` seguram o resto, e o que não é mídia vai como download.
+    """
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope, status_code: int = 200) -> Response:
+        digest, extension = os.path.splitext(os.path.basename(full_path))
+        extension = extension.lower()
+        headers = {"x-content-type-options": "nosniff", "content-security-policy": "sandbox"}
+        if extension not in INLINE:
+            headers["content-disposition"] = "attachment"
+        if DIGEST.fullmatch(digest):
+            headers.update({"etag": f'"{digest}"', "cache-control": IMMUTABLE})
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result, headers=headers, media_type=MEDIA_TYPES.get(extension, "application/octet-stream"))
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,48 @@
+from importlib import resources
+from string import Template
+from threading import Lock
+from typing import Dict
+
+TEMPLATE_SUFFIX = ".tpl"
+
+
+class TemplateRegistry:
+    """ Templates `.tpl` distribuídos como package data, lidos via `importlib.resources` só no primeiro uso.
+        Funciona igual a partir do diretório, de um wheel instalado ou de um zip; cada template é compilado uma única vez.
+    """
+
+    def __init__(self, package: str = __package__):
+        self.package = package
+        self._templates: Dict[str, Template] = {}
+        self._lock = Lock()
+
+    def source(self, name: str) -> str:
+        """ Conteúdo bruto de `name` ("projects/main" -> projects/main.tpl). """
+        *parts, last = name.split("/")
+        resource = resources.files(self.package).joinpath(*parts, last + TEMPLATE_SUFFIX)
+        try:
+            return resource.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template not found: {name}") from None
+
+    def get(self, name: str) -> Template:
+        template = self._templates.get(name)
+        if template is None:
+            with self._lock:
+                template = self._templates.get(name)
+                if template is None:
+                    template = self._templates[name] = Template(self.source(name))
+        return template
+
+    def render(self, template_name: str, /, **context: str) -> str:
+        return self.get(template_name).safe_substitute(**context)
+
+    def loaded(self) -> list[str]:
+        return sorted(self._templates)
+
+
+registry = TemplateRegistry()
+
+
+def render_template(template_name: str, /, **context: str) -> str:
+    return registry.render(template_name, **context)
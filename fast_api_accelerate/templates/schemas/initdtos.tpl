@@ -0,0 +1,11 @@
+
+from .login import LoginRequest
+
+from .refresh import RefreshTokenResponse
+
+from .token import TokenResponse
+
+from .refreshrequest import RefreshRequest
+
+
+__all__ = ['LoginRequest','RefreshTokenResponse','TokenResponse','RefreshRequest']
@@ -1,2 +1,5 @@
+from ..registry import render_template
+
+
 def user_schemas_template(name:str ) -> str:
-    return f""" """
\ No newline at end of file
+    return render_template("schemas/schemas")
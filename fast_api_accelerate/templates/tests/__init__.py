@@ -1,4 +1,15 @@
 from .test_auth_controller import test_auth_controller_template
 from .test_auth_service import test_auth_service_template
+from .conftest import conftest_template
+from .test_cache import test_cache_template
+from .test_replicas import test_replicas_template
+from .test_token_verifier import test_token_verifier_template
+from .test_revocation import test_revocation_template
+from .test_serialization import test_serialization_template
+from .test_startup import test_startup_template
+from .test_uploads import test_uploads_template
+from .test_http_cache import test_http_cache_template
+from .test_rate_limit import test_rate_limit_template
+from .test_metrics import test_metrics_template
 
-__all__ = ["test_auth_controller_template","test_auth_service_template"]
\ No newline at end of file
+__all__ = ["test_auth_controller_template","test_auth_service_template","conftest_template","test_cache_template","test_replicas_template","test_token_verifier_template","test_revocation_template","test_serialization_template","test_startup_template","test_uploads_template","test_http_cache_template","test_rate_limit_template","test_metrics_template"]
\ No newline at end of file
@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def conftest_template() -> str:
+    return render_template("tests/conftest")
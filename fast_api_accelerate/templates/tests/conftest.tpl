@@ -0,0 +1,12 @@
+import pytest
+from src.base.query_counter import count_queries
+
+
+@pytest.fixture
+def max_queries():
+    """ Detector de N+1: `with max_queries(2): ...` falha com NPlusOneError se o bloco executar mais de 2 statements.
+        Para checar todas as requests da app, defina QUERY_COUNT_LIMIT no ambiente de testes.
+    """
+    def guard(limit: int):
+        return count_queries(limit=limit)
+    return guard
@@ -0,0 +1,199 @@
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import HTTPException
+from modules.auth.services.auth_service import AuthService, ClientType
+from modules.auth.utils.passwords import PasswordHasher
+
+@pytest.fixture
+def mock_repository():
+    return AsyncMock()
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(bcrypt_rounds=4)  # custo mínimo do bcrypt: testes rápidos com hashes reais
+    yield hasher
+    hasher.close()
+
+@pytest.fixture
+def auth_service(mock_repository, hasher):
+    return AuthService(repository=mock_repository, hasher=hasher)
+
+def make_user(password: str) -> MagicMock:
+    user = MagicMock()
+    user.id = 1
+    user.password = password
+    user.username = "test"
+    user.email = "test@email.com"
+    user.image = "img.png"
+    user.roles = ["admin"]
+    user.status = "ACTIVE"
+    return user
+
+class TestAuthServiceLogin:
+
+    @pytest.mark.asyncio
+    async def test_login_success(self, auth_service, mock_repository, mocker):
+        # given
+        user = MagicMock()
+        user.id = 1
+        user.password = "hashed_password"
+        user.username = "test"
+        user.email = "test@email.com"
+        user.image = "img.png"
+        user.roles = ["admin"]
+        user.status = "ACTIVE"
+        mock_repository.get_by_email.return_value = user
+        mocker.patch.object(auth_service, "verify_password", return_value=True)
+        mocker.patch.object(auth_service, "_create_token", side_effect=["access123", "refresh123"])
+
+        result = await auth_service.login("test@email.com","123",ClientType.WEB) # when
+
+        # then
+        assert result["access_token"] == "access123"
+        assert result["refresh_token"] == "refresh123"
+
+    @pytest.mark.asyncio
+    async def test_login_user_not_found(self, auth_service, mock_repository):
+        mock_repository.get_by_email.return_value = None
+
+        with pytest.raises(HTTPException) as exc:
+            await auth_service.login("no@user.com","123",ClientType.WEB)
+
+        assert exc.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_login_invalid_password(self, auth_service, mock_repository, mocker):
+        # given
+        user = MagicMock()
+        user.id = 1
+        user.password = "hashed"
+        user.username = "test"
+        user.email = "test@email.com"
+        user.image = "img.png"
+        user.roles = []
+        user.status = "ACTIVE"
+
+        mock_repository.get_by_email.return_value = user
+        mocker.patch.object(auth_service, "verify_password", return_value=False)
+
+        # when
+        with pytest.raises(HTTPException) as exc: 
+            await auth_service.login("test@email.com","wrong",ClientType.WEB)
+
+        assert exc.value.status_code == 401 # then
+
+class TestAuthServicePassword:
+
+    @pytest.mark.asyncio
+    async def test_verify_password_correct(self, auth_service, hasher):
+        hashed = await hasher.hash("123")
+        assert await auth_service.verify_password("123", hashed) is True
+
+    @pytest.mark.asyncio
+    async def test_verify_password_incorrect(self, auth_service, hasher):
+        hashed = await hasher.hash("123")
+        assert await auth_service.verify_password("wrong", hashed) is False
+
+    @pytest.mark.asyncio
+    async def test_verify_password_invalid_hash(self, auth_service):
+        assert await auth_service.verify_password("123", "invalid_hash") is False
+
+    @pytest.mark.asyncio
+    async def test_login_rehashes_when_the_cost_changes(self, mock_repository, mocker):
+        old = PasswordHasher(bcrypt_rounds=4)
+        user = make_user(await old.hash("123"))
+        mock_repository.get_by_email.return_value = user
+        service = AuthService(repository=mock_repository, hasher=PasswordHasher(bcrypt_rounds=5))
+        mocker.patch.object(service, "_create_token", return_value="token")
+
+        await service.login("test@email.com", "123", ClientType.WEB)
+
+        assert user.password.startswith("$2b$05$")
+        mock_repository.update.assert_awaited_once_with(user)
+        await service.login("test@email.com", "123", ClientType.WEB)
+        mock_repository.update.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_login_migrates_bcrypt_hashes_to_argon2(self, mock_repository, hasher, mocker):
+        pytest.importorskip("argon2")
+        user = make_user(await hasher.hash("123"))
+        mock_repository.get_by_email.return_value = user
+        service = AuthService(repository=mock_repository, hasher=PasswordHasher(scheme="argon2", argon2_memory_cost=1024))
+        mocker.patch.object(service, "_create_token", return_value="token")
+
+        await service.login("test@email.com", "123", ClientType.WEB)
+
+        assert user.password.startswith("$argon2")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_logins_do_not_block_the_event_loop(self, hasher):
+        hashed = await hasher.hash("123")
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        assert all(await asyncio.gather(*(hasher.verify("123", hashed) for _ in range(8))))
+        task.cancel()
+        assert ticks > 8
+
+class TestAuthServiceTokens:
+
+    def test_create_token_success(self, auth_service, mocker):
+        mocker.patch("modules.auth.services.auth_service.jwt.encode",return_value="token123")
+
+        token = auth_service._create_token({"id": "1"},token_type="access",client_type=ClientType.WEB)
+
+        assert token == "token123"
+
+    def test_create_token_invalid_payload(self, auth_service):
+        with pytest.raises(HTTPException):
+            auth_service._create_token({},token_type="access",client_type=ClientType.WEB)
+
+class TestAuthServiceRefresh:
+
+    @pytest.mark.asyncio
+    async def test_refresh_success(self, auth_service, mock_repository, mocker):
+        mocker.patch.object(auth_service,"decode_token",return_value={"id": "1", "type": "refresh"})
+
+        user = MagicMock()
+        user.id = 1
+        user.username = "updated"
+        user.email = "updated@email.com"
+        user.image = "new.png"
+        user.roles = ["admin"]
+        user.status = "ACTIVE"
+
+        mock_repository.get_by_id.return_value = user
+
+        mocker.patch.object(auth_service, "_create_token", return_value="new_access")
+
+        result = await auth_service.refresh("valid_refresh_token",ClientType.WEB)
+
+        assert result["access_token"] == "new_access"
+
+    @pytest.mark.asyncio
+    async def test_refresh_invalid_type(self, auth_service, mocker):
+        mocker.patch.object(auth_service,"decode_token",return_value={"id": "1", "type": "access"})
+
+        with pytest.raises(HTTPException) as exc:
+            await auth_service.refresh("invalid_token",ClientType.WEB)
+
+        assert exc.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_refresh_user_not_found(self, auth_service, mock_repository, mocker):
+        # given
+        mocker.patch.object(auth_service,"decode_token",return_value={"id": "1", "type": "refresh"})
+        mock_repository.get_by_id.return_value = None
+
+        with pytest.raises(HTTPException) as exc: # when
+            await auth_service.refresh("valid_refresh",ClientType.WEB)
+
+        assert exc.value.status_code == 401 # then
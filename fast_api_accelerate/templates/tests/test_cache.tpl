@@ -0,0 +1,107 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.base.base_service import BaseService
+from src.base.cache import MISSING, EntityCache, MemoryCache, RedisCache
+
+
+class FakeRedis:
+    """ Fake local do protocolo usado pelo RedisCache (get/set com px/delete), sem servidor. """
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, px=None):
+        self.data[key] = value.encode("utf-8")
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    backend = MemoryCache() if request.param == "memory" else RedisCache(FakeRedis())
+    return EntityCache(backend, "users", ttl=60, negative_ttl=5)
+
+
+@pytest.fixture
+def repository():
+    repository = AsyncMock()
+    repository.model = MagicMock()
+    repository.to_row = MagicMock(side_effect=lambda entity: {"id": entity.id, "email": entity.email})
+    repository.from_row.side_effect = lambda row: MagicMock(**row)
+    return repository
+
+
+class TestMemoryCache:
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_and_least_recently_used_is_evicted(self):
+        now = [0.0]
+        backend = MemoryCache(max_size=2, clock=lambda: now[0])
+        await backend.set("a", "1", ttl=10)
+        await backend.set("b", "2", ttl=10)
+        await backend.get("a")
+        await backend.set("c", "3", ttl=10)
+
+        assert await backend.get("b") is None
+        assert await backend.get("a") == "1"
+        now[0] = 11
+        assert await backend.get("a") is None
+
+
+class TestEntityCache:
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_reads_through_and_counts_hits(self, cache, repository):
+        repository.get_for_write.return_value = MagicMock(id=1, email="ana")
+        service = BaseService(repository, cache=cache)
+
+        await service.get_by_id(1)
+        user = await service.get_by_id(1)
+
+        assert user.email == "ana"
+        repository.get_for_write.assert_awaited_once()
+        repository.get_by_id.assert_not_awaited()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_missing_ids_are_negatively_cached_until_created(self, cache, repository):
+        repository.get_for_write.return_value = None
+        repository.create.return_value = MagicMock(id=7, email="new")
+        service = BaseService(repository, cache=cache)
+
+        assert await service.find_by_id(7) is None
+        assert await cache.get(7) is MISSING
+        await service.create({"email": "new"})
+
+        assert await cache.get(7) is None
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_invalidate(self, cache, repository):
+        repository.get_for_write.return_value = MagicMock(id=1, email="ana")
+        repository.update.side_effect = lambda entity: entity
+        repository.delete.return_value = True
+        service = BaseService(repository, cache=cache)
+
+        await service.update(1, {"email": "bia"})
+        assert await cache.get(1) is None
+        await service.get_by_id(1)
+        await service.delete(1)
+        assert await cache.get(1) is None
+
+    @pytest.mark.asyncio
+    async def test_update_starts_from_the_primary_not_the_cache(self, cache, repository):
+        await cache.set(1, {"id": 1, "email": "stale"})
+        repository.get_for_write.return_value = MagicMock(id=1, email="fresh")
+        repository.update.side_effect = lambda entity: entity
+        service = BaseService(repository, cache=cache)
+
+        updated = await service.update(1, {"name": "Ana"})
+
+        assert updated.email == "fresh" and updated.name == "Ana"
+        repository.from_row.assert_not_awaited()
+        repository.get_by_id.assert_not_awaited()
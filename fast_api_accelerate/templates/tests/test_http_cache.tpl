@@ -0,0 +1,161 @@
+import gzip
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from src.base import http_cache
+from src.base.http_cache import HttpCacheMiddleware, ResponseCache, cache_control
+
+ITEMS = [{"id": index, "title": f"Item {index}"} for index in range(200)]
+
+
+@pytest.fixture
+def calls():
+    return {"items": 0}
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache(max_size=10)
+
+
+def build_client(calls, cache, principal=None) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/items", dependencies=[Depends(cache_control(max_age=30))])
+    async def items():
+        calls["items"] += 1
+        return ITEMS
+
+    @app.post("/items")
+    async def create_item():
+        return {"id": 200}
+
+    @app.get("/me", dependencies=[Depends(cache_control())])
+    async def me():
+        return {"id": 1, "padding": "x" * 2000}
+
+    @app.get("/export")
+    async def export():
+        return StreamingResponse(iter([b"a\n", b"b\n"]), media_type="application/x-ndjson")
+
+    app.add_middleware(HttpCacheMiddleware, min_size=512, cache=cache, principal=principal)
+    return TestClient(app)
+
+
+@pytest.fixture
+def client(calls, cache):
+    return build_client(calls, cache)
+
+
+class TestConditionalRequests:
+
+    def test_get_responses_get_a_weak_etag_and_matching_requests_get_304(self, client):
+        first = client.get("/me")
+        etag = first.headers["etag"]
+
+        again = client.get("/me", headers={"if-none-match": etag})
+
+        assert etag.startswith('W/"') and first.headers["cache-control"] == "private, no-cache"
+        assert again.status_code == 304 and again.content == b""
+        assert again.headers["etag"] == etag
+
+    def test_routes_with_max_age_are_answered_from_the_cache(self, client, calls, cache):
+        etag = client.get("/items").headers["etag"]
+
+        assert client.get("/items").json() == ITEMS
+        assert client.get("/items", headers={"if-none-match": etag}).status_code == 304
+        assert calls["items"] == 1
+        assert cache.stats()["hits"] == 2
+
+    def test_credentials_bypass_the_cache_without_a_principal(self, client, calls):
+        for _ in range(2):
+            client.get("/items", headers={"authorization": "Bearer a"})
+            client.get("/items", headers={"cookie": "session=a"})
+
+        assert calls["items"] == 4
+
+    def test_with_a_principal_the_cache_is_per_verified_user(self, calls, cache):
+        users = {"Bearer a": "1", "Bearer a-renewed": "1", "Bearer b": "2"}
+
+        async def principal(headers):
+            return users.get(headers.get("authorization"))
+
+        client = build_client(calls, cache, principal)
+        for token in ("Bearer a", "Bearer a-renewed", "Bearer b", "Bearer revoked", "Bearer revoked"):
+            client.get("/items", headers={"authorization": token})
+
+        # a e a-renewed são o mesmo usuário; o token que não verifica nunca é servido do cache
+        assert calls["items"] == 4
+
+    def test_writes_drop_the_cached_resource(self, client, calls):
+        client.get("/items")
+        client.post("/items")
+        client.get("/items")
+
+        assert calls["items"] == 2
+
+    def test_cached_entries_expire_with_max_age(self, client, calls, cache):
+        now = [0.0]
+        cache._clock = lambda: now[0]
+        client.get("/items")
+        now[0] = 31
+
+        client.get("/items")
+
+        assert calls["items"] == 2
+
+
+class TestCacheLimits:
+
+    def test_entries_are_evicted_by_total_bytes(self):
+        cache = ResponseCache(max_size=100, max_bytes=250)
+        for index in range(3):
+            cache.set(f"/a|/a/{index}|", [], b"x" * 100, "etag", ttl=30)
+
+        assert len(cache) == 2 and cache.bytes == 200
+        assert cache.get("/a|/a/0|") is None
+
+    def test_compressed_variants_count_and_large_bodies_are_not_stored(self):
+        cache = ResponseCache(max_size=100, max_bytes=250, max_entry_size=150)
+        first = cache.set("/a|/a/1|", [], b"x" * 100, "etag", ttl=30)
+        cache.set("/a|/a/2|", [], b"y" * 100, "etag", ttl=30)
+
+        cache.encode(cache.get("/a|/a/2|"), "gzip", lambda: b"z" * 60)
+
+        assert cache.get(first.key) is None and cache.bytes == 160
+        assert cache.set("/a|/a/3|", [], b"w" * 151, "etag", ttl=30) is None and len(cache) == 1
+
+
+class TestCompression:
+
+    def test_large_bodies_are_gzipped_and_small_ones_left_alone(self, client, monkeypatch):
+        monkeypatch.setattr(http_cache, "brotli", None)
+        response = client.get("/items", headers={"accept-encoding": "gzip"})
+        raw = client.get("/me", headers={"accept-encoding": "identity"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json() == ITEMS
+        assert "content-encoding" not in raw.headers and len(raw.content) > 2000
+
+    def test_the_cached_compressed_body_is_reused(self, client, cache, monkeypatch):
+        monkeypatch.setattr(http_cache, "brotli", None)
+        client.get("/items", headers={"accept-encoding": "gzip"})
+        client.get("/items", headers={"accept-encoding": "gzip"})
+
+        entry = next(iter(cache._entries.values()))
+        assert gzip.decompress(entry.encoded["gzip"]) == entry.body
+
+    def test_brotli_is_preferred_when_installed(self, client):
+        if http_cache.brotli is None:
+            pytest.skip("brotli não instalado")
+        response = client.get("/items", headers={"accept-encoding": "gzip, br"})
+
+        assert response.headers["content-encoding"] == "br"
+
+    def test_streaming_responses_pass_through(self, client):
+        response = client.get("/export", headers={"accept-encoding": "gzip"})
+
+        assert response.content == b"a\nb\n"
+        assert "etag" not in response.headers and "content-encoding" not in response.headers
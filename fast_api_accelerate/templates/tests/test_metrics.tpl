@@ -0,0 +1,158 @@
+import asyncio
+import time
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from src.base import metrics
+from src.base.metrics import Gauge, LoopLagMonitor, MetricsMiddleware, MetricsRegistry, metrics_endpoint
+from src.core import startup
+from src.core.database import Database
+
+
+def sample(name: str, **labels) -> float:
+    """ Valor de uma série no texto do /metrics (0 se ela ainda não existe). """
+    selector = name + ("{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}" if labels else "")
+    for line in metrics.registry.render().splitlines():
+        if line.startswith(selector + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    database = Database(url=f"sqlite+aiosqlite:///{tmp_path / 'app.db'}", replica_urls=[], options={"pool_size": 2, "max_overflow": 0})
+    monkeypatch.setattr(startup, "database", database)
+    monkeypatch.chdir(tmp_path)
+    return database
+
+
+class TestExposition:
+
+    def test_text_format(self):
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "Jobs.", ("queue",)).inc('a"b')
+        registry.gauge("temperature", "Temp.").set(21.5)
+        histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+        for value in (0.05, 0.5, 5):
+            histogram.observe(value)
+
+        lines = registry.render().splitlines()
+
+        assert "# TYPE jobs_total counter" in lines and 'jobs_total{queue="a\\"b"} 1' in lines
+        assert "temperature 21.5" in lines
+        assert ['latency_seconds_bucket{le="0.1"} 1', 'latency_seconds_bucket{le="1"} 2', 'latency_seconds_bucket{le="+Inf"} 3'] == [line for line in lines if "_bucket" in line]
+        assert "latency_seconds_sum 5.55" in lines and "latency_seconds_count 3" in lines
+
+    def test_collectors_run_at_scrape_time_and_a_failing_one_is_skipped(self):
+        registry = MetricsRegistry()
+        calls = []
+
+        def queue_depth():
+            calls.append(1)
+            gauge = Gauge("queue_depth", "Depth.")
+            gauge.set(len(calls))
+            return [gauge]
+
+        registry.collector("queue", queue_depth)
+        registry.collector("broken", lambda: 1 / 0)
+
+        assert "queue_depth 1" in registry.render() and "queue_depth 2" in registry.render()
+
+
+class TestMetricsMiddleware:
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+
+        @app.get("/metrics-test/items/{item_id}")
+        async def item(item_id: int):
+            return {"id": item_id, "in_progress": sample("http_requests_in_progress", method="GET")}
+
+        app.add_middleware(MetricsMiddleware)
+        app.add_api_route("/metrics", metrics_endpoint("secret"), methods=["GET"])
+        return TestClient(app)
+
+    def test_requests_are_labelled_by_route_template(self, client):
+        before = sample("http_request_duration_seconds_count", method="GET", route="/metrics-test/items/{item_id}")
+        responses = [client.get(f"/metrics-test/items/{index}") for index in range(3)]
+
+        assert sample("http_request_duration_seconds_count", method="GET", route="/metrics-test/items/{item_id}") == before + 3
+        assert sample("http_requests_total", method="GET", route="/metrics-test/items/{item_id}", status="200") >= 3
+        assert responses[0].json()["in_progress"] >= 1
+
+    def test_unknown_paths_share_one_series(self, client):
+        client.get("/metrics-test/nope/1")
+        client.get("/metrics-test/nope/2")
+
+        assert sample("http_requests_total", method="GET", route="unmatched", status="404") >= 2
+        assert "/metrics-test/nope" not in metrics.registry.render()
+
+    def test_the_endpoint_requires_the_token(self, client):
+        assert client.get("/metrics").status_code == 401
+
+        response = client.get("/metrics", headers={"authorization": "Bearer secret"})
+        assert response.status_code == 200 and response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE http_request_duration_seconds histogram" in response.text
+
+
+class TestDatabaseMetrics:
+
+    @pytest.mark.asyncio
+    async def test_queries_and_pool_checkouts_are_measured(self, database):
+        metrics.install_sqlalchemy()
+        engine = database.connect()
+        metrics.instrument_pool(engine.pool, "metrics-test")
+        selects = sample("db_query_duration_seconds_count", operation="SELECT")
+
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            await connection.execute(text("SELECT 2"))
+            with pytest.raises(Exception):
+                await connection.execute(text("SELECT * FROM missing_table"))
+            gauges = {metric.name: metric for metric in metrics.pool_metrics([("metrics-test", engine.pool)])}
+            assert gauges["db_pool_checked_out"].values[("metrics-test",)] == 1
+
+        assert sample("db_query_duration_seconds_count", operation="SELECT") == selects + 2
+        assert sample("db_query_errors_total", operation="SELECT") >= 1
+        assert metrics.db_pool_checkout.count("metrics-test") == 1
+        await database.dispose()
+
+
+class TestLoopLag:
+
+    @staticmethod
+    def slow_wakeups() -> int:
+        series = metrics.loop_lag.series.get((), [])
+        on_time = sum(count for bound, count in zip(metrics.loop_lag.buckets, series) if bound <= 0.05)
+        return metrics.loop_lag.count() - on_time
+
+    @pytest.mark.asyncio
+    async def test_a_blocked_loop_shows_up_as_lag(self):
+        before = self.slow_wakeups()
+        monitor = LoopLagMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)  # código síncrono segurando o event loop
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+
+        assert self.slow_wakeups() == before + 1
+        assert monitor._task is None
+
+
+class TestLifespan:
+
+    @pytest.mark.asyncio
+    async def test_the_app_collectors_report_pools_caches_and_startup(self, database):
+        app = FastAPI()
+
+        async with startup.lifespan(app):
+            text_format = metrics.registry.render()
+
+        assert 'db_pool_size{pool="primary"} 2' in text_format
+        assert 'app_startup_seconds{step="total"}' in text_format
+        assert 'cache_hit_ratio{cache="token"}' in text_format
+        assert "auth_rate_limit_rejected_total" in text_format
+        assert "metrics" in app.state.startup.steps
@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def test_rate_limit_template() -> str:
+    return render_template("tests/test_rate_limit")
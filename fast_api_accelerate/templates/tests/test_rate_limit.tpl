@@ -0,0 +1,200 @@
+import time
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from src.modules.auth.utils import RateLimiter, client_ip, parse_rate
+from src.modules.auth.utils.rate_limit import MemoryRateLimitBackend, Rate, RedisRateLimitBackend
+
+
+class FakeRedisPipeline:
+    """ Fake local de pipeline INCRBY/EXPIRE, o suficiente para o RedisRateLimitBackend. """
+
+    def __init__(self, data):
+        self.data = data
+        self.commands = []
+
+    def incrby(self, key, amount):
+        self.commands.append(("incrby", key, amount))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+
+    async def execute(self):
+        results = []
+        for command, key, value in self.commands:
+            if command == "incrby":
+                self.data[key] = self.data.get(key, 0) + value
+                results.append(str(self.data[key]).encode())
+            else:
+                results.append(True)
+        return results
+
+
+class FakeRedis:
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self.data)
+
+
+class FailingBackend:
+
+    async def add(self, deltas):
+        raise ConnectionError("redis down")
+
+
+@pytest.fixture
+def clock():
+    # início de uma janela de minuto, para as contas de Retry-After ficarem exatas
+    now = [float(int(time.time()) // 60 * 60)]
+    clock = lambda: now[0]
+    clock.advance = lambda seconds: now.__setitem__(0, now[0] + seconds)
+    return clock
+
+
+class TestParseRate:
+
+    def test_formats(self):
+        assert parse_rate("5/minute") == Rate(5, 60)
+        assert parse_rate("100 / hours") == Rate(100, 3600)
+        assert parse_rate("10/30seconds") == Rate(10, 30)
+        assert parse_rate("10/30") == Rate(10, 30)
+
+    def test_empty_or_zero_disables_the_rule(self):
+        assert parse_rate("") is None and parse_rate(None) is None and parse_rate("0/minute") is None
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            parse_rate("five per minute")
+
+
+class TestRateLimiter:
+
+    @pytest.mark.asyncio
+    async def test_allows_up_to_the_limit_then_rejects_with_retry_after(self, clock):
+        limiter = RateLimiter({"ip": Rate(3, 60)}, clock=clock)
+        decisions = [await limiter.hit({"ip": "10.0.0.1"}) for _ in range(4)]
+
+        assert [decision.allowed for decision in decisions] == [True, True, True, False]
+        assert [decision.remaining for decision in decisions[:3]] == [2, 1, 0]
+        # janela cheia: só depois de uma janela e mais 1/3 da seguinte o peso da anterior cai abaixo do limite
+        assert decisions[3].rule == "ip" and decisions[3].retry_after == pytest.approx(80)
+        assert (await limiter.hit({"ip": "10.0.0.2"})).allowed
+
+    @pytest.mark.asyncio
+    async def test_the_window_slides(self, clock):
+        limiter = RateLimiter({"ip": Rate(3, 60)}, clock=clock)
+        for _ in range(3):
+            await limiter.hit({"ip": "10.0.0.1"})
+
+        clock.advance(60)
+        assert not (await limiter.hit({"ip": "10.0.0.1"})).allowed
+        clock.advance(21)
+        assert (await limiter.hit({"ip": "10.0.0.1"})).allowed
+        clock.advance(119)
+        assert limiter.counters("ip", "10.0.0.1")["current"] == 1 and (await limiter.hit({"ip": "10.0.0.1"})).remaining == 2
+
+    @pytest.mark.asyncio
+    async def test_a_rejected_attempt_does_not_consume_the_other_rules(self, clock):
+        limiter = RateLimiter({"ip": Rate(10, 60), "account": Rate(2, 60)}, clock=clock)
+        for _ in range(5):
+            await limiter.hit({"ip": "10.0.0.1", "account": "Ana@Example.com"})
+
+        assert limiter.counters("ip", "10.0.0.1") == {"current": 2, "previous": 0, "allowed": 2, "rejected": 0}
+        assert limiter.counters("account", "ana@example.com")["rejected"] == 3
+        assert (await limiter.hit({"ip": "10.0.0.1", "account": "bia@example.com"})).allowed
+
+    @pytest.mark.asyncio
+    async def test_unknown_rules_and_empty_keys_are_ignored(self, clock):
+        limiter = RateLimiter({"ip": Rate(1, 60), "account": None}, clock=clock)
+
+        assert (await limiter.hit({"ip": "10.0.0.1", "account": "a@b.c", "device": "x"})).allowed
+        assert (await limiter.hit({"ip": None})).allowed
+
+    @pytest.mark.asyncio
+    async def test_state_is_bounded_by_max_keys(self, clock):
+        limiter = RateLimiter({"ip": Rate(5, 60)}, max_keys=100, clock=clock)
+        for index in range(1000):
+            await limiter.hit({"ip": f"10.0.{index // 256}.{index % 256}"})
+
+        assert limiter.stats()["ip"]["keys"] <= 100
+
+    @pytest.mark.asyncio
+    async def test_stats_report_the_most_rejected_keys(self, clock):
+        limiter = RateLimiter({"account": Rate(1, 60)}, clock=clock)
+        for _ in range(4):
+            await limiter.hit({"account": "victim@example.com"})
+        await limiter.hit({"account": "user@example.com"})
+
+        stats = limiter.stats()["account"]
+        assert stats["allowed"] == 2 and stats["rejected"] == 3 and stats["keys"] == 2
+        assert stats["top"][0]["key"] == "victim@example.com" and stats["top"][0]["rejected"] == 3
+
+
+class TestSharedBackend:
+
+    @pytest.fixture(params=["memory", "redis"])
+    def backend(self, request, clock):
+        return MemoryRateLimitBackend(clock=clock) if request.param == "memory" else RedisRateLimitBackend(FakeRedis())
+
+    @pytest.mark.asyncio
+    async def test_workers_share_their_counts_after_a_sync(self, backend, clock):
+        workers = [RateLimiter({"account": Rate(4, 60)}, backend=backend, sync_interval=1, clock=clock) for _ in range(2)]
+        for worker in workers:
+            assert (await worker.hit({"account": "ana@example.com"})).allowed
+            assert (await worker.hit({"account": "ana@example.com"})).allowed
+
+        clock.advance(1)
+        # cada worker só viu 2 das 4; a sincronização de um leva as contagens dele para o outro
+        assert (await workers[0].hit({"account": "ana@example.com"})).allowed
+        assert not (await workers[1].hit({"account": "ana@example.com"})).allowed
+        clock.advance(1)
+        assert not (await workers[0].hit({"account": "ana@example.com"})).allowed
+        assert workers[0].counters("account", "ana@example.com")["current"] == 5
+
+    @pytest.mark.asyncio
+    async def test_keys_are_hashed_in_redis(self, clock):
+        redis = FakeRedis()
+        limiter = RateLimiter({"account": Rate(4, 60)}, backend=RedisRateLimitBackend(redis), clock=clock)
+        await limiter.hit({"account": "ana@example.com"})
+        await limiter.sync()
+
+        assert len(redis.data) == 1 and "ana" not in next(iter(redis.data))
+
+    @pytest.mark.asyncio
+    async def test_a_failing_backend_keeps_the_local_limit(self, clock):
+        limiter = RateLimiter({"ip": Rate(2, 60)}, backend=FailingBackend(), clock=clock)
+        for _ in range(3):
+            decision = await limiter.hit({"ip": "10.0.0.1"})
+            clock.advance(1)
+
+        assert not decision.allowed and sum(limiter._unsynced.values()) == 2
+
+
+class TestLoginThrottling:
+
+    @pytest.fixture
+    def hashes(self):
+        return {"count": 0}
+
+    @pytest.fixture
+    def client(self, hashes, clock):
+        limiter = RateLimiter({"ip": parse_rate("10/minute"), "account": parse_rate("3/minute")}, clock=clock)
+        app = FastAPI()
+
+        @app.post("/auth/login")
+        async def login(request: Request, email: str):
+            await limiter.enforce({"ip": client_ip(request), "account": email})
+            hashes["count"] += 1
+            return {"ok": True}
+
+        return TestClient(app)
+
+    def test_abusive_attempts_get_429_before_the_password_hash(self, client, hashes):
+        responses = [client.post("/auth/login", params={"email": "ana@example.com"}) for _ in range(5)]
+
+        assert [response.status_code for response in responses] == [200, 200, 200, 429, 429]
+        assert responses[-1].headers["retry-after"] == "80"
+        assert hashes["count"] == 3
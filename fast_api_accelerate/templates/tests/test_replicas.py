@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def test_replicas_template() -> str:
+    return render_template("tests/test_replicas")
@@ -0,0 +1,142 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import String, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from src.base.base_repository import BaseRepository
+from src.base.base_service import BaseService
+from src.base.cache import EntityCache, MemoryCache
+from src.base.routing import ReplicaSet, RoutingSession
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Note(Base):
+    __tablename__ = "notes"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    source: Mapped[str] = mapped_column(String(20))
+    kind: Mapped[str] = mapped_column(String(20), default="plain")
+
+
+@pytest_asyncio.fixture
+async def engines(tmp_path):
+    """ Dois bancos locais com o mesmo schema: a linha 1 diz de qual banco a leitura veio. """
+    engines = {}
+    for name in ("primary", "replica"):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            await connection.execute(Note.__table__.insert(), {"id": 1, "source": name})
+        engines[name] = engine
+    yield engines
+    for engine in engines.values():
+        await engine.dispose()
+
+
+def repository(engines, replicas: ReplicaSet, sticky: bool = True) -> BaseRepository:
+    factory = async_sessionmaker(bind=engines["primary"], expire_on_commit=False, class_=AsyncSession, sync_session_class=RoutingSession, replicas=replicas, sticky=sticky)
+    return BaseRepository(Note, factory())
+
+
+class TestReadRouting:
+
+    @pytest.mark.asyncio
+    async def test_reads_go_to_the_replica_and_writes_to_the_primary(self, engines):
+        repo = repository(engines, ReplicaSet([engines["replica"]]))
+
+        assert (await repo.get_by_id(1)).source == "replica"
+        await repo.create(Note(id=2, source="new"))
+
+        async with engines["primary"].connect() as connection:
+            assert (await connection.execute(select(Note.id))).scalars().all() == [1, 2]
+        await repo.db.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sticky, expected", [(True, [1, 2]), (False, [1])])
+    async def test_read_your_writes_keeps_the_request_on_the_primary(self, engines, sticky, expected):
+        repo = repository(engines, ReplicaSet([engines["replica"]]), sticky=sticky)
+
+        await repo.create(Note(id=2, source="new"))
+
+        assert [note.id for note in await repo.get_all()] == expected
+        await repo.db.close()
+
+    @pytest.mark.asyncio
+    async def test_writes_start_from_the_primary_even_after_a_replica_read(self, engines):
+        repo = repository(engines, ReplicaSet([engines["replica"]]), sticky=False)
+        assert (await repo.get_by_id(1)).source == "replica"
+
+        assert (await repo.get_for_write(1)).source == "primary"
+        await repo.db.close()
+
+    @pytest.mark.asyncio
+    async def test_the_entity_cache_is_filled_from_the_primary(self, engines):
+        repo = repository(engines, ReplicaSet([engines["replica"]]), sticky=False)
+        cache = EntityCache(MemoryCache(), "notes", ttl=60, negative_ttl=5)
+        service = BaseService(repo, cache=cache)
+        async with engines["primary"].begin() as connection:
+            await connection.execute(Note.__table__.insert(), {"id": 2, "source": "primary"})
+
+        # a réplica ainda não tem a linha 2 e guarda uma versão antiga da 1
+        assert (await service.find_by_id(1)).source == "primary"
+        assert (await service.find_by_id(2)).source == "primary"
+        assert (await cache.get(1))["source"] == "primary" and (await cache.get(2))["id"] == 2
+        await repo.db.close()
+
+    @pytest.mark.asyncio
+    async def test_without_replicas_everything_reads_from_the_primary(self, engines):
+        repo = repository(engines, ReplicaSet([]))
+
+        assert (await repo.get_by_field("id", 1)).source == "primary"
+        await repo.db.close()
+
+
+class TestBulkWrites:
+
+    @pytest.mark.asyncio
+    async def test_unset_attributes_keep_the_model_defaults(self, engines):
+        repo = repository(engines, ReplicaSet([engines["replica"]]))
+
+        await repo.bulk_create([Note(id=2, source="new"), Note(id=3, source="new", kind="pinned")])
+
+        async with engines["primary"].connect() as connection:
+            assert (await connection.execute(select(Note.id, Note.kind).where(Note.id > 1))).all() == [(2, "plain"), (3, "pinned")]
+        await repo.db.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_counts_only_existing_rows(self, engines):
+        repo = repository(engines, ReplicaSet([engines["replica"]]))
+
+        assert await repo.bulk_update([{"id": 1, "source": "edited"}, {"id": 99, "source": "ghost"}]) == 1
+
+        async with engines["primary"].connect() as connection:
+            assert (await connection.execute(select(Note.source, Note.kind))).all() == [("edited", "plain")]
+        await repo.db.close()
+
+
+class TestReplicaHealth:
+
+    @pytest.mark.asyncio
+    async def test_failed_replica_is_evicted_and_the_read_falls_back(self, engines, tmp_path):
+        now = [0.0]
+        broken = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica'}.db")
+        replicas = ReplicaSet([broken], retry_after=30, clock=lambda: now[0])
+        repo = repository(engines, replicas)
+
+        assert (await repo.get_by_id(1)).source == "primary"
+        assert not replicas.replicas[0].healthy
+        now[0] = 31
+        assert replicas.pick() is replicas.replicas[0]
+        await repo.db.close()
+        await broken.dispose()
+
+    @pytest.mark.asyncio
+    async def test_health_check_skips_dead_replicas_in_the_rotation(self, engines, tmp_path):
+        broken = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica'}.db")
+        replicas = ReplicaSet([broken, engines["replica"]])
+
+        assert await replicas.check() == 1
+        assert {replicas.pick().engine for _ in range(3)} == {engines["replica"]}
+        await broken.dispose()
@@ -0,0 +1,180 @@
+import asyncio
+import time
+from datetime import timedelta
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import HTTPException
+from src.modules.auth.services.auth_service import AuthService
+from src.modules.auth.utils import ClientType, RevocationList, TokenVerifier
+from src.modules.auth.utils.revocation import BloomFilter, MemoryRevocationBackend, RedisRevocationBackend
+
+
+class FakeRedisStream:
+    """ Fake local de XADD/XREAD, o suficiente para o RedisRevocationBackend. """
+
+    def __init__(self):
+        self.messages = []
+        self.reads = 0
+
+    async def xadd(self, key, fields, maxlen=None, approximate=True):
+        message_id = f"{len(self.messages) + 1}-0"
+        self.messages.append((message_id.encode(), {name.encode(): value.encode() for name, value in fields.items()}))
+        return message_id
+
+    async def xread(self, streams, count=None):
+        self.reads += 1
+        (key, cursor), = streams.items()
+        after = int(cursor.split("-")[0])
+        messages = [message for message in self.messages if int(message[0].split(b"-")[0]) > after][:count]
+        return [(key.encode(), messages)] if messages else []
+
+
+class BrokenBackend:
+
+    def __init__(self):
+        self.fetches = 0
+
+    async def publish(self, jti, expires_at):
+        pass
+
+    async def fetch(self, cursor):
+        self.fetches += 1
+        await asyncio.sleep(0)
+        raise ConnectionError("redis down")
+
+
+@pytest.fixture
+def clock():
+    now = [time.time()]
+    clock = lambda: now[0]
+    clock.advance = lambda seconds: now.__setitem__(0, now[0] + seconds)
+    return clock
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    return MemoryRevocationBackend() if request.param == "memory" else RedisRevocationBackend(FakeRedisStream())
+
+
+class TestBloomFilter:
+
+    def test_no_false_negatives_and_a_bounded_false_positive_rate(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        assert all(f"jti-{i}" in bloom for i in range(1000))
+        assert sum(f"other-{i}" in bloom for i in range(10_000)) < 300
+
+
+class TestRevocationList:
+
+    @pytest.mark.asyncio
+    async def test_revoked_until_the_token_expires(self, clock):
+        revocations = RevocationList(clock=clock)
+        await revocations.revoke("abc", clock() + 60)
+
+        assert await revocations.is_revoked("abc")
+        assert not await revocations.is_revoked("other")
+        clock.advance(61)
+        assert not await revocations.is_revoked("abc")
+        assert len(revocations) == 0
+
+    @pytest.mark.asyncio
+    async def test_revocations_reach_other_workers_through_the_backend(self, backend, clock):
+        worker_a = RevocationList(backend, clock=clock)
+        worker_b = RevocationList(backend, sync_interval=1.0, clock=clock)
+        await worker_b.is_revoked("abc")
+
+        await worker_a.revoke("abc", clock() + 60)
+
+        clock.advance(1)
+        assert await worker_b.is_revoked("abc")
+
+    @pytest.mark.asyncio
+    async def test_a_new_worker_reads_the_whole_stream_in_its_first_sync(self, clock):
+        redis = FakeRedisStream()
+        writer = RevocationList(RedisRevocationBackend(redis), clock=clock)
+        for i in range(25):
+            await writer.revoke(f"jti-{i}", clock() + 60)
+
+        reader = RevocationList(RedisRevocationBackend(redis, batch=10), clock=clock)
+
+        assert await reader.is_revoked("jti-24") and len(reader) == 25
+        assert redis.reads == 3
+
+    @pytest.mark.asyncio
+    async def test_a_backend_outage_keeps_the_local_state_and_waits_for_the_next_interval(self, clock):
+        backend = BrokenBackend()
+        revocations = RevocationList(backend, sync_interval=1.0, clock=clock)
+        await revocations.revoke("abc", clock() + 60)
+
+        results = await asyncio.gather(*(revocations.is_revoked("abc") for _ in range(10)))
+        assert all(results) and backend.fetches == 1
+
+        assert await revocations.is_revoked("abc") and backend.fetches == 1
+        clock.advance(1)
+        assert await revocations.is_revoked("abc") and backend.fetches == 2
+
+    @pytest.mark.asyncio
+    async def test_the_filter_grows_past_its_capacity(self, clock):
+        revocations = RevocationList(capacity=8, clock=clock)
+        for i in range(20):
+            await revocations.revoke(f"jti-{i}", clock() + 60)
+
+        assert all([await revocations.is_revoked(f"jti-{i}") for i in range(20)])
+        assert revocations.bloom.capacity >= 20
+
+
+class TestTokenRevocation:
+
+    @pytest.fixture
+    def service(self):
+        return AuthService(repository=AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_logout_revokes_even_cached_access_tokens(self, service):
+        access = service._create_token({"id": "1"}, token_type="access", client_type=ClientType.WEB)
+        await service.verify_token(access)
+
+        await service.logout(access)
+
+        with pytest.raises(HTTPException) as exc:
+            await service.verify_token(access)
+        assert exc.value.detail == "Token revoked"
+
+    @pytest.mark.asyncio
+    async def test_refresh_skips_the_user_lookup_and_honours_revocation(self, service):
+        claims = {"id": "1", "username": "ana", "email": "ana@email.com", "image": None, "roles": ["admin"], "userStatus": "ACTIVE"}
+        access = service._create_token(claims, token_type="access", client_type=ClientType.WEB)
+        refresh = service._create_token(claims, token_type="refresh", client_type=ClientType.WEB)
+
+        renewed = await service.refresh(refresh, ClientType.WEB)
+
+        assert (await service.verify_token(renewed["access_token"]))["roles"] == ["admin"]
+        service.repository.get_by_id.assert_not_awaited()
+        await service.logout(access, refresh)
+        with pytest.raises(HTTPException):
+            await service.refresh(refresh, ClientType.WEB)
+
+    @pytest.mark.asyncio
+    async def test_old_refresh_claims_are_checked_against_the_user(self, service):
+        claims = {"id": "1", "username": "ana", "email": "ana@email.com", "image": None, "roles": ["admin"], "userStatus": "ACTIVE"}
+        refresh = service._create_token(claims, token_type="refresh", client_type=ClientType.WEB)
+        service.CLAIMS_MAX_AGE = timedelta(seconds=-1)
+        service.repository.get_by_id.return_value = MagicMock(id=1, username="ana", email="ana@email.com", image=None, roles=[], status="active")
+
+        renewed = await service.refresh(refresh, ClientType.WEB)
+        assert (await service.verify_token(renewed["access_token"]))["roles"] == []
+
+        service.repository.get_by_id.return_value.status = "blocked"
+        with pytest.raises(HTTPException) as exc:
+            await service.refresh(refresh, ClientType.WEB)
+        assert exc.value.detail == "User is not active"
+
+    @pytest.mark.asyncio
+    async def test_every_token_gets_its_own_jti(self, service):
+        verifier = TokenVerifier(service.SECRET_KEY)
+        tokens = [service._create_token({"id": "1"}, token_type="access", client_type=ClientType.WEB) for _ in range(2)]
+
+        assert len({(await verifier.verify(token))["jti"] for token in tokens}) == 2
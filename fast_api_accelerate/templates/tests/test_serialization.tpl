@@ -0,0 +1,83 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import List
+import pytest
+from pydantic import BaseModel, ConfigDict
+from src.base import streaming
+from src.base.pagination import Page
+from src.base.serialization import FastJSONResponse, dump_json, json_response, type_adapter, validate_many
+
+CREATED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class ItemResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    created_at: datetime
+
+
+def rows(count: int):
+    return [SimpleNamespace(id=index, title=f"Item {index}", created_at=CREATED_AT, secret="x") for index in range(count)]
+
+
+async def aiter(items):
+    for item in items:
+        yield item
+
+
+async def body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+class TestSerialization:
+
+    def test_type_adapters_are_built_once_per_type(self):
+        assert type_adapter(List[ItemResponse]) is type_adapter(List[ItemResponse])
+
+    def test_pages_of_orm_rows_serialize_straight_to_json(self):
+        page = Page(items=rows(3), next_cursor="abc", limit=3)
+
+        data = json.loads(dump_json(page, Page[ItemResponse]))
+
+        assert data["next_cursor"] == "abc" and len(data["items"]) == 3
+        assert data["items"][0] == {"id": 0, "title": "Item 0", "created_at": "2025-01-01T00:00:00Z"}
+
+    def test_validate_many_uses_the_response_fields_only(self):
+        items = validate_many(rows(2), ItemResponse)
+
+        assert [item.id for item in items] == [0, 1]
+        assert "secret" not in items[0].model_dump()
+
+    def test_json_response_carries_the_serialized_bytes(self):
+        response = json_response(rows(1), List[ItemResponse], status_code=201)
+
+        assert response.status_code == 201 and response.media_type == "application/json"
+        assert json.loads(response.body)[0]["title"] == "Item 0"
+
+    def test_fast_json_response_handles_non_json_types(self):
+        response = FastJSONResponse({"at": CREATED_AT, "item": ItemResponse(id=1, title="a", created_at=CREATED_AT), 1: "one"})
+
+        assert json.loads(response.body) == {"at": "2025-01-01T00:00:00Z", "item": {"id": 1, "title": "a", "created_at": "2025-01-01T00:00:00Z"}, "1": "one"}
+
+
+class TestStreaming:
+
+    @pytest.mark.asyncio
+    async def test_ndjson_export_spans_several_batches(self, monkeypatch):
+        monkeypatch.setattr(streaming, "BATCH_SIZE", 2)
+
+        lines = (await body(streaming.stream_response(aiter(rows(5)), ItemResponse))).decode().splitlines()
+
+        assert [json.loads(line)["id"] for line in lines] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_csv_export_has_one_header_and_a_row_per_item(self, monkeypatch):
+        monkeypatch.setattr(streaming, "BATCH_SIZE", 2)
+
+        lines = (await body(streaming.stream_response(aiter(rows(5)), ItemResponse, format="csv"))).decode().splitlines()
+
+        assert lines[0] == "id,title,created_at"
+        assert lines[1:] == [f"{index},Item {index},2025-01-01T00:00:00Z" for index in range(5)]
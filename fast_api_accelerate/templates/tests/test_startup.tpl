@@ -0,0 +1,59 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from src.core import startup
+from src.core.configs import settings
+from src.core.database import Database
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    database = Database(url=f"sqlite+aiosqlite:///{tmp_path / 'app.db'}", replica_urls=[], options={"pool_size": 5, "max_overflow": 0})
+    monkeypatch.setattr(startup, "database", database)
+    monkeypatch.chdir(tmp_path)
+    return database
+
+
+class TestWarmUp:
+
+    @pytest.mark.asyncio
+    async def test_warm_up_leaves_open_connections_in_the_pool(self, database):
+        assert await database.warm_up(3) == 3
+        assert database.engine.pool.checkedin() == 3
+        await database.dispose()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_never_waits_on_the_overflow(self, database):
+        assert await database.warm_up(50) == 5
+        await database.dispose()
+
+
+class TestLifespan:
+
+    @pytest.mark.asyncio
+    async def test_startup_warms_the_pool_and_shutdown_disposes_it(self, database, monkeypatch):
+        monkeypatch.setattr(settings, "DB_WARMUP_CONNECTIONS", 2)
+        app = FastAPI()
+
+        async with startup.lifespan(app):
+            report = app.state.startup
+            assert database.engine.pool.checkedin() == 2
+            assert {"upload_dirs", "mappers", "engine", "database", "auth"} <= set(report.steps)
+            assert report.total >= max(report.steps.values())
+            assert "database=" in report.summary()
+
+        assert database.engine is None
+
+    @pytest.mark.asyncio
+    async def test_a_slow_warm_up_does_not_block_the_startup(self, database, monkeypatch):
+        async def hanging() -> str:
+            await asyncio.sleep(60)
+            return ""
+
+        monkeypatch.setattr(settings, "STARTUP_WARMUP_TIMEOUT", 0.05)
+        monkeypatch.setattr(startup, "warm_up_database", hanging)
+        app = FastAPI()
+
+        async with startup.lifespan(app):
+            assert "database" in dict(app.state.startup.failures)
+            assert app.state.startup.total < 5
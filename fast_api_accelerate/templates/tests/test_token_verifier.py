@@ -0,0 +1,5 @@
+from ..registry import render_template
+
+
+def test_token_verifier_template() -> str:
+    return render_template("tests/test_token_verifier")
@@ -0,0 +1,78 @@
+import time
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+from src.modules.auth.utils.tokens import TokenVerifier
+
+SECRET = "test-secret-key"
+
+
+def make_token(expires_in: float = 60, token_type: str = "access", secret: str = SECRET) -> str:
+    return jwt.encode({"id": "1", "type": token_type, "exp": int(time.time() + expires_in)}, secret, algorithm="HS256")
+
+
+@pytest.fixture
+def clock():
+    now = [time.time()]
+    clock = lambda: now[0]
+    clock.advance = lambda seconds: now.__setitem__(0, now[0] + seconds)
+    return clock
+
+
+@pytest.fixture
+def verifier(clock):
+    return TokenVerifier(SECRET, max_size=2, clock=clock)
+
+
+class TestTokenVerifier:
+
+    @pytest.mark.asyncio
+    async def test_repeated_tokens_skip_the_signature_check(self, verifier, mocker):
+        token = make_token()
+        decode = mocker.spy(verifier, "decode")
+
+        first = await verifier.verify(token)
+        second = await verifier.verify(token)
+
+        assert first == second and first["id"] == "1"
+        decode.assert_called_once()
+        assert verifier.stats()["hits"] == 1 and verifier.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_with_the_token(self, verifier, clock):
+        token = make_token(expires_in=60)
+        await verifier.verify(token)
+
+        clock.advance(61)
+
+        assert await verifier.cache.get(verifier.digest(token)) is None
+
+    @pytest.mark.asyncio
+    async def test_the_cache_is_bounded(self, verifier):
+        for expires_in in (60, 61, 62):
+            await verifier.verify(make_token(expires_in=expires_in))
+
+        assert verifier.stats()["size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_tokens_are_rejected_and_not_cached(self, verifier):
+        with pytest.raises(HTTPException) as exc:
+            await verifier.verify(make_token(secret="other-secret"))
+
+        assert exc.value.status_code == 401
+        assert verifier.stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_refresh_tokens_do_not_authenticate(self, verifier):
+        with pytest.raises(HTTPException) as exc:
+            await verifier.verify(make_token(token_type="refresh"), token_type="access")
+
+        assert exc.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_callers_get_a_copy_of_the_cached_claims(self, verifier):
+        token = make_token()
+        claims = await verifier.verify(token)
+        claims["roles"] = ["admin"]
+
+        assert "roles" not in await verifier.verify(token)
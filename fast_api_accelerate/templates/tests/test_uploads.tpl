@@ -0,0 +1,140 @@
+import hashlib
+import io
+import os
+import pytest
+from fastapi import FastAPI, HTTPException, UploadFile
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+from src.base.uploads import UploadFiles, UploadStorage
+from src.core.container_ioc import get_current_user, get_upload_storage
+from src.modules.files.controllers import FilesController
+
+CONTENT = b"0123456789" * 1000
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+
+
+async def chunks(data: bytes, size: int = 1024):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return UploadStorage(str(tmp_path / "uploads"), max_size=len(CONTENT), chunk_size=4096, allowed_types=["text/plain", "image/png"])
+
+
+def leftovers(storage: UploadStorage):
+    temporary_dir = os.path.join(storage.root, ".tmp")
+    return os.listdir(temporary_dir) if os.path.isdir(temporary_dir) else []
+
+
+class TestUploadStorage:
+
+    @pytest.mark.asyncio
+    async def test_streams_to_a_sharded_path_named_by_the_checksum(self, storage):
+        stored = await storage.save_stream(chunks(CONTENT), "text/plain; charset=utf-8")
+
+        assert stored.sha256 == DIGEST and stored.size == len(CONTENT)
+        assert stored.key == f"files/{DIGEST[:2]}/{DIGEST[2:4]}/{DIGEST}.txt"
+        assert stored.url == f"/uploads/{stored.key}" and stored.content_type == "text/plain"
+        with open(storage.path(stored.key), "rb") as file:
+            assert file.read() == CONTENT
+        assert leftovers(storage) == []
+
+    @pytest.mark.asyncio
+    async def test_the_same_content_is_stored_once(self, storage):
+        first = await storage.save_stream(chunks(CONTENT), "text/plain")
+        second = await storage.save_stream(chunks(CONTENT, 333), "text/plain")
+
+        assert first.key == second.key
+
+    @pytest.mark.asyncio
+    async def test_oversized_uploads_are_cut_off_and_cleaned_up(self, storage):
+        with pytest.raises(HTTPException) as exc:
+            await storage.save_stream(chunks(CONTENT + b"!"), "text/plain")
+
+        assert exc.value.status_code == 413
+        assert leftovers(storage) == []
+
+    @pytest.mark.asyncio
+    async def test_unexpected_types_are_rejected(self, storage):
+        with pytest.raises(HTTPException) as exc:
+            await storage.save_stream(chunks(CONTENT), "text/html")
+
+        assert exc.value.status_code == 415
+
+    @pytest.mark.asyncio
+    async def test_multipart_uploads_are_copied_in_chunks(self, storage):
+        upload = UploadFile(io.BytesIO(CONTENT), size=len(CONTENT), filename="image.png", headers=Headers({"content-type": "image/png"}))
+
+        stored = await storage.save(upload)
+
+        assert stored.sha256 == DIGEST and stored.key.endswith(".png")
+
+    @pytest.mark.asyncio
+    async def test_delete_keeps_files_that_are_referenced_or_recently_written(self, storage):
+        stored = await storage.save_stream(chunks(CONTENT), "text/plain")
+        references = {stored.key}
+
+        async def is_referenced(key):
+            return key in references
+
+        assert not await storage.delete(stored.key, is_referenced)
+        assert not await storage.delete(stored.key, is_referenced, grace=0)
+        references.clear()
+        assert await storage.delete(stored.key, is_referenced, grace=0) and not os.path.exists(storage.path(stored.key))
+        assert not await storage.delete(stored.key, is_referenced, grace=0)
+
+
+class TestServingUploads:
+
+    @pytest.fixture
+    def client(self, storage):
+        app = FastAPI()
+        controller = FilesController()
+        app.include_router(controller.router)
+        app.dependency_overrides[get_current_user] = lambda: {"id": "1"}
+        app.dependency_overrides[get_upload_storage] = lambda: storage
+        app.mount("/uploads", UploadFiles(directory=storage.root, check_dir=False), name="uploads")
+        return TestClient(app)
+
+    def test_upload_then_download_with_etag_and_range(self, client):
+        stored = client.put("/files/notes.txt", content=CONTENT, headers={"content-type": "text/plain"})
+        assert stored.status_code == 201
+        url = stored.json()["url"]
+
+        response = client.get(url)
+        assert response.content == CONTENT
+        assert response.headers["etag"] == f'"{DIGEST}"'
+        assert "immutable" in response.headers["cache-control"]
+        assert response.headers["x-content-type-options"] == "nosniff"
+
+        assert client.get(url, headers={"if-none-match": f'"{DIGEST}"'}).status_code == 304
+        partial = client.get(url, headers={"range": "bytes=0-9"})
+        assert partial.status_code == 206 and partial.content == b"0123456789"
+
+    def test_multipart_form_upload(self, client):
+        response = client.post("/files/", files={"file": ("image.png", CONTENT, "image/png")})
+
+        assert response.status_code == 201 and response.json()["sha256"] == DIGEST
+
+    def test_the_client_filename_never_makes_an_upload_html(self, client):
+        page = b"<script>alert(document.cookie)</script>"
+        stored = client.put("/files/x.html", content=page, headers={"content-type": "image/png"}).json()
+
+        response = client.get(stored["url"])
+        assert stored["key"].endswith(".png")
+        assert response.headers["content-type"] == "image/png" and response.headers["content-security-policy"] == "sandbox"
+
+    def test_unknown_types_are_served_as_downloads(self, client, storage):
+        storage.allowed_types = set()
+        stored = client.put("/files/x.html", content=b"<h1>hi</h1>", headers={"content-type": "text/html"}).json()
+
+        response = client.get(stored["url"])
+        assert stored["key"].endswith(stored["sha256"])
+        assert response.headers["content-type"] == "application/octet-stream" and response.headers["content-disposition"] == "attachment"
+
+    def test_content_length_over_the_limit_is_rejected_before_reading(self, client):
+        response = client.put("/files/big.txt", content=CONTENT + b"!", headers={"content-type": "text/plain"})
+
+        assert response.status_code == 413
@@ -1,7 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import partial
 from pathlib import Path
 from typing import List, Optional
+import os
 import subprocess
 import typer
+from .lockfile import LockFile, content_hash
+from .manifest import BuildManifest, PlannedFile, WriteReport, WriteStatus
+
+INSTALL_LOG_FILE = ".accelerate-install.log"
+
+
+class InstallMode(str, Enum):
+    FOREGROUND = "foreground"
+    BACKGROUND = "background"
+    NONE = "none"
 
 
 class FileSystem:
@@ -49,11 +63,92 @@ class FileSystem:
 
         self._log(f"\033[92m + \033[0m Appended to file: {path}")
 
-    def install_dependencies(self):
+    def write_manifest(self, manifest: BuildManifest, lock: Optional[LockFile] = None, max_workers: Optional[int] = None) -> WriteReport:
+        """ Aplica um plano de build: cria os diretórios uma única vez e escreve os arquivos em paralelo.
+            Com um `LockFile`, só reescreve arquivos gerados cujo conteúdo mudou e preserva os alterados pelo usuário.
+        """
+        for directory in manifest.all_directories():
+            directory.mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            statuses = pool.map(partial(self._write_planned, lock), manifest.files.keys(), manifest.files.values())
+            report = WriteReport(dict(zip(manifest.files.keys(), statuses)))
+        report.bytes_written = sum(len(planned.content.encode("utf-8")) for path, planned in manifest.files.items() if report.changed(path))
+
+        for path, chunks in manifest.appends.items():
+            self.append_to_file(path, "".join(chunks))
+
+        if lock is not None:
+            lock.save()
+            for path in report.paths(WriteStatus.MODIFIED):
+                self._log(f"\033[93m⚠\033[0mfile modified by user (kept): {path}")
+        return report
+
+    def _write_planned(self, lock: Optional[LockFile], path: Path, planned: PlannedFile) -> WriteStatus:
+        if planned.overwrite:
+            return self._write(path, planned.content, lock)
+        if lock is None:
+            return self._write_exclusive(path, planned)
+
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return self._write_exclusive(path, planned, lock)
+
+        entry = lock.get(path)
+        if entry is None:
+            self._log(f"\033[93m⚠\033[0mfile already exists (skipped): {path}")
+            return WriteStatus.SKIPPED
+        if not lock.is_pristine(path, stat, entry):
+            return WriteStatus.MODIFIED
+
+        digest = content_hash(planned.content)
+        if digest == entry.get("hash"):
+            if entry.get("template_version") != lock.template_version:
+                lock.record(path, digest, stat)
+            return WriteStatus.UNCHANGED
+        self._write(path, planned.content, lock, digest)
+        return WriteStatus.UPDATED
+
+    def _write_exclusive(self, path: Path, planned: PlannedFile, lock: Optional[LockFile] = None) -> WriteStatus:
+        # modo "x" cria de forma exclusiva: dispensa o exists() antes de cada escrita
+        try:
+            with open(path, "x", encoding="utf-8") as f:
+                f.write(planned.content)
+        except FileExistsError:
+            self._log(f"\033[93m⚠\033[0mfile already exists (skipped): {path}")
+            return WriteStatus.SKIPPED
+        if lock is not None:
+            lock.record(path, content_hash(planned.content), path.stat())
+        return WriteStatus.CREATED
+
+    def _write(self, path: Path, content: str, lock: Optional[LockFile] = None, digest: Optional[str] = None) -> WriteStatus:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        if lock is not None:
+            lock.record(path, digest or content_hash(content), path.stat())
+        return WriteStatus.UPDATED
+
+    def start_install(self, cache_dir: Optional[Path] = None, background: bool = False) -> subprocess.Popen:
+        """ Inicia `uv sync` sem bloquear. `cache_dir` compartilha o cache de wheels do uv entre projetos.
+            Em background o processo sobrevive à CLI e escreve a saída em `.accelerate-install.log`.
+        """
+        env = {**os.environ, "UV_CACHE_DIR": str(cache_dir)} if cache_dir else None
         self._log(f"📦 Installing project dependencies in {self.project_path}...")
-        subprocess.run(["uv", "sync"], cwd=self.project_path, check=True)
+        if not background:
+            return subprocess.Popen(["uv", "sync"], cwd=self.project_path, env=env)
+
+        with open(self.project_path / INSTALL_LOG_FILE, "w", encoding="utf-8") as log:
+            return subprocess.Popen(["uv", "sync"], cwd=self.project_path, env=env, stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+
+    def wait_install(self, process: subprocess.Popen):
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, process.args)
         self._log("\033[92m✓\033[0m Dependencies installed successfully.")
 
+    def install_dependencies(self):
+        self.wait_install(self.start_install())
+
     def run_command(self, command: str):
         self._log(f"\033[92m✓\033[0m Running command: {command}")
         subprocess.run(command.split(),check=True)
\ No newline at end of file
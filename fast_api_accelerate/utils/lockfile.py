@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional
+
+LOCK_FILE_NAME = ".accelerate-lock"
+TEMPLATE_VERSION = "0.1.0"
+
+
+def content_hash(content: str | bytes) -> str:
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    return hashlib.sha256(data).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def source_fingerprint(package: str = "fast_api_accelerate") -> str:
+    """ Hash dos templates `.tpl` e do código (`.py`) do pacote instalado: muda com qualquer alteração do gerador. """
+    digest = hashlib.sha256()
+    pending = [resources.files(package)]
+    while pending:
+        for entry in sorted(pending.pop().iterdir(), key=lambda item: item.name):
+            if entry.is_dir():
+                if entry.name != "__pycache__":
+                    pending.append(entry)
+            elif entry.name.endswith((".py", ".tpl")):
+                digest.update(entry.name.encode("utf-8") + b"\0" + entry.read_bytes())
+    return digest.hexdigest()
+
+
+class LockFile:
+    """ Manifesto `.accelerate-lock` com versão de template, hash, tamanho e mtime de cada arquivo gerado.
+        Permite regenerar só o que mudou e reconhecer arquivos alterados pelo usuário sem reler o projeto inteiro.
+        `inputs` guarda, por builder, o hash das entradas do último build (templates, opções, spec): igual, o build é pulado.
+    """
+
+    def __init__(self, root: Path, template_version: str = TEMPLATE_VERSION):
+        self.root = root
+        self.path = root / LOCK_FILE_NAME
+        self.template_version = template_version
+        self.entries: Dict[str, Dict] = {}
+        self.inputs: Dict[str, str] = {}
+        self._lock = Lock()
+        self.load()
+
+    def load(self):
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self.entries = data.get("files", {})
+        self.inputs = data.get("inputs", {})
+
+    def save(self):
+        data = {"template_version": self.template_version, "inputs": dict(sorted(self.inputs.items())), "files": dict(sorted(self.entries.items()))}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+    def _key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def get(self, path: Path) -> Optional[Dict]:
+        return self.entries.get(self._key(path))
+
+    def record(self, path: Path, digest: str, stat: os.stat_result):
+        with self._lock:
+            self.entries[self._key(path)] = {"template_version": self.template_version, "hash": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def is_current(self, builder: str, inputs: str) -> bool:
+        """ True se `builder` já gerou este projeto com as mesmas entradas e nenhum arquivo gerado sumiu do disco.
+            Arquivos alterados pelo usuário seriam mantidos de qualquer forma, então não pedem um novo build.
+        """
+        if self.inputs.get(builder) != inputs:
+            return False
+        return all((self.root / key).exists() for key in self.entries)
+
+    def record_inputs(self, builder: str, inputs: str):
+        self.inputs[builder] = inputs
+        self.save()
+
+    def is_pristine(self, path: Path, stat: os.stat_result, entry: Dict) -> bool:
+        """ True se o arquivo em disco ainda é o que foi gerado. Tamanho e mtime iguais dispensam a leitura. """
+        if stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns"):
+            return True
+        return content_hash(path.read_bytes()) == entry.get("hash")
@@ -0,0 +1,99 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Set
+
+
+@dataclass
+class PlannedFile:
+    content: str
+    overwrite: bool = False
+
+
+@dataclass
+class BuildManifest:
+    """ Plano em memória de um build: diretórios, arquivos (caminho -> conteúdo) e appends.
+        Registrar o mesmo caminho duas vezes mantém apenas a última versão, então nada é escrito em dobro.
+    """
+
+    directories: Set[Path] = field(default_factory=set)
+    files: Dict[Path, PlannedFile] = field(default_factory=dict)
+    appends: Dict[Path, List[str]] = field(default_factory=dict)
+
+    def add_dir(self, path: Path):
+        self.directories.add(path)
+
+    def add_file(self, path: Path, content: str, overwrite: bool = False):
+        planned = self.files.get(path)
+        self.files[path] = PlannedFile(content, overwrite or (planned is not None and planned.overwrite))
+
+    def update_file(self, path: Path, content: str) -> bool:
+        """ Substitui o conteúdo de um arquivo já planejado. Retorna False se o arquivo não está no plano. """
+        if path not in self.files:
+            return False
+        self.files[path].content = content
+        return True
+
+    def append(self, path: Path, content: str):
+        if path in self.files:
+            self.files[path].content += content
+        else:
+            self.appends.setdefault(path, []).append(content)
+
+    def split(self, paths: List[Path]) -> "BuildManifest":
+        """ Move os arquivos indicados (e seus appends) para um novo manifesto, para serem escritos antes do resto. """
+        early = BuildManifest()
+        for path in paths:
+            if path in self.files:
+                early.files[path] = self.files.pop(path)
+            if path in self.appends:
+                early.appends[path] = self.appends.pop(path)
+        return early
+
+    def all_directories(self) -> List[Path]:
+        """ Diretórios declarados mais os pais de cada arquivo, sem repetição, em ordem de criação. """
+        dirs = set(self.directories) | {path.parent for path in self.files}
+        return sorted(dirs, key=lambda p: len(p.parts))
+
+    def clear(self):
+        self.directories.clear()
+        self.files.clear()
+        self.appends.clear()
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+
+class WriteStatus(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+    MODIFIED = "modified"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class WriteReport:
+    """ Resultado da aplicação de um manifesto: o status de cada arquivo planejado. """
+
+    statuses: Dict[Path, WriteStatus] = field(default_factory=dict)
+    bytes_written: int = 0
+
+    def paths(self, status: WriteStatus) -> List[Path]:
+        return [path for path, current in self.statuses.items() if current == status]
+
+    def merge(self, other: "WriteReport") -> "WriteReport":
+        self.statuses.update(other.statuses)
+        self.bytes_written += other.bytes_written
+        return self
+
+    def changed(self, path: Path) -> bool:
+        return self.statuses.get(path) in (WriteStatus.CREATED, WriteStatus.UPDATED)
+
+    @property
+    def written(self) -> int:
+        return sum(1 for path in self.statuses if self.changed(path))
+
+    def summary(self) -> str:
+        counts = {status.value: len(self.paths(status)) for status in WriteStatus}
+        return ", ".join(f"{count} {name}" for name, count in counts.items() if count)
@@ -0,0 +1,16 @@
+from enum import Enum
+from typing import Dict
+
+
+class PoolProfile(str, Enum):
+    THROUGHPUT = "throughput"
+    LATENCY = "latency"
+
+
+# Padrões gravados em core/configs.py do projeto gerado; em runtime cada um pode ser sobrescrito pelo .env.
+# throughput: mais conexões e overflow, sem pre-ping (uma ida ao banco a menos por checkout) e cache de statements maior.
+# latency: pool aquecido por inteiro no startup e limitado, timeout curto para falhar rápido sob saturação, pre-ping para nunca usar conexão morta.
+POOL_PROFILES: Dict[PoolProfile, Dict[str, object]] = {
+    PoolProfile.THROUGHPUT: {"pool_size": 20, "max_overflow": 20, "pool_timeout": 30, "pool_recycle": 1800, "pool_pre_ping": False, "statement_cache_size": 500, "warmup_connections": 5},
+    PoolProfile.LATENCY: {"pool_size": 10, "max_overflow": 5, "pool_timeout": 3, "pool_recycle": 600, "pool_pre_ping": True, "statement_cache_size": 100, "warmup_connections": 10},
+}
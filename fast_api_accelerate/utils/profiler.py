@@ -0,0 +1,96 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+import typer
+
+
+@dataclass
+class StepTiming:
+    name: str
+    depth: int
+    start_ns: int
+    end_ns: int = 0
+    files: int = 0
+    bytes: int = 0
+    subprocess_ns: int = 0
+    category: str = "step"
+
+    @property
+    def wall_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    @property
+    def subprocess_ms(self) -> float:
+        return self.subprocess_ns / 1e6
+
+
+class BuildProfiler:
+    """ Mede cada etapa de um builder: tempo de parede, arquivos e bytes, e tempo bloqueado em subprocessos.
+        Etapas aninhadas somam seus números em todas as etapas abertas, então o total de `build` inclui os `_create_*`.
+    """
+
+    def __init__(self):
+        self.steps: List[StepTiming] = []
+        self._stack: List[StepTiming] = []
+        self._origin_ns = time.perf_counter_ns()
+
+    @contextmanager
+    def step(self, name: str, category: str = "step") -> Iterator[StepTiming]:
+        timing = StepTiming(name=name, depth=len(self._stack), start_ns=time.perf_counter_ns(), category=category)
+        self.steps.append(timing)
+        self._stack.append(timing)
+        try:
+            yield timing
+        finally:
+            timing.end_ns = time.perf_counter_ns()
+            self._stack.pop()
+
+    @contextmanager
+    def subprocess(self, name: str) -> Iterator[StepTiming]:
+        """ Etapa de espera por um processo externo: o tempo também entra como `subprocess` nas etapas abertas. """
+        with self.step(name, category="subprocess") as timing:
+            yield timing
+        for open_step in self._stack:
+            open_step.subprocess_ns += timing.end_ns - timing.start_ns
+        timing.subprocess_ns = timing.end_ns - timing.start_ns
+
+    def add_files(self, count: int, size: int):
+        for open_step in self._stack:
+            open_step.files += count
+            open_step.bytes += size
+
+    def summary(self) -> str:
+        rows = [("step", "wall ms", "files", "bytes", "subprocess ms")]
+        rows += [("  " * s.depth + s.name, f"{s.wall_ms:.2f}", str(s.files), str(s.bytes), f"{s.subprocess_ms:.2f}") for s in self.steps]
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        lines = [f"{row[0]:<{widths[0]}}  " + "  ".join(f"{cell:>{width}}" for cell, width in zip(row[1:], widths[1:])) for row in rows]
+        lines.insert(1, "-" * len(lines[0]))
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict:
+        """ Eventos no formato Chrome Trace (chrome://tracing, Perfetto). """
+        pid, tid = os.getpid(), threading.get_ident()
+        events = [{
+            "name": s.name, "cat": s.category, "ph": "X", "pid": pid, "tid": tid,
+            "ts": (s.start_ns - self._origin_ns) / 1e3, "dur": (s.end_ns - s.start_ns) / 1e3,
+            "args": {"files": s.files, "bytes": s.bytes, "subprocess_ms": s.subprocess_ms},
+        } for s in self.steps]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: Path):
+        path.write_text(json.dumps(self.chrome_trace(), indent=2) + "\n", encoding="utf-8")
+
+
+def report_profile(profiler: Optional[BuildProfiler], output: Optional[Path] = None):
+    """ Imprime a tabela de etapas e, se pedido, grava o Chrome trace. """
+    if profiler is None:
+        return
+    typer.echo(profiler.summary())
+    if output:
+        profiler.write_trace(output)
+        typer.secho(f"✓ Chrome trace written to {output}", fg=typer.colors.GREEN)
@@ -0,0 +1,232 @@
+import json
+import keyword
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# tipo do spec -> (tipo SQLAlchemy, tipo Python)
+FIELD_TYPES: Dict[str, tuple[str, str]] = {
+    "str": ("String", "str"),
+    "text": ("Text", "str"),
+    "int": ("Integer", "int"),
+    "bigint": ("BigInteger", "int"),
+    "float": ("Float", "float"),
+    "decimal": ("Numeric", "Decimal"),
+    "bool": ("Boolean", "bool"),
+    "date": ("Date", "date"),
+    "datetime": ("DateTime", "datetime"),
+    "uuid": ("Uuid", "UUID"),
+    "json": ("JSON", "dict"),
+}
+PY_TYPE_IMPORTS = {"Decimal": "from decimal import Decimal", "date": "from datetime import date", "datetime": "from datetime import datetime", "UUID": "from uuid import UUID"}
+RELATION_TYPES = ("many_to_one", "one_to_many")
+# "raise" por padrão: lazy load implícito não funciona em async e esconde N+1
+LAZY_STRATEGIES = ("raise", "raise_on_sql", "selectin", "joined", "select")
+BUILTIN_ENTITIES = {"user": "tb_users"}
+# atributos que o model gerado de cada entidade embutida já tem: uma coleção do spec não pode reusar esses nomes
+BUILTIN_ATTRIBUTES = {"user": {"id", "username", "email", "password", "imagem", "status", "roles", "get_roles", "set_roles"}}
+# só tipos textuais aceitam `length` (String(100), Text(1000)); Integer(10) não significa nada
+LENGTH_TYPES = ("str", "text")
+
+
+class SpecError(ValueError):
+    """ Spec inválido: mensagem pronta para ser exibida na CLI. """
+
+
+@dataclass
+class FieldSpec:
+    name: str
+    type: str = "str"
+    length: Optional[int] = None
+    nullable: bool = False
+    index: bool = False
+    unique: bool = False
+
+    @property
+    def sa_type(self) -> str:
+        sa_type = FIELD_TYPES[self.type][0]
+        return f"{sa_type}({self.length})" if self.length else sa_type
+
+    @property
+    def py_type(self) -> str:
+        return FIELD_TYPES[self.type][1]
+
+    @property
+    def py_import(self) -> Optional[str]:
+        return PY_TYPE_IMPORTS.get(self.py_type)
+
+
+@dataclass
+class RelationSpec:
+    name: str
+    target: str
+    type: str = "many_to_one"
+    back_populates: Optional[str] = None
+    lazy: str = "raise"
+
+
+@dataclass
+class EntitySpec:
+    name: str
+    fields: List[FieldSpec] = field(default_factory=list)
+    relations: List[RelationSpec] = field(default_factory=list)
+    indexes: List[List[str]] = field(default_factory=list)
+    module: Optional[str] = None
+    table: Optional[str] = None
+
+    def __post_init__(self):
+        self.module = self.module or f"{self.name}s"
+        self.table = self.table or f"tb_{self.module}"
+
+    @property
+    def class_name(self) -> str:
+        return "".join(part.capitalize() for part in self.name.split("_"))
+
+    @property
+    def controller_name(self) -> str:
+        return "".join(part.capitalize() for part in self.module.split("_")) + "Controller"
+
+    @property
+    def py_imports(self) -> List[str]:
+        return sorted({f.py_import for f in self.fields if f.py_import})
+
+
+@dataclass
+class ProjectSpec:
+    entities: List[EntitySpec] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.tables = {**BUILTIN_ENTITIES, **{entity.name: entity.table for entity in self.entities}}
+
+    def table_of(self, entity_name: str) -> str:
+        return self.tables[entity_name]
+
+
+def _parse_field(name: str, raw: Any) -> FieldSpec:
+    options = {"type": raw} if isinstance(raw, str) else dict(raw or {})
+    spec = FieldSpec(name=name, **options)
+    if spec.type not in FIELD_TYPES:
+        raise SpecError(f"field '{name}': unknown type '{spec.type}' (expected one of {', '.join(FIELD_TYPES)})")
+    if spec.length is not None:
+        if spec.type not in LENGTH_TYPES:
+            raise SpecError(f"field '{name}': length only applies to {' and '.join(LENGTH_TYPES)} fields, not '{spec.type}'")
+        if isinstance(spec.length, bool) or not isinstance(spec.length, int) or spec.length <= 0:
+            raise SpecError(f"field '{name}': length must be a positive integer")
+    return spec
+
+
+def _parse_entity(raw: Dict[str, Any]) -> EntitySpec:
+    if not isinstance(raw, dict):
+        raise SpecError(f"invalid entity {raw!r}: expected a mapping with at least a 'name'")
+    raw = dict(raw)
+    fields = raw.pop("fields", None) or {}
+    if not isinstance(fields, dict):
+        raise SpecError(f"entity '{raw.get('name')}': fields must be a mapping of field name to type or options")
+    fields = [_parse_field(name, options) for name, options in fields.items()]
+    relations = [RelationSpec(**relation) for relation in raw.pop("relations", None) or []]
+    indexes = [[columns] if isinstance(columns, str) else list(columns) for columns in raw.pop("indexes", None) or []]
+    return EntitySpec(fields=fields, relations=relations, indexes=indexes, **raw)
+
+
+def _is_identifier(name: Any) -> bool:
+    return isinstance(name, str) and name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _inverse(spec: ProjectSpec, entity: EntitySpec, relation: RelationSpec) -> RelationSpec:
+    """ O many_to_one do alvo que aponta de volta para `entity`: é a FK dele que o one_to_many usa. """
+    target = next((candidate for candidate in spec.entities if candidate.name == relation.target), None)
+    inverses = [other for other in (target.relations if target else []) if other.type == "many_to_one" and other.target == entity.name]
+    if relation.back_populates:
+        inverses = [other for other in inverses if other.name == relation.back_populates]
+    if len(inverses) != 1:
+        hint = " (set back_populates to choose one)" if len(inverses) > 1 else ""
+        raise SpecError(f"entity '{entity.name}': one_to_many relation '{relation.name}' needs a many_to_one relation on '{relation.target}' targeting '{entity.name}'{hint}")
+    return inverses[0]
+
+
+def _validate(spec: ProjectSpec):
+    seen = set(BUILTIN_ENTITIES)
+    modules = {"users", "auth"}
+    for entity in spec.entities:
+        if not _is_identifier(entity.name) or not entity.name.islower():
+            raise SpecError(f"entity '{entity.name}': name must be a lowercase python identifier")
+        if entity.name in seen or entity.module in modules:
+            raise SpecError(f"entity '{entity.name}': declared more than once or clashes with a built-in module")
+        seen.add(entity.name)
+        modules.add(entity.module)
+
+    for entity in spec.entities:
+        names = [f.name for f in entity.fields] + [r.name for r in entity.relations] + [f"{r.name}_id" for r in entity.relations if r.type == "many_to_one"]
+        for name in names:
+            if not _is_identifier(name):
+                raise SpecError(f"entity '{entity.name}': '{name}' is not a valid python identifier for a field or relation")
+        duplicated = sorted({name for name in names if names.count(name) > 1})
+        if duplicated:
+            raise SpecError(f"entity '{entity.name}': field or relation {', '.join(duplicated)} declared more than once")
+        if "id" in names:
+            raise SpecError(f"entity '{entity.name}': 'id' is the generated primary key and cannot be declared")
+        columns = {"id"} | set(names)
+        for relation in entity.relations:
+            if relation.type not in RELATION_TYPES:
+                raise SpecError(f"entity '{entity.name}': relation '{relation.name}' has unknown type '{relation.type}'")
+            if relation.lazy not in LAZY_STRATEGIES:
+                raise SpecError(f"entity '{entity.name}': relation '{relation.name}' has unknown lazy strategy '{relation.lazy}'")
+            if relation.target not in spec.tables:
+                raise SpecError(f"entity '{entity.name}': relation '{relation.name}' targets unknown entity '{relation.target}'")
+            if relation.type == "one_to_many":
+                inverse = _inverse(spec, entity, relation)
+                if inverse.back_populates not in (None, relation.name):
+                    raise SpecError(f"entity '{relation.target}': relation '{inverse.name}' back_populates '{inverse.back_populates}', expected '{relation.name}'")
+                # os dois lados se referenciam: o mapper liga a coleção à FK certa mesmo com várias FKs para a mesma tabela
+                relation.back_populates, inverse.back_populates = inverse.name, relation.name
+        for index in entity.indexes:
+            missing = [column for column in index if column not in columns]
+            if missing:
+                raise SpecError(f"entity '{entity.name}': index on unknown column(s) {', '.join(missing)}")
+
+    # um many_to_one com back_populates para uma entidade do spec precisa da coleção correspondente do outro lado;
+    # para uma entidade embutida a coleção é gerada no model dela, então o nome precisa estar livre lá
+    collections = {name: set(attributes) for name, attributes in BUILTIN_ATTRIBUTES.items()}
+    for entity in spec.entities:
+        for relation in entity.relations:
+            if relation.type == "many_to_one" and relation.back_populates and relation.target in BUILTIN_ENTITIES:
+                if not _is_identifier(relation.back_populates):
+                    raise SpecError(f"entity '{entity.name}': relation '{relation.name}' back_populates '{relation.back_populates}', which is not a valid python identifier")
+                if relation.back_populates in collections[relation.target]:
+                    raise SpecError(f"entity '{entity.name}': relation '{relation.name}' back_populates '{relation.back_populates}', which '{relation.target}' already has")
+                collections[relation.target].add(relation.back_populates)
+            target = next((candidate for candidate in spec.entities if candidate.name == relation.target), None)
+            if relation.type == "many_to_one" and relation.back_populates and target is not None:
+                if not any(other.name == relation.back_populates and other.type == "one_to_many" and other.target == entity.name for other in target.relations):
+                    raise SpecError(f"entity '{entity.name}': relation '{relation.name}' back_populates '{relation.back_populates}', but '{target.name}' has no one_to_many relation with that name targeting '{entity.name}'")
+
+
+def parse_spec(data: Dict[str, Any]) -> ProjectSpec:
+    if not isinstance(data, dict):
+        raise SpecError("invalid spec: expected a mapping with an 'entities' list")
+    try:
+        spec = ProjectSpec(entities=[_parse_entity(entity) for entity in data.get("entities") or []])
+    except TypeError as error:
+        raise SpecError(f"invalid spec: {error}") from None
+    _validate(spec)
+    return spec
+
+
+def load_spec(path: Path) -> ProjectSpec:
+    """ Lê um spec JSON ou YAML (YAML exige o extra `fast_api_accelerate[yaml]`). """
+    text = path.read_text(encoding="utf-8")
+    if path.suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise SpecError("YAML specs require PyYAML: pip install 'fast_api_accelerate[yaml]'") from None
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as error:
+            raise SpecError(f"invalid YAML in {path.name}: {error}") from None
+    else:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as error:
+            raise SpecError(f"invalid JSON in {path.name}: {error}") from None
+    return parse_spec(data or {})
@@ -1,6 +1,10 @@
+from collections import OrderedDict
 from string import Template
 from pathlib import Path
-from typing import Dict
+from threading import Lock
+from typing import Dict, Hashable, Mapping, TypeVar
+
+K = TypeVar("K")
 
 
 class TemplateEngine:
@@ -8,20 +12,73 @@ class TemplateEngine:
         Pode renderizar:
         - Templates em memória (string)
         - Templates de arquivos
+        Templates compilados ficam em cache LRU: strings pelo próprio conteúdo, arquivos por (caminho, mtime, tamanho).
     """
 
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[Hashable, Template] = OrderedDict()
+        self._lock = Lock()
+
+    def _get(self, key: Hashable) -> Template | None:
+        with self._lock:
+            template = self._cache.get(key)
+            if template is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return template
+
+    def _put(self, key: Hashable, template: Template) -> Template:
+        with self._lock:
+            self._cache[key] = template
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return template
+
+    def compile_string(self, template_str: str) -> Template:
+        """ Devolve o template compilado de uma string, usando o cache. """
+        key = ("string", template_str)
+        return self._get(key) or self._put(key, Template(template_str))
+
+    def compile_file(self, template_path: str | Path) -> Template:
+        """ Devolve o template compilado de um arquivo. Um arquivo alterado (mtime/tamanho) é relido. """
+        path = Path(template_path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template not found: {template_path}") from None
+
+        key = ("file", str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        return self._get(key) or self._put(key, Template(path.read_text(encoding="utf-8")))
+
     def render_string(self, template_str: str, context: Dict[str, str]) -> str:
         """ Renderiza template a partir de string. """
-        template = Template(template_str)
-        return template.safe_substitute(**context)
+        return self.compile_string(template_str).safe_substitute(**context)
 
     def render_file(self, template_path: str | Path, context: Dict[str, str]) -> str:
         """ Renderiza template a partir de arquivo. """
-        path = Path(template_path)
+        return self.compile_file(template_path).safe_substitute(**context)
+
+    def render_many(self, context: Dict[str, str], templates: Mapping[K, str | Path]) -> Dict[K, str]:
+        """ Renderiza vários templates com o mesmo contexto. Valores `Path` são lidos de arquivo, `str` são templates em memória. """
+        rendered = {}
+        for key, source in templates.items():
+            template = self.compile_file(source) if isinstance(source, Path) else self.compile_string(source)
+            rendered[key] = template.safe_substitute(**context)
+        return rendered
 
-        if not path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
+    def clear(self):
+        """ Esvazia o cache e zera os contadores. """
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
 
-        content = path.read_text(encoding="utf-8")
 
-        return self.render_string(content, context)
\ No newline at end of file
+# Instância compartilhada: todos os builders renderizam a partir do mesmo cache aquecido
+template_engine = TemplateEngine()
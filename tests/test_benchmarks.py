@@ -0,0 +1,18 @@
+from benchmarks.bench_generator import find_regressions, make_spec, run_benchmarks
+
+
+class TestBenchmarkSuite:
+    """Keeps the generator benchmarks runnable and their regression check honest."""
+
+    def test_run_benchmarks_reports_every_metric(self):
+        results = run_benchmarks(sizes=[1, 2], repeat=1)
+        assert set(results) == {"cli_cold_start", "test_builder_run", "render[1]", "project_build[1]", "render[2]", "project_build[2]"}
+        assert all(seconds > 0 for seconds in results.values())
+
+    def test_make_spec_counts_users_module(self):
+        assert len(make_spec(10).entities) == 9
+
+    def test_find_regressions_uses_threshold(self):
+        baseline = {"fast": 1.0, "slow": 1.0}
+        regressions = find_regressions({"fast": 1.2, "slow": 1.5, "new": 9.0}, baseline, threshold=0.25)
+        assert list(regressions) == ["slow"]
@@ -0,0 +1,176 @@
+import tomllib
+from pathlib import Path
+import pytest
+from fast_api_accelerate.builders.project_builder import ProjectBuilder
+from fast_api_accelerate.builders import test_builder
+from fast_api_accelerate.utils.file_system import FileSystem, InstallMode
+from fast_api_accelerate.utils.lockfile import LOCK_FILE_NAME
+from fast_api_accelerate.utils.manifest import BuildManifest, WriteStatus
+from fast_api_accelerate.utils.pool import PoolProfile
+from fast_api_accelerate.utils.template_engine import TemplateEngine
+from fast_api_accelerate.templates.projects import pyproject_template
+
+
+@pytest.fixture
+def no_install(mocker):
+    mocker.patch.object(FileSystem, "wait_install")
+    return mocker.patch.object(FileSystem, "start_install")
+
+
+class TestBuildManifest:
+    """Tests for the in-memory build plan."""
+
+    def test_same_path_is_planned_once_with_last_content(self, tmp_path: Path):
+        manifest = BuildManifest()
+        manifest.add_file(tmp_path / "a.py", "")
+        manifest.add_file(tmp_path / "a.py", "final")
+        assert len(manifest) == 1
+        assert manifest.files[tmp_path / "a.py"].content == "final"
+
+    def test_directories_include_file_parents_ordered_by_depth(self, tmp_path: Path):
+        manifest = BuildManifest()
+        manifest.add_file(tmp_path / "x" / "y" / "a.py", "")
+        manifest.add_dir(tmp_path / "x")
+        assert manifest.all_directories() == [tmp_path / "x", tmp_path / "x" / "y"]
+
+    def test_write_manifest_skips_existing_files(self, tmp_path: Path):
+        (tmp_path / "keep.py").write_text("user code", encoding="utf-8")
+        manifest = BuildManifest()
+        manifest.add_file(tmp_path / "keep.py", "generated")
+        manifest.add_file(tmp_path / "new" / "file.py", "generated")
+
+        report = FileSystem(tmp_path, verbose=False).write_manifest(manifest)
+
+        assert report.written == 1
+        assert (tmp_path / "keep.py").read_text(encoding="utf-8") == "user code"
+        assert (tmp_path / "new" / "file.py").read_text(encoding="utf-8") == "generated"
+
+
+class TestProjectBuilder:
+    """Tests for the plan-then-apply project generation."""
+
+    def test_render_files_keeps_rendered_strings_and_only_renders_template_paths(self, tmp_path: Path):
+        template = tmp_path / "readme.tpl"
+        template.write_text("# $project_name", encoding="utf-8")
+        builder = ProjectBuilder(tmp_path, "demo")
+        builder.templates = TemplateEngine()
+
+        builder.render_files({tmp_path / "a.py": "price = '$project_name'", tmp_path / "README.md": template})
+
+        assert builder.manifest.files[tmp_path / "a.py"].content == "price = '$project_name'"
+        assert builder.manifest.files[tmp_path / "README.md"].content == "# demo"
+        assert builder.templates.misses == 1
+
+    def test_build_only_plans_until_apply(self, tmp_path: Path, no_install):
+        builder = ProjectBuilder(tmp_path, "demo")
+        builder.build()
+        assert not (tmp_path / "demo").exists()
+        assert builder.project_path / "src" / "core" / "database.py" in builder.manifest.files
+
+    def test_run_writes_core_files_with_content_and_installs(self, tmp_path: Path, no_install):
+        ProjectBuilder(tmp_path, "demo").run()
+
+        core = tmp_path / "demo" / "src" / "core"
+        for name in ["configs.py", "container_ioc.py", "database.py", "startup.py"]:
+            assert (core / name).read_text(encoding="utf-8").strip()
+        assert (tmp_path / "demo" / "src" / "modules" / "auth" / "controllers" / "auth_controller.py").exists()
+        no_install.assert_called_once()
+
+    def test_install_starts_after_pyproject_and_before_remaining_files(self, tmp_path: Path, no_install):
+        project = tmp_path / "demo"
+        written_at_install = {}
+        no_install.side_effect = lambda *args, **kwargs: written_at_install.update(pyproject=(project / "pyproject.toml").exists(), main=(project / "main.py").exists())
+
+        ProjectBuilder(tmp_path, "demo").run()
+
+        assert written_at_install == {"pyproject": True, "main": False}
+
+    def test_no_install_mode_skips_install(self, tmp_path: Path, no_install):
+        ProjectBuilder(tmp_path, "demo", install_mode=InstallMode.NONE).run()
+        no_install.assert_not_called()
+
+    def test_background_mode_does_not_wait(self, tmp_path: Path, no_install):
+        ProjectBuilder(tmp_path, "demo", install_mode=InstallMode.BACKGROUND, cache_dir=tmp_path / "cache").run()
+        no_install.assert_called_once_with(tmp_path / "cache", background=True)
+        FileSystem.wait_install.assert_not_called()
+
+    def test_seed_lock_is_copied_into_project(self, tmp_path: Path, no_install):
+        seed = tmp_path / "seed.lock"
+        seed.write_text("version = 1\n", encoding="utf-8")
+        ProjectBuilder(tmp_path, "demo", seed_lock=seed).run()
+        assert (tmp_path / "demo" / "uv.lock").read_text(encoding="utf-8") == "version = 1\n"
+
+
+class TestIncrementalRegeneration:
+    """Tests for re-running the project builder against the .accelerate-lock manifest."""
+
+    def test_first_run_writes_lockfile(self, tmp_path: Path, no_install):
+        ProjectBuilder(tmp_path, "demo").run()
+        assert (tmp_path / "demo" / LOCK_FILE_NAME).exists()
+
+    def test_rerun_without_changes_writes_nothing_and_skips_install(self, tmp_path: Path, no_install, mocker):
+        ProjectBuilder(tmp_path, "demo").run()
+        main_template = mocker.patch("fast_api_accelerate.builders.project_builder.main_project_template", return_value="")
+
+        builder = ProjectBuilder(tmp_path, "demo")
+        builder.run()
+
+        assert builder.report.written == 0
+        main_template.assert_not_called()
+        no_install.assert_called_once()
+
+    def test_rerun_with_changed_options_or_a_deleted_file_renders_again(self, tmp_path: Path, no_install):
+        ProjectBuilder(tmp_path, "demo").run()
+        (tmp_path / "demo" / "main.py").unlink()
+
+        builder = ProjectBuilder(tmp_path, "demo")
+        builder.run()
+
+        assert builder.report.statuses[tmp_path / "demo" / "main.py"] == WriteStatus.CREATED
+        assert builder.report.paths(WriteStatus.UNCHANGED)
+        builder = ProjectBuilder(tmp_path, "demo", pool_profile=PoolProfile.THROUGHPUT)
+        builder.run()
+        assert builder.report.statuses[builder.core_path / "configs.py"] == WriteStatus.UPDATED
+
+    def test_rerun_keeps_user_modified_files_and_updates_changed_templates(self, tmp_path: Path, no_install, mocker):
+        ProjectBuilder(tmp_path, "demo").run()
+        user_file = tmp_path / "demo" / "src" / "core" / "configs.py"
+        user_file.write_text("# meu código", encoding="utf-8")
+        mocker.patch("fast_api_accelerate.builders.project_builder.startup_template", return_value="# novo template")
+        mocker.patch("fast_api_accelerate.builders.project_builder.source_fingerprint", return_value="new templates")
+
+        builder = ProjectBuilder(tmp_path, "demo")
+        builder.run()
+
+        startup_file = builder.project_path / "src" / "core" / "startup.py"
+        assert builder.report.statuses[user_file.resolve()] == WriteStatus.MODIFIED
+        assert user_file.read_text(encoding="utf-8") == "# meu código"
+        assert builder.report.statuses[startup_file] == WriteStatus.UPDATED
+        assert startup_file.read_text(encoding="utf-8") == "# novo template"
+
+
+class TestTestBuilder:
+    """Tests for the tests scaffolding builder."""
+
+    def test_run_creates_tests_and_appends_pytest_config(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text("[project]\n", encoding="utf-8")
+
+        test_builder.TestBuilder(tmp_path).run()
+
+        assert (tmp_path / "tests" / "modules" / "auth" / "test_auth_service.py").exists()
+        assert "def max_queries(" in (tmp_path / "tests" / "conftest.py").read_text(encoding="utf-8")
+        assert (tmp_path / "tests" / "base" / "test_cache.py").exists()
+        pyproject = tomllib.loads((tmp_path / "pyproject.toml").read_text(encoding="utf-8"))
+        assert "aiosqlite>=0.21.0" in pyproject["dependency-groups"]["dev"]
+        assert pyproject["tool"]["pytest"]["ini_options"]["testpaths"] == ["tests"]
+
+    def test_test_dependencies_join_the_generated_dev_group(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text(pyproject_template("demo"), encoding="utf-8")
+
+        test_builder.TestBuilder(tmp_path).run()
+        test_builder.TestBuilder(tmp_path).run()
+
+        pyproject = tomllib.loads((tmp_path / "pyproject.toml").read_text(encoding="utf-8"))
+        dev = pyproject["dependency-groups"]["dev"]
+        assert "aiosqlite>=0.21.0" in dev and len(dev) == len(set(dev)) == 6
+        assert "fastapi>=0.131.0" in pyproject["project"]["dependencies"]
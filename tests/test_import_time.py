@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from typer.testing import CliRunner
+from fast_api_accelerate.main import app
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+IMPORT_BUDGET_US = int(os.getenv("FAST_API_ACCELERATE_IMPORT_BUDGET_US", "400000"))
+LAZY_PACKAGES = ("fast_api_accelerate.builders", "fast_api_accelerate.templates", "fast_api_accelerate.commands.create_project", "fast_api_accelerate.commands.test_config_project")
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """ Executa `python -X importtime` em um processo limpo e devolve {modulo: cumulativo em us}. """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+class TestColdStartImport:
+    """Regression budget for the cold start of the CLI entry point."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.times = import_times("from fast_api_accelerate.main import run")
+
+    def test_builders_and_templates_are_not_imported(self):
+        loaded = [module for module in self.times if module.startswith(LAZY_PACKAGES)]
+        assert loaded == []
+
+    def test_import_cost_is_within_budget(self):
+        assert self.times["fast_api_accelerate.main"] <= IMPORT_BUDGET_US
+
+
+class TestLazyCommands:
+    """Subcommands must still resolve once they are actually invoked."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.runner = CliRunner()
+
+    @pytest.mark.parametrize("command", [["create", "project", "--help"], ["tests", "setup", "--help"]])
+    def test_subcommand_help_loads_lazily(self, command):
+        result = self.runner.invoke(app, command)
+        assert result.exit_code == 0
+        assert "Usage" in result.output
+
+    def test_unknown_command_fails(self):
+        result = self.runner.invoke(app, ["unknown"])
+        assert result.exit_code != 0
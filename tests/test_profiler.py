@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+from fast_api_accelerate.builders.project_builder import ProjectBuilder
+from fast_api_accelerate.utils.file_system import InstallMode
+from fast_api_accelerate.utils.pool import PoolProfile
+from fast_api_accelerate.utils.profiler import BuildProfiler
+
+
+class TestBuildProfiler:
+    """Tests for step timing and attribution."""
+
+    def test_nested_steps_add_files_and_subprocess_time_to_parents(self):
+        profiler = BuildProfiler()
+        with profiler.step("build"):
+            with profiler.step("_create_x"):
+                profiler.add_files(2, 10)
+            with profiler.subprocess("uv sync"):
+                pass
+
+        build, create, sync = profiler.steps
+        assert (build.files, build.bytes, create.files, create.depth) == (2, 10, 2, 1)
+        assert build.subprocess_ns == sync.subprocess_ns > 0
+        assert create.subprocess_ns == 0
+
+    def test_chrome_trace_has_complete_events(self, tmp_path: Path):
+        profiler = BuildProfiler()
+        with profiler.step("build"):
+            pass
+        profiler.write_trace(tmp_path / "trace.json")
+
+        event = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))["traceEvents"][0]
+        assert (event["name"], event["ph"]) == ("build", "X")
+        assert event["dur"] >= 0
+
+
+class TestBuilderProfiling:
+    """Tests for the profiling hooks in BaseBuilder.run."""
+
+    def test_run_records_lifecycle_and_private_create_steps(self, tmp_path: Path):
+        builder = ProjectBuilder(tmp_path, "demo", install_mode=InstallMode.NONE)
+        builder.profiler = BuildProfiler()
+        builder.run()
+
+        steps = {step.name: step for step in builder.profiler.steps}
+        assert {"validate_path", "before_build", "build", "apply", "after_build", "_create_auth_module", "_configure_database"} <= set(steps)
+        assert steps["_create_auth_module"].depth == 1
+        assert steps["apply"].files == builder.report.written
+        assert steps["apply"].bytes == builder.report.bytes_written > 0
+
+    def test_repeated_runs_time_each_step_once(self, tmp_path: Path):
+        builder = ProjectBuilder(tmp_path, "demo", install_mode=InstallMode.NONE)
+        builder.profiler = BuildProfiler()
+        builder.run()
+        builder.pool_profile = PoolProfile.THROUGHPUT
+        builder.profiler = BuildProfiler()
+        builder.run()
+
+        names = [step.name for step in builder.profiler.steps]
+        assert names.count("_create_auth_module") == 1 and names.count("build") == 1
+        assert next(step for step in builder.profiler.steps if step.name == "_create_auth_module").depth == 1
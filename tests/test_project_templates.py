@@ -0,0 +1,243 @@
+import ast
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from fast_api_accelerate.builders.project_builder import ProjectBuilder
+from fast_api_accelerate.utils.file_system import InstallMode
+from fast_api_accelerate.utils.pool import PoolProfile
+from fast_api_accelerate.utils.spec import parse_spec
+
+SPEC = {"entities": [{"name": "post", "fields": {"title": {"type": "str", "index": True}, "published_at": "datetime"}, "relations": [{"name": "user", "target": "user"}]}]}
+
+
+@pytest.fixture(scope="module")
+def project(tmp_path_factory) -> Path:
+    root = tmp_path_factory.mktemp("generated")
+    builder = ProjectBuilder(root, "demo", install_mode=InstallMode.NONE, spec=parse_spec(SPEC))
+    builder.fs.verbose = False
+    builder.run()
+    return root / "demo"
+
+
+def read(project: Path, relative: str) -> str:
+    return (project / relative).read_text(encoding="utf-8")
+
+
+class TestGeneratedProject:
+    """Tests for the code the project templates generate."""
+
+    def test_every_generated_python_file_parses(self, project: Path):
+        for path in project.rglob("*.py"):
+            ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+    def test_list_endpoints_use_keyset_pagination(self, project: Path):
+        controller = read(project, "src/modules/posts/controllers/posts_controller.py")
+        assert "response_model=Page[PostResponse]" in controller
+        assert "le=MAX_PAGE_SIZE" in controller
+        assert "await service.paginate(" in controller
+        assert "async def paginate(" in read(project, "src/base/base_repository.py")
+        assert "def decode_cursor(" in read(project, "src/base/pagination.py")
+
+    def test_base_repository_offers_batched_writes(self, project: Path):
+        repository = read(project, "src/base/base_repository.py")
+        for method in ["bulk_create", "bulk_update", "upsert"]:
+            assert f"async def {method}(" in repository
+            assert f"await self.repository.{method}(" in read(project, "src/base/base_service.py")
+        assert "on_conflict_do_update" in repository
+
+    def test_export_endpoint_streams_from_a_server_side_cursor(self, project: Path):
+        controller = read(project, "src/modules/posts/controllers/posts_controller.py")
+        assert controller.index('"/export"') < controller.index('"/{id}"')
+        assert "stream_response(service.stream(" in controller
+        assert "stream_scalars" in read(project, "src/base/base_repository.py")
+        assert "StreamingResponse" in read(project, "src/base/streaming.py")
+
+    def test_relationships_default_to_raise_and_reads_accept_a_load_spec(self, project: Path):
+        assert 'relationship("UserModel", foreign_keys="PostModel.user_id", lazy="raise")' in read(project, "src/models/post.py")
+        assert "relationship(" not in read(project, "src/models/user.py")
+        repository = read(project, "src/base/base_repository.py")
+        assert "async def get_all(self, load: Optional[LoadSpec] = None)" in repository
+        assert "load_options(self.model, self.default_load if load is None else load)" in repository
+        assert "QueryCountMiddleware" in read(project, "src/core/startup.py")
+
+    def test_services_read_through_the_entity_cache(self, project: Path):
+        service = read(project, "src/base/base_service.py")
+        assert "await self.cache.set_missing(id)" in service
+        assert service.count("await self.invalidate(") == 6
+        assert "class MemoryCache" in read(project, "src/base/cache.py")
+        container = read(project, "src/core/container_ioc.py")
+        assert "PostService(repository, cache=post_cache)" in container
+        assert "AuthService(repository, cache=user_cache, " in container
+        assert "await self.users.find_by_id(int(user_id))" in read(project, "src/modules/auth/services/auth_service.py")
+
+    def test_a_single_engine_is_created_and_disposed(self, project: Path):
+        sources = {str(path.relative_to(project)): path.read_text(encoding="utf-8") for path in project.rglob("*.py")}
+        assert [name for name, source in sources.items() if "create_async_engine(" in source] == ["src/core/database.py"]
+        assert "await database.dispose()" in sources["src/core/startup.py"]
+        assert "database.read_session_factory()" in sources["src/core/container_ioc.py"]
+        assert "DB_POOL_SIZE: int = 10" in sources["src/core/configs.py"]
+        assert "DB_POOL_PRE_PING: bool = True" in sources["src/core/configs.py"]
+
+
+    def test_repository_reads_can_be_routed_to_replicas(self, project: Path):
+        repository = read(project, "src/base/base_repository.py")
+        assert repository.count("await self._read(") == 5
+        assert "await self._read(query, stream=True)" in repository
+        assert "class RoutingSession(Session)" in read(project, "src/base/routing.py")
+        assert "sync_session_class=RoutingSession" in read(project, "src/core/database.py")
+        assert "DB_REPLICA_URLS: List[str] = []" in read(project, "src/core/configs.py")
+
+
+    def test_password_hashing_runs_in_the_hasher_pool(self, project: Path):
+        service = read(project, "src/modules/auth/services/auth_service.py")
+        assert "pwd_context" not in service
+        assert "not await self.verify_password(password, user.password)" in service
+        assert "await self._rehash(user, password)" in service
+        assert "run_in_executor(self.executor" in read(project, "src/modules/auth/utils/passwords.py")
+        assert "hasher=password_hasher" in read(project, "src/core/container_ioc.py")
+        assert "from src.modules.auth.utils.passwords import PasswordHasher" in read(project, "benchmarks/password_hashing.py")
+
+
+    def test_current_user_is_resolved_without_a_database_session(self, project: Path):
+        container = read(project, "src/core/container_ioc.py")
+        dependency = container[container.index("async def get_current_user("):container.index("def role_required(")]
+        assert "Depends(get_token_verifier)" in dependency
+        assert "get_auth_service" not in dependency and "get_db_session" not in dependency
+        assert "tokens=token_verifier" in container
+        assert "async def verify_token(" in read(project, "src/modules/auth/services/auth_service.py")
+        assert "expires - self._clock()" in read(project, "src/modules/auth/utils/tokens.py")
+
+
+    def test_logout_revokes_tokens_and_refresh_skips_the_user_lookup(self, project: Path):
+        service = read(project, "src/modules/auth/services/auth_service.py")
+        assert '"jti": uuid4().hex' in service
+        assert "refresh_claims = dict(access_claims)" in service
+        assert "await self.tokens.revocations.is_revoked(" in service
+        assert "await service.logout(token, refresh_token)" in read(project, "src/modules/auth/controllers/auth_controller.py")
+        assert "class BloomFilter" in read(project, "src/modules/auth/utils/revocation.py")
+        assert "revocations=revocations" in read(project, "src/core/container_ioc.py")
+
+
+    def test_serialization_keeps_the_pydantic_fast_path(self, project: Path):
+        serialization = read(project, "src/base/serialization.py")
+        assert "@lru_cache(maxsize=None)\ndef type_adapter(" in serialization
+        assert "class FastJSONResponse(JSONResponse)" in serialization
+        assert "default_response_class" not in read(project, "main.py")
+        assert '@self.router.get("/me", response_class=FastJSONResponse' in read(project, "src/modules/auth/controllers/auth_controller.py")
+        assert "validate_many(batch, schema)" in read(project, "src/base/streaming.py")
+        assert '"orjson>=' in read(project, "pyproject.toml")
+        assert "from src.base.serialization import FastJSONResponse, dump_json, type_adapter" in read(project, "benchmarks/serialization.py")
+
+
+    def test_startup_uses_a_lifespan_that_warms_up_and_disposes(self, project: Path):
+        startup = read(project, "src/core/startup.py")
+        assert "on_event" not in startup
+        assert "async def lifespan(app: FastAPI)" in startup
+        assert "await database.warm_up(settings.DB_WARMUP_CONNECTIONS)" in startup
+        assert "await database.dispose()" in startup
+        assert "report.summary()" in startup
+        assert "lifespan=lifespan," in read(project, "main.py")
+        assert "async def warm_up(self, connections: int) -> int:" in read(project, "src/core/database.py")
+        assert "DB_WARMUP_CONNECTIONS: int = 10" in read(project, "src/core/configs.py")
+
+
+    def test_uploads_stream_to_sharded_paths_and_are_served_with_etags(self, project: Path):
+        uploads = read(project, "src/base/uploads.py")
+        assert "async with aiofiles.open(temporary, \"wb\") as output:" in uploads
+        assert "digest.update(chunk)" in uploads
+        assert 'return f"{namespace}/{digest[:2]}/{digest[2:4]}/{digest}{extension}"' in uploads
+        assert "class UploadFiles(StaticFiles)" in uploads
+        assert "await storage.save_stream(request.stream()" in read(project, "src/modules/files/controllers/files_controller.py")
+        assert "get_upload_storage" in read(project, "src/core/container_ioc.py")
+        main = read(project, "main.py")
+        assert "app.include_router(files.router)" in main
+        assert 'app.mount("/uploads", UploadFiles(directory=settings.UPLOAD_DIR, check_dir=False), name="uploads")' in main
+
+
+    def test_get_endpoints_get_etags_cache_control_and_compression(self, project: Path):
+        http_cache = read(project, "src/base/http_cache.py")
+        assert "class HttpCacheMiddleware:" in http_cache
+        assert "def weak_etag(body: bytes) -> str:" in http_cache
+        assert "gzip.compress(body, compresslevel=self.gzip_level, mtime=0)" in http_cache
+        assert "app.add_middleware(HttpCacheMiddleware" in read(project, "src/core/startup.py")
+        assert "response_cache = ResponseCache(settings.HTTP_CACHE_MAX_SIZE, max_bytes=settings.HTTP_CACHE_MAX_BYTES" in read(project, "src/core/container_ioc.py")
+        assert "principal=http_cache_principal if settings.HTTP_CACHE_AUTHENTICATED else None" in read(project, "src/core/startup.py")
+        assert "dependencies=[Depends(cache_control(no_store=True))]" in read(project, "src/modules/auth/controllers/auth_controller.py")
+        assert "cached = [Depends(cache_control(max_age=settings.HTTP_CACHE_MAX_AGE))]" in read(project, "src/modules/posts/controllers/posts_controller.py")
+
+    def test_login_and_refresh_are_rate_limited_before_the_password_hash(self, project: Path):
+        rate_limit = read(project, "src/modules/auth/utils/rate_limit.py")
+        assert "class RateLimiter:" in rate_limit
+        assert 'headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))}' in rate_limit
+        assert "pipeline.incrby(" in rate_limit
+        controller = read(project, "src/modules/auth/controllers/auth_controller.py")
+        assert controller.index("await limiter.enforce({\"ip\": client_ip(request), \"account\": credentials.email") < controller.index("await service.login(")
+        assert "await limiter.enforce({\"ip\": client_ip(http_request)" in controller
+        assert "auth_rate_limiter = RateLimiter(" in read(project, "src/core/container_ioc.py")
+        assert 'AUTH_RATE_LIMIT_ACCOUNT: str = "5/minute"' in read(project, "src/core/configs.py")
+        assert 'AUTH_RATE_LIMIT_CLIENT: str = ""' in read(project, "src/core/configs.py")
+
+    def test_metrics_endpoint_instruments_routes_queries_pools_and_the_event_loop(self, project: Path):
+        metrics = read(project, "src/base/metrics.py")
+        assert "class MetricsMiddleware:" in metrics
+        assert 'event.listen(Engine, name, listener)' in metrics
+        assert "def instrument_pool(pool: Any, name: str) -> None:" in metrics
+        assert "class LoopLagMonitor:" in metrics
+        startup = read(project, "src/core/startup.py")
+        assert "app.add_middleware(metrics.MetricsMiddleware)" in startup
+        assert 'metrics.registry.collector("pools", lambda: metrics.pool_metrics(database_pools()))' in startup
+        assert 'app.add_api_route("/metrics", metrics_endpoint(settings.METRICS_TOKEN), methods=["GET"], include_in_schema=False)' in read(project, "main.py")
+        assert "entity_caches[namespace] = EntityCache(" in read(project, "src/core/container_ioc.py")
+
+
+BOOT = """
+import asyncio
+from fastapi import FastAPI
+from src.core import startup
+from src.core.database import Database
+
+async def main():
+    startup.database = Database(url="sqlite+aiosqlite:///app.db", replica_urls=[], options={"pool_size": 1, "max_overflow": 0})
+    async with startup.lifespan(FastAPI()):
+        pass
+
+asyncio.run(main())
+"""
+BOOT_MODULES = ["aiofiles", "aiosqlite", "email_validator", "fastapi", "greenlet", "jose", "multipart", "passlib", "pydantic_settings", "sqlalchemy"]
+
+
+class TestDefaultScaffold:
+    """Boots a project generated without a spec through its lifespan, against a local SQLite database."""
+
+    def test_default_scaffold_starts_through_the_lifespan(self, tmp_path: Path):
+        for module in BOOT_MODULES:
+            pytest.importorskip(module)
+        builder = ProjectBuilder(tmp_path, "demo", install_mode=InstallMode.NONE)
+        builder.fs.verbose = False
+        builder.run()
+        project = tmp_path / "demo"
+        (project / "src/modules/users/repositories/__init__.py").write_text("class UserRepository: pass\n", encoding="utf-8")
+        (project / "src/modules/users/services/__init__.py").write_text("class UserService: pass\n", encoding="utf-8")
+
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(project), str(project / "src")]), "DB_USER": "u", "DB_PASSWORD": "p", "DB_HOST": "localhost", "DB_PORT": "5432", "DB_NAME": "demo"}
+        result = subprocess.run([sys.executable, "-c", BOOT], cwd=project, env=env, capture_output=True, text=True, timeout=120)
+
+        assert result.returncode == 0, result.stderr
+        assert "posts" not in read(project, "src/models/user.py")
+
+
+class TestPoolProfile:
+    """The --pool-profile option only changes the defaults written to core/configs.py."""
+
+    def test_throughput_profile_writes_its_defaults(self, tmp_path: Path):
+        builder = ProjectBuilder(tmp_path, "demo", install_mode=InstallMode.NONE, pool_profile=PoolProfile.THROUGHPUT)
+        builder.fs.verbose = False
+        builder.run()
+        configs = read(tmp_path / "demo", "src/core/configs.py")
+        assert 'perfil "throughput"' in configs
+        assert "DB_POOL_SIZE: int = 20" in configs
+        assert "DB_POOL_PRE_PING: bool = False" in configs
+        assert "DB_STATEMENT_CACHE_SIZE: int = 500" in configs
+        assert "DB_WARMUP_CONNECTIONS: int = 5" in configs
@@ -0,0 +1,99 @@
+import json
+import py_compile
+from pathlib import Path
+import pytest
+from fast_api_accelerate.builders.project_builder import ProjectBuilder
+from fast_api_accelerate.utils.file_system import InstallMode
+from fast_api_accelerate.utils.spec import SpecError, load_spec, parse_spec
+
+SPEC = {
+    "entities": [
+        {"name": "post", "fields": {"title": {"type": "str", "length": 200, "index": True}, "published_at": {"type": "datetime", "nullable": True}},
+         "relations": [{"name": "user", "target": "user", "back_populates": "posts"}], "indexes": [["user_id", "published_at"]]},
+        {"name": "order_item", "fields": {"sku": {"type": "str", "unique": True}}, "relations": [{"name": "post", "target": "post"}]},
+    ]
+}
+
+
+class TestSpecParsing:
+    """Tests for loading and validating entity specs."""
+
+    def test_load_json_spec_applies_naming_defaults(self, tmp_path: Path):
+        path = tmp_path / "app.json"
+        path.write_text(json.dumps(SPEC), encoding="utf-8")
+
+        spec = load_spec(path)
+
+        item = spec.entities[1]
+        assert (item.module, item.table, item.class_name, item.controller_name) == ("order_items", "tb_order_items", "OrderItem", "OrderItemsController")
+        assert spec.table_of("user") == "tb_users"
+
+    @pytest.mark.parametrize("entities, message", [
+        ([{"name": "post", "fields": {"title": "varchar"}}], "unknown type"),
+        ([{"name": "post"}, {"name": "post"}], "more than once"),
+        ([{"name": "post", "relations": [{"name": "tag", "target": "tag"}]}], "unknown entity"),
+        ([{"name": "post", "indexes": [["missing"]]}], "unknown column"),
+        ([{"name": "Post"}], "lowercase"),
+        ([{"name": "post", "relations": [{"name": "user", "target": "user", "lazy": "eager"}]}], "lazy strategy"),
+        ([{"name": "post", "fields": ["title"]}], "fields must be a mapping"),
+        ([{"name": "post", "fields": {"class": "str"}}], "not a valid python identifier"),
+        ([{"name": "post", "relations": [{"name": "my-user", "target": "user"}]}], "not a valid python identifier"),
+        ([{"name": "post", "fields": {"user_id": "int"}, "relations": [{"name": "user", "target": "user"}]}], "more than once"),
+        ([{"name": "post"}, {"name": "tag", "relations": [{"name": "posts", "target": "post", "type": "one_to_many"}]}], "needs a many_to_one"),
+        ([{"name": "post", "relations": [{"name": "tag", "target": "tag"}, {"name": "pinned", "target": "tag"}]},
+          {"name": "tag", "relations": [{"name": "posts", "target": "post", "type": "one_to_many"}]}], "choose one"),
+        ([{"name": "post", "relations": [{"name": "tag", "target": "tag", "back_populates": "items"}]}, {"name": "tag"}], "no one_to_many"),
+        (["post"], "invalid entity"),
+        ([{"name": "post", "fields": {"views": {"type": "int", "length": 10}}}], "length only applies"),
+        ([{"name": "post", "fields": {"title": {"type": "str", "length": 0}}}], "positive integer"),
+        ([{"name": "post", "relations": [{"name": "author", "target": "user", "back_populates": "roles"}]}], "already has"),
+        ([{"name": "post", "relations": [{"name": "author", "target": "user", "back_populates": "posts"}]},
+          {"name": "draft", "relations": [{"name": "author", "target": "user", "back_populates": "posts"}]}], "already has"),
+        ([{"name": "post", "relations": [{"name": "author", "target": "user", "back_populates": "my-posts"}]}], "not a valid python identifier"),
+    ])
+    def test_invalid_specs_are_rejected(self, entities, message):
+        with pytest.raises(SpecError, match=message):
+            parse_spec({"entities": entities})
+
+    @pytest.mark.parametrize("text", ["{\"entities\": [", "[\"post\"]"])
+    def test_malformed_json_raises_spec_error(self, tmp_path: Path, text):
+        path = tmp_path / "app.json"
+        path.write_text(text, encoding="utf-8")
+
+        with pytest.raises(SpecError):
+            load_spec(path)
+
+    def test_malformed_yaml_raises_spec_error(self, tmp_path: Path):
+        pytest.importorskip("yaml")
+        path = tmp_path / "app.yaml"
+        path.write_text("entities: [unclosed", encoding="utf-8")
+
+        with pytest.raises(SpecError, match="invalid YAML"):
+            load_spec(path)
+
+    def test_one_to_many_is_paired_with_its_many_to_one(self):
+        spec = parse_spec({"entities": [
+            {"name": "post", "relations": [{"name": "comments", "target": "comment", "type": "one_to_many"}]},
+            {"name": "comment", "relations": [{"name": "post", "target": "post"}]},
+        ]})
+
+        comments, post = spec.entities[0].relations[0], spec.entities[1].relations[0]
+        assert (comments.back_populates, post.back_populates) == ("post", "comments")
+
+
+class TestSpecGeneration:
+    """Tests for scaffolding the modules declared in a spec."""
+
+    def test_build_generates_wired_and_valid_modules(self, tmp_path: Path):
+        builder = ProjectBuilder(tmp_path, "demo", install_mode=InstallMode.NONE, spec=parse_spec(SPEC))
+        builder.run()
+
+        project = tmp_path / "demo"
+        for path in project.rglob("*.py"):
+            py_compile.compile(str(path), doraise=True)
+        assert (project / "src" / "modules" / "order_items" / "controllers" / "order_items_controller.py").exists()
+        assert "from src.models.order_item import OrderItemModel" in (project / "src" / "models" / "__all_models.py").read_text(encoding="utf-8")
+        assert "def get_post_service" in (project / "src" / "core" / "container_ioc.py").read_text(encoding="utf-8")
+        assert "app.include_router(PostsController().router)" in (project / "main.py").read_text(encoding="utf-8")
+        model = (project / "src" / "models" / "order_item.py").read_text(encoding="utf-8")
+        assert 'relationship("PostModel", foreign_keys="OrderItemModel.post_id", lazy="raise")' in model
@@ -0,0 +1,50 @@
+import os
+from pathlib import Path
+import pytest
+from fast_api_accelerate.utils.template_engine import TemplateEngine
+
+
+class TestTemplateEngineCache:
+    """Tests for the compiled-template cache."""
+
+    def test_render_string_reuses_compiled_template(self):
+        engine = TemplateEngine()
+        assert engine.render_string("hello $name", {"name": "a"}) == "hello a"
+        assert engine.render_string("hello $name", {"name": "b"}) == "hello b"
+        assert (engine.hits, engine.misses) == (1, 1)
+
+    def test_lru_evicts_least_recently_used(self):
+        engine = TemplateEngine(max_size=2)
+        engine.compile_string("a")
+        engine.compile_string("b")
+        engine.compile_string("a")
+        engine.compile_string("c")
+        engine.compile_string("a")
+        engine.compile_string("b")
+        assert engine.misses == 4
+
+    def test_render_file_is_invalidated_when_file_changes(self, tmp_path: Path):
+        engine = TemplateEngine()
+        template = tmp_path / "main.tpl"
+        template.write_text("v1 $name", encoding="utf-8")
+        assert engine.render_file(template, {"name": "x"}) == "v1 x"
+
+        template.write_text("version2 $name", encoding="utf-8")
+        os.utime(template, ns=(0, template.stat().st_mtime_ns + 1))
+        assert engine.render_file(template, {"name": "x"}) == "version2 x"
+
+    def test_render_file_missing_raises(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            TemplateEngine().render_file(tmp_path / "missing.tpl", {})
+
+
+class TestTemplateEngineRenderMany:
+    """Tests for batch rendering."""
+
+    def test_render_many_mixes_strings_and_files(self, tmp_path: Path):
+        template = tmp_path / "readme.tpl"
+        template.write_text("# $name", encoding="utf-8")
+
+        rendered = TemplateEngine().render_many({"name": "demo"}, {"a.py": "app = '$name'", "README.md": template})
+
+        assert rendered == {"a.py": "app = 'demo'", "README.md": "# demo"}
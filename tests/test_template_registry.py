@@ -0,0 +1,38 @@
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+import pytest
+import fast_api_accelerate
+from fast_api_accelerate.templates.registry import TemplateRegistry
+
+PACKAGE_DIR = Path(fast_api_accelerate.__file__).resolve().parent
+
+
+class TestTemplateRegistry:
+    """Tests for the .tpl package-data templates."""
+
+    def test_templates_load_lazily_and_compile_once(self):
+        registry = TemplateRegistry()
+        assert registry.loaded() == []
+        first = registry.get("projects/pyproject")
+        assert registry.get("projects/pyproject") is first
+        assert registry.loaded() == ["projects/pyproject"]
+        assert 'name = "demo"' in registry.render("projects/pyproject", name="demo")
+
+    def test_unknown_template_raises(self):
+        with pytest.raises(FileNotFoundError, match="projects/missing"):
+            TemplateRegistry().get("projects/missing")
+
+    def test_templates_render_from_a_zipped_package(self, tmp_path: Path):
+        archive = tmp_path / "fast_api_accelerate.zip"
+        with zipfile.ZipFile(archive, "w") as bundle:
+            for path in PACKAGE_DIR.rglob("*"):
+                if path.suffix in (".py", ".tpl"):
+                    bundle.write(path, path.relative_to(PACKAGE_DIR.parent).as_posix())
+
+        code = "import fast_api_accelerate; from fast_api_accelerate.templates.projects import main_project_template; print(fast_api_accelerate.__file__); print(main_project_template('zipped'))"
+        result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env={"PYTHONPATH": str(archive)}, capture_output=True, text=True, check=True)
+
+        assert result.stdout.startswith(str(archive))
+        assert 'title="zipped"' in result.stdout